@@ -0,0 +1,70 @@
+"""
+基因编码基准测试脚本
+比较自然二进制与格雷码编码下微生物遗传算法达到目标适应度所需的代数、停止代数与最终适应度
+
+用法: python benchmark_gray_code.py [种子数] [目标比例]
+"""
+import contextlib
+import io
+import logging
+import statistics
+import sys
+from pathlib import Path
+
+# 添加服务目录到 Python 路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_optimizers import CASES
+from src.algorithms import GAConfig, MicrobialGeneticAlgorithm, OptimizationConstraints
+
+ENCODINGS = {"binary": False, "gray": True}
+
+
+def run(gray_code: bool, seed: int, constraints: OptimizationConstraints):
+    """运行一次遗传算法，返回 (优化器, 最优适应度)"""
+    config = GAConfig(seed=seed, gray_code=gray_code, population_size=4096, generations=300)
+    ga = MicrobialGeneticAlgorithm(config, constraints)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, fitness = ga.evolve()
+    return ga, fitness
+
+
+def generations_to_target(ga: MicrobialGeneticAlgorithm, target: float):
+    """最优适应度首次达到目标的代数（未达到时返回 None）"""
+    for generation, best in ga.monitor.best_history:
+        if best >= target:
+            return generation
+    return None
+
+
+def main():
+    """运行基准测试并打印结果表"""
+    logging.disable(logging.WARNING)
+    n_seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    target_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.999
+
+    for case, kwargs in CASES.items():
+        constraints = OptimizationConstraints(**kwargs)
+        runs = {
+            encoding: [run(gray_code, seed, constraints) for seed in range(n_seeds)]
+            for encoding, gray_code in ENCODINGS.items()
+        }
+
+        # 目标：两种编码找到的最优适应度的 target_ratio 倍
+        reference = max(fitness for results in runs.values() for _, fitness in results)
+        target = reference - (1.0 - target_ratio) * abs(reference)
+
+        print(f"\n{case}: 最优适应度 {reference:.6f}，目标 {target:.6f}")
+        print(f"{'编码':<8}{'达标率':>8}{'达标代数(中位数)':>18}{'停止代数(中位数)':>18}{'最优适应度(中位数)':>20}")
+        for encoding, results in runs.items():
+            hits = [generations_to_target(ga, target) for ga, _ in results]
+            hits = [hit for hit in hits if hit is not None]
+            stopped = statistics.median(ga.generations_run for ga, _ in results)
+            best = statistics.median(fitness for _, fitness in results)
+            median_hits = f"{statistics.median(hits):.0f}" if hits else "-"
+            success = f"{len(hits)}/{len(results)}"
+            print(f"{encoding:<8}{success:>8}{median_hits:>18}{stopped:>18.0f}{best:>20.6f}")
+
+
+if __name__ == "__main__":
+    main()
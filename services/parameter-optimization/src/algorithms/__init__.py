@@ -1,10 +1,43 @@
 """算法模块"""
 from .microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
-from .objectives import ObjectiveFunction
+from .island_model import IslandModelGA
+from .genome import GenomeLayout
+from .optimizer import Optimizer, OPTIMIZERS, register_optimizer, create_optimizer
+from .continuous import ContinuousSearch, ContinuousOptimizer
+from .grid_solver import GridRefineSolver, GridConfig
+from .differential_evolution import DifferentialEvolution, DEConfig
+from .cma_es import CMAES, CMAESConfig
+from .archive import SolutionArchive
+from .checkpoint import PopulationCheckpoint
+from .nsga2 import NSGA2, NSGA2Config, non_dominated_sort, crowding_distance
+from .objectives import ObjectiveFunction, OBJECTIVES, register_objective, PARETO_OBJECTIVES
 
 __all__ = [
     "MicrobialGeneticAlgorithm",
     "GAConfig",
     "OptimizationConstraints",
+    "IslandModelGA",
+    "GenomeLayout",
+    "Optimizer",
+    "OPTIMIZERS",
+    "register_optimizer",
+    "create_optimizer",
+    "ContinuousSearch",
+    "ContinuousOptimizer",
+    "GridRefineSolver",
+    "GridConfig",
+    "DifferentialEvolution",
+    "DEConfig",
+    "CMAES",
+    "CMAESConfig",
+    "SolutionArchive",
+    "PopulationCheckpoint",
+    "NSGA2",
+    "NSGA2Config",
+    "non_dominated_sort",
+    "crowding_distance",
     "ObjectiveFunction",
+    "OBJECTIVES",
+    "register_objective",
+    "PARETO_OBJECTIVES",
 ]
\ No newline at end of file
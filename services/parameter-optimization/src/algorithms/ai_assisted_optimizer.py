@@ -168,7 +168,10 @@ class AIAssistedOptimizer:
         review_result = None
         
         if enable_ai_review:
-            self.reviewer = AIReviewer(tool_params, material_props, machine_caps)
+            self.reviewer = AIReviewer(
+                tool_params, material_props, machine_caps,
+                evaluator_plan=self.ga_optimizer.plan
+            )
             review_result = self.reviewer.review_optimization_result(result)
         
         # 7. 检查约束违规
@@ -48,7 +48,8 @@ class AIReviewer:
         self,
         tool_params,
         material_props,
-        machine_caps
+        machine_caps,
+        evaluator_plan=None
     ):
         """
         初始化 AI 审查器
@@ -57,10 +58,12 @@ class AIReviewer:
             tool_params: 刀具参数
             material_props: 材料特性
             machine_caps: 机床能力
+            evaluator_plan: 评估计划（可选，提供时用与优化算法相同的计算核重算物理量）
         """
         self.tool = tool_params
         self.material = material_props
         self.machine = machine_caps
+        self.evaluator_plan = evaluator_plan
         
         # 安全阈值配置
         self.safety_thresholds = {
@@ -86,6 +89,10 @@ class AIReviewer:
         """
         items = []
         
+        # 0. 使用评估计划重算物理量，保证审查与优化使用同一模型
+        if self.evaluator_plan is not None:
+            params = self._recompute_with_plan(params)
+        
         # 1. 刀具强度审查
         items.extend(self._review_tool_strength(params))
         
@@ -441,6 +448,20 @@ class AIReviewer:
         
         return items
     
+    def _recompute_with_plan(self, params: Dict[str, float]) -> Dict[str, float]:
+        """使用评估计划重算功率、扭矩、进给力、刀具寿命等物理量"""
+        physics = self.evaluator_plan.evaluate_parameters(
+            params.get("speed", 0), params.get("feed", 0), params.get("cut_depth", 0)
+        )
+        recomputed = dict(params)
+        for key in (
+            "material_removal_rate", "tool_life", "power", "torque", "feed_force",
+            "feed_per_tooth", "cutting_speed", "bottom_roughness", "side_roughness",
+            "tool_deflection",
+        ):
+            recomputed[key] = float(physics[key][0])
+        return recomputed
+    
     def _calculate_cutting_force(self, params: Dict[str, float]) -> float:
         """计算切削力"""
         # 简化模型
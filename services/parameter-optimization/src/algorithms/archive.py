@@ -0,0 +1,91 @@
+"""
+多样化解存档模块
+在一次优化中保留适应度最高且互不相近的可行解，作为最优解之外的备选参数方案
+（例如转速更低、刀具寿命更长的方案），用户无需为此重新运行优化。
+"""
+from typing import Dict, List
+import numpy as np
+
+from .evaluator import EvaluatorPlan
+from .genome import DecodingBounds
+from .objectives import ArrayObjective, mrr_objective
+
+
+class SolutionArchive:
+    """多样化可行解存档（按适应度降序，任意两解的归一化参数距离不小于 min_distance）"""
+
+    def __init__(self, bounds: DecodingBounds, capacity: int = 5, min_distance: float = 0.05):
+        """
+        初始化存档
+
+        Args:
+            bounds: 参数边界（用于把转速、进给、切深归一化到 [0, 1] 后计算距离）
+            capacity: 最多保留的解数
+            min_distance: 两解视为不同方案的最小归一化欧氏距离
+        """
+        self.capacity = capacity
+        self.min_distance = min_distance
+        self.lower = np.array([bounds.speed[0], bounds.feed[0], bounds.cut_depth[0]], dtype=float)
+        span = np.array([bounds.speed[1], bounds.feed[1], bounds.cut_depth[1]], dtype=float) - self.lower
+        self.span = np.where(span > 0, span, 1.0)
+
+        self.points = np.empty((0, 3))  # 参数 (K, 3)，列为转速、进给、切深
+        self.fitness = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self.fitness)
+
+    def update(self, values: np.ndarray, fitness: np.ndarray, penalty: np.ndarray) -> None:
+        """
+        用一批已评估的解更新存档
+
+        只考虑可行解（约束惩罚为 0），与存档合并后按适应度从高到低贪心选取互不相近的解。
+
+        Args:
+            values: 参数 (N, 3)，列为转速、进给、切深
+            fitness: 适应度 (N,)
+            penalty: 约束惩罚 (N,)
+        """
+        feasible = np.flatnonzero(penalty == 0)
+        if len(feasible) == 0:
+            return
+        # 只有适应度最高的一部分候选可能进入存档
+        n_candidates = 4 * self.capacity
+        if len(feasible) > n_candidates:
+            feasible = feasible[np.argpartition(-fitness[feasible], n_candidates - 1)[:n_candidates]]
+
+        points = np.concatenate([self.points, values[feasible]])
+        scores = np.concatenate([self.fitness, fitness[feasible]])
+        order = np.argsort(-scores, kind="stable")
+        normalized = (points[order] - self.lower) / self.span
+
+        selected: List[int] = []
+        for i in range(len(order)):
+            if selected:
+                distance = np.linalg.norm(normalized[selected] - normalized[i], axis=1)
+                if distance.min() < self.min_distance:
+                    continue
+            selected.append(i)
+            if len(selected) == self.capacity:
+                break
+
+        keep = order[selected]
+        self.points = points[keep]
+        self.fitness = scores[keep]
+
+    def solutions(self, plan: EvaluatorPlan, objective: ArrayObjective = mrr_objective) -> List[Dict[str, float]]:
+        """
+        计算存档中各解的完整加工参数（一次向量化计算）
+
+        Args:
+            plan: 评估计划
+            objective: 向量化目标函数（用于计算 fitness）
+
+        Returns:
+            加工参数字典列表（含 fitness），按适应度降序
+        """
+        if len(self) == 0:
+            return []
+        p = plan.machining_parameters(self.points[:, 0], self.points[:, 1], self.points[:, 2], objective)
+        feasible = np.flatnonzero(p.pop("penalty") == 0)
+        return [{name: float(values[i]) for name, values in p.items()} for i in feasible]
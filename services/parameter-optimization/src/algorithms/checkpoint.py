@@ -0,0 +1,183 @@
+"""
+种群检查点模块
+- 内存映射：种群与适应度保存在磁盘上的 .npy 文件中并以 np.memmap 打开，进化直接在映射文件上原地进行
+- 原子检查点：每个检查点先完整写入临时目录并落盘，再重命名为带代数编号的目录，最后原子替换 LATEST 指针；
+  进程在任意时刻中断都只会留下上一个完整的检查点
+- 离线分析：检查点中的数组为标准 .npy 文件，可用 np.load(..., mmap_mode="r") 打开而无需复制
+
+目录结构：
+    <directory>/live/*.npy            运行中映射的种群与适应度
+    <directory>/gen-000120/*.npy      检查点数组（种群、适应度、脏标记等）
+    <directory>/gen-000120/state.json 检查点状态（代数、随机数状态、配置等）
+    <directory>/LATEST                最近一个完整检查点的目录名
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+
+PathLike = Union[str, Path]
+
+
+def _fsync_directory(directory: Path) -> None:
+    """将目录项（新建、重命名的文件）落盘（不支持的平台上忽略）"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class PopulationCheckpoint:
+    """种群检查点目录（内存映射的运行中数组 + 原子写入的检查点）"""
+
+    LATEST = "LATEST"
+    STATE = "state.json"
+    LIVE = "live"
+
+    def __init__(self, directory: PathLike, keep: int = 2):
+        """
+        初始化检查点目录（不存在时创建）
+
+        Args:
+            directory: 检查点目录
+            keep: 保留的检查点个数（写入新检查点后删除更早的）
+        """
+        self.directory = Path(directory)
+        self.keep = max(1, keep)
+        (self.directory / self.LIVE).mkdir(parents=True, exist_ok=True)
+
+    def map_array(self, name: str, array: np.ndarray) -> np.memmap:
+        """
+        将数组复制到运行中的内存映射文件并返回映射
+
+        先写入临时文件再重命名：替换同名数组（如种群增长后）时，仍在使用的旧映射不受影响。
+
+        Args:
+            name: 数组名称（文件名为 <name>.npy）
+            array: 初始内容
+
+        Returns:
+            可读写的内存映射数组
+        """
+        path = self.directory / self.LIVE / f"{name}.npy"
+        tmp_path = path.with_name(f".{name}.npy.tmp")
+        mapped = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=array.dtype, shape=array.shape)
+        mapped[...] = array
+        os.replace(tmp_path, path)
+        return mapped
+
+    def save(self, generation: int, arrays: Dict[str, np.ndarray], state: Dict[str, Any]) -> Path:
+        """
+        原子写入检查点
+
+        Args:
+            generation: 已完成的代数（决定检查点目录名）
+            arrays: 数组字典（名称 → 数组）
+            state: 可 JSON 序列化的状态字典
+
+        Returns:
+            检查点目录
+        """
+        name = f"gen-{generation:06d}"
+        target = self.directory / name
+        tmp = self.directory / f".{name}.tmp"
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        tmp.mkdir()
+
+        for key, array in arrays.items():
+            with open(tmp / f"{key}.npy", "wb") as f:
+                np.save(f, np.asarray(array))
+                f.flush()
+                os.fsync(f.fileno())
+        with open(tmp / self.STATE, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_directory(tmp)
+
+        stale = None
+        if target.exists():
+            # 从较早的检查点恢复后重跑到同一代：旧目录先移开（中断时 resolve 回退到其余完整检查点）
+            stale = self.directory / f".{name}.stale"
+            if stale.exists():
+                shutil.rmtree(stale)
+            os.replace(target, stale)
+        os.replace(tmp, target)
+        if stale is not None:
+            shutil.rmtree(stale, ignore_errors=True)
+
+        pointer = self.directory / self.LATEST
+        tmp_pointer = self.directory / f".{self.LATEST}.tmp"
+        with open(tmp_pointer, "w", encoding="utf-8") as f:
+            f.write(name)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_pointer, pointer)
+        _fsync_directory(self.directory)
+
+        self._prune(name)
+        return target
+
+    def _prune(self, latest: str) -> None:
+        """删除超出保留个数的较早检查点，以及从较早检查点恢复后被放弃的较晚检查点"""
+        snapshots = sorted(p.name for p in self.directory.glob("gen-*") if p.is_dir())
+        abandoned = [name for name in snapshots if name > latest]
+        history = [name for name in snapshots if name <= latest]
+        for name in abandoned + history[:-self.keep]:
+            shutil.rmtree(self.directory / name, ignore_errors=True)
+
+    @classmethod
+    def resolve(cls, path: PathLike) -> Path:
+        """
+        定位检查点目录
+
+        Args:
+            path: 检查点根目录（读取 LATEST 指针）或某个检查点目录
+
+        Returns:
+            检查点目录
+        """
+        path = Path(path)
+        if (path / cls.STATE).exists():
+            return path
+        pointer = path / cls.LATEST
+        if pointer.exists():
+            snapshot = path / pointer.read_text(encoding="utf-8").strip()
+            if (snapshot / cls.STATE).exists():
+                return snapshot
+        # 指针缺失或指向的目录不完整时，取代数最大的完整检查点
+        snapshots = sorted(p for p in path.glob("gen-*") if (p / cls.STATE).exists())
+        if not snapshots:
+            raise FileNotFoundError(f"未找到检查点: {path}")
+        return snapshots[-1]
+
+    @classmethod
+    def load(
+        cls,
+        path: PathLike,
+        mmap_mode: Optional[str] = "r"
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        读取检查点
+
+        Args:
+            path: 检查点根目录或某个检查点目录
+            mmap_mode: 数组打开方式（默认只读内存映射，不复制数据；None 表示读入内存）
+
+        Returns:
+            (数组字典, 状态字典)
+        """
+        snapshot = cls.resolve(path)
+        with open(snapshot / cls.STATE, encoding="utf-8") as f:
+            state = json.load(f)
+        arrays = {p.stem: np.load(p, mmap_mode=mmap_mode) for p in snapshot.glob("*.npy")}
+        return arrays, state
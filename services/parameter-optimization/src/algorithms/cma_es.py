@@ -0,0 +1,150 @@
+"""
+协方差矩阵自适应进化策略（CMA-ES）
+(μ/μ_w, λ)-CMA-ES，秩一与秩 μ 协方差更新、累积步长控制；
+搜索分布收敛后以加倍的种群重启（IPOP），在预算内跳出局部最优。
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+import numpy as np
+
+from .microbial_ga import GAConfig, OptimizationConstraints
+from .continuous import ContinuousOptimizer
+from .optimizer import register_optimizer
+
+
+@dataclass
+class CMAESConfig:
+    """CMA-ES 配置"""
+    population_size: int = 16   # 初始每代采样数 λ（每次重启加倍）
+    sigma0: float = 0.3         # 初始步长（单位坐标）
+    tolerance: float = 1e-9     # 步长 × 最大主轴长度低于该值时判定分布收敛
+    max_restarts: int = 4       # 最大重启次数
+
+
+@register_optimizer("cmaes")
+class CMAES(ContinuousOptimizer):
+    """CMA-ES 优化器"""
+
+    DIMENSION = 3
+
+    def __init__(
+        self,
+        config: GAConfig,
+        constraints: OptimizationConstraints,
+        cmaes_config: Optional[CMAESConfig] = None
+    ):
+        """
+        初始化优化器
+
+        Args:
+            config: 算法配置（使用其中的参数边界、代数、早停、随机种子与运行预算）
+            constraints: 约束条件
+            cmaes_config: CMA-ES 配置
+        """
+        super().__init__(config, constraints)
+        self.cmaes_config = cmaes_config or CMAESConfig()
+        if self.cmaes_config.population_size < 4:
+            raise ValueError("CMA-ES 的每代采样数至少为 4")
+        self.restarts = 0
+        self.exhausted = False
+
+    def _reset(self, population_size: int, mean: np.ndarray) -> None:
+        """
+        按给定采样数与初始均值重置搜索分布及策略参数
+
+        Args:
+            population_size: 每代采样数 λ
+            mean: 初始均值（单位坐标）
+        """
+        n = self.DIMENSION
+        self.lam = population_size
+        self.mu = population_size // 2
+        weights = math.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1.0 / float(np.sum(self.weights ** 2))
+
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0.0, math.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.mean = mean
+        self.sigma = self.cmaes_config.sigma0
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.B = np.eye(n)
+        self.D = np.ones(n)
+        self.C = np.eye(n)
+        self.iteration = 0
+
+    def _generation_size(self) -> int:
+        """每代评估 λ 个采样点"""
+        return self.lam
+
+    def _initialize(self) -> None:
+        """以均匀随机均值初始化搜索分布"""
+        self._reset(self.cmaes_config.population_size, self.rng.random(self.DIMENSION))
+
+    def _step(self) -> None:
+        """一代：采样、评估、更新均值、进化路径、协方差与步长；分布收敛时重启"""
+        n = self.DIMENSION
+        z = self.rng.standard_normal((self.lam, n))
+        y = z @ (self.B * self.D).T
+        x = self.mean + self.sigma * y
+
+        # 在边界内的投影点上评估；排序先按适应度、再按越界距离（越界越远越差）
+        projected = np.clip(x, 0.0, 1.0)
+        fitness = self._evaluate(projected)
+        distance = np.sum((x - projected) ** 2, axis=1)
+        order = np.lexsort((distance, -fitness))[:self.mu]
+
+        old_mean = self.mean
+        self.mean = self.weights @ x[order]
+        y_w = (self.mean - old_mean) / self.sigma
+
+        # 进化路径（C^(-1/2) 由特征分解得到）
+        inv_sqrt_c = self.B @ np.diag(1.0 / self.D) @ self.B.T
+        self.ps = (1 - self.cs) * self.ps + math.sqrt(self.cs * (2 - self.cs) * self.mueff) * (inv_sqrt_c @ y_w)
+        self.iteration += 1
+        ps_norm = float(np.linalg.norm(self.ps))
+        hsig = ps_norm / math.sqrt(1 - (1 - self.cs) ** (2 * self.iteration)) / self.chi_n < 1.4 + 2 / (n + 1)
+        self.pc = (1 - self.cc) * self.pc + hsig * math.sqrt(self.cc * (2 - self.cc) * self.mueff) * y_w
+
+        # 秩一与秩 μ 协方差更新
+        steps = (x[order] - old_mean) / self.sigma
+        self.C = (
+            (1 - self.c1 - self.cmu) * self.C
+            + self.c1 * (np.outer(self.pc, self.pc) + (1 - hsig) * self.cc * (2 - self.cc) * self.C)
+            + self.cmu * (steps.T * self.weights) @ steps
+        )
+        self.sigma *= math.exp((self.cs / self.damps) * (ps_norm / self.chi_n - 1))
+
+        self.C = np.triu(self.C) + np.triu(self.C, 1).T
+        eigenvalues, self.B = np.linalg.eigh(self.C)
+        self.D = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        # 分布收敛或病态时以加倍的采样数从新的随机均值重启
+        if self.sigma * self.D.max() < self.cmaes_config.tolerance or self.D.max() > 1e7 * self.D.min():
+            if self.restarts >= self.cmaes_config.max_restarts:
+                self.exhausted = True
+                return
+            self.restarts += 1
+            self._reset(2 * self.lam, self.rng.random(n))
+
+    def _converged(self) -> bool:
+        """重启次数用尽且最后一次搜索分布已收敛"""
+        return self.exhausted
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（在基类统计之外包含重启次数）
+        """
+        stats = super().get_statistics()
+        stats["restarts"] = self.restarts
+        return stats
@@ -0,0 +1,248 @@
+"""
+连续参数优化器基类
+直接在连续的 (转速, 进给, 切深) 上搜索，不受二进制基因分辨率限制，
+与遗传算法共用评估计划（物理模型与约束惩罚）和最终加工参数计算。
+搜索坐标为单位立方体 [0, 1]^3，映射到解析可行盒上（见 _to_values）。
+ContinuousSearch 提供映射、评估与结果计算；ContinuousOptimizer 在其上实现按代迭代的 evolve()。
+"""
+import time
+from abc import abstractmethod
+from typing import Dict, Any, List, Tuple, Optional
+import numpy as np
+
+from .microbial_ga import GAConfig, OptimizationConstraints, decoding_bounds
+from .archive import SolutionArchive
+from .evaluator import get_evaluator_plan
+from .machining import calculate_machining_parameters
+from .objectives import get_array_objective
+from .optimizer import Optimizer
+
+# 搜索坐标轴顺序
+PARAMETERS = ("speed", "feed", "cut_depth")
+
+
+class ContinuousSearch(Optimizer):
+    """
+    连续参数搜索基类
+
+    提供单位坐标映射、批量评估（含最优解与备选方案存档更新）与结果计算，子类实现 evolve()。
+    """
+
+    def __init__(self, config: GAConfig, constraints: OptimizationConstraints):
+        """
+        初始化优化器
+
+        Args:
+            config: 算法配置（使用其中的参数边界、对数刻度、代数、早停、随机种子与运行预算）
+            constraints: 约束条件
+        """
+        self.config = config
+        self.constraints = constraints
+        self.rng = np.random.default_rng(config.seed)
+
+        # 与遗传算法共用解码边界、评估计划（按约束值与边界缓存）、目标函数与最终加工参数计算
+        self.bounds = decoding_bounds(config, constraints)
+        self.plan = get_evaluator_plan(constraints, self.bounds)
+        self.objective_func = get_array_objective(config.objective)
+        self.archive = (
+            SolutionArchive(self.bounds, config.n_alternatives, config.alternative_min_distance)
+            if config.n_alternatives > 0 else None
+        )
+
+        self.best_point = None
+        self.best_fitness = float('-inf')
+        self.evaluation_count = 0
+        self.feasible_count = 0
+        self.generations_run = 0
+        self.elapsed_s = 0.0
+        self.stop_reason = None
+        self.history: List[Tuple[int, float]] = []  # (评估次数, 最优适应度)，每次最优解改进时记录
+
+    def _to_values(self, units: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        将单位立方体坐标映射为参数取值
+
+        搜索空间建立在解析可行盒上（与约束修复一致）：转速上限取线速度约束对应的转速，
+        进给轴按每齿进给上限对应的进给 fz_max·z·n 缩放，使狭窄的可行带有足够的分辨率。
+        切深轴按平方刻度取值：进给力与挠度约束通常把最优切深限制在切深上限的很小一部分。
+
+        Args:
+            units: 单位坐标 (N, 3)，各轴取值范围 [0, 1]
+
+        Returns:
+            (转速, 进给, 切深)
+        """
+        c = self.constraints
+        log_scale = self.bounds.log_scale
+
+        def scale(t: np.ndarray, lo: float, hi, log: bool) -> np.ndarray:
+            return lo * (hi / lo) ** t if log else lo + t * (hi - lo)
+
+        # 转速为 0 时没有切削（加工参数计算也无定义），从 1 r/min 起
+        speed_lo, speed_hi = self.bounds.speed
+        speed_lo = max(speed_lo, 1.0)
+        speed_hi = max(speed_lo, min(speed_hi, (c.max_cutting_speed - 0.1) * 318.0 / c.tool_diameter))
+        speed = scale(units[:, 0], speed_lo, speed_hi, log_scale)
+
+        feed_lo, feed_hi = self.bounds.feed
+        feed_hi = np.clip(c.max_feed_per_tooth * c.tool_teeth * speed, feed_lo, feed_hi)
+        feed = scale(units[:, 1], feed_lo, feed_hi, log_scale)
+
+        cut_lo, cut_hi = self.bounds.cut_depth
+        cut_depth = scale(units[:, 2] ** 2, cut_lo, cut_hi, False)
+        return speed, feed, cut_depth
+
+    def _evaluate(self, units: np.ndarray) -> np.ndarray:
+        """
+        评估一批单位坐标，并更新评估次数与最优解
+
+        Args:
+            units: 单位坐标 (N, 3)
+
+        Returns:
+            适应度 (N,)
+        """
+        return self._evaluate_parameters(units)["fitness"]
+
+    def _evaluate_parameters(self, units: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        评估一批单位坐标并返回完整评估结果，同时更新评估次数与最优解
+
+        Args:
+            units: 单位坐标 (N, 3)
+
+        Returns:
+            评估结果数组字典（加工参数、fitness 与 penalty）
+        """
+        values = self._to_values(units)
+        p = self.plan.evaluate_parameters(*values, self.objective_func)
+        fitness = p["fitness"]
+        if self.archive is not None:
+            self.archive.update(np.stack(values, axis=1), fitness, p["penalty"])
+        self.evaluation_count += len(units)
+        self.feasible_count += int(np.count_nonzero(p["penalty"] == 0))
+
+        best_idx = int(np.argmax(fitness))
+        if fitness[best_idx] > self.best_fitness:
+            self.best_fitness = float(fitness[best_idx])
+            self.best_point = units[best_idx].copy()
+            self.history.append((self.evaluation_count, self.best_fitness))
+        return p
+
+    def _best_machining_parameters(self) -> Dict[str, float]:
+        """由最优单位坐标计算完整加工参数"""
+        speed, feed, cut_depth = (float(v[0]) for v in self._to_values(self.best_point[np.newaxis]))
+        best_params = {"speed": speed, "feed": feed, "cut_depth": cut_depth}
+        return calculate_machining_parameters(best_params, self.constraints)
+
+    def get_alternatives(self) -> List[Dict[str, float]]:
+        """
+        获取备选方案（每次评估时更新存档）
+
+        Returns:
+            互不相近的可行解的加工参数列表（含 fitness），按适应度降序
+        """
+        return self.archive.solutions(self.plan, self.objective_func) if self.archive is not None else []
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（停止原因、代数、评估次数、可行解数）
+        """
+        return {
+            "stop_reason": self.stop_reason,
+            "generations": self.generations_run,
+            "evaluations": self.evaluation_count,
+            "feasible_points": self.feasible_count,
+            "elapsed_s": round(self.elapsed_s, 4),
+        }
+
+
+class ContinuousOptimizer(ContinuousSearch):
+    """
+    按代迭代的连续参数优化器基类
+
+    子类实现 _initialize()（初始评估）、_step()（一代）与 _generation_size()，可选实现 _converged()；
+    evolve() 负责预算检查、停滞早停与结果计算。
+    """
+
+    @abstractmethod
+    def _initialize(self) -> None:
+        """初始化并评估初始解"""
+
+    @abstractmethod
+    def _step(self) -> None:
+        """执行一代"""
+
+    @abstractmethod
+    def _generation_size(self) -> int:
+        """每代的评估次数（用于评估预算检查）"""
+
+    def _converged(self) -> bool:
+        """搜索分布是否已收敛（子类可选实现）"""
+        return False
+
+    def _improved(self, previous_best: float) -> bool:
+        """本代是否有改进（用于停滞早停，默认比较最优适应度）"""
+        return self.best_fitness > previous_best
+
+    def evolve(
+        self,
+        iterations_per_generation: int = 384,
+        deadline_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        执行优化
+
+        Args:
+            iterations_per_generation: 保留兼容（未使用）
+            deadline_s: 墙钟时间上限（秒），默认取 config.deadline_s
+            max_evaluations: 物理模型评估次数上限，默认取 config.max_evaluations
+
+        Returns:
+            (最优参数, 最优适应度)
+        """
+        if deadline_s is None:
+            deadline_s = self.config.deadline_s
+        if max_evaluations is None:
+            max_evaluations = self.config.max_evaluations
+        start_time = time.perf_counter()
+
+        self._initialize()
+        slowest_generation = 0.0
+        stagnant_generations = 0
+        self.stop_reason = "generations"
+        for generation in range(self.config.generations):
+            # 预算检查：下一代预计超时或评估次数将超出上限时停止
+            if deadline_s is not None and time.perf_counter() - start_time + slowest_generation > deadline_s:
+                self.stop_reason = "deadline"
+                break
+            if max_evaluations is not None and self.evaluation_count + self._generation_size() > max_evaluations:
+                self.stop_reason = "max_evaluations"
+                break
+
+            generation_start = time.perf_counter()
+            previous_best = self.best_fitness
+            self._step()
+            self.generations_run = generation + 1
+            slowest_generation = max(slowest_generation, time.perf_counter() - generation_start)
+
+            if generation % 10 == 0:
+                print(f"Generation {generation}: Best fitness = {self.best_fitness:.6f}, "
+                      f"Evaluations = {self.evaluation_count}")
+
+            stagnant_generations = 0 if self._improved(previous_best) else stagnant_generations + 1
+            if self._converged():
+                self.stop_reason = "converged"
+                break
+            if stagnant_generations >= self.config.early_stop_generations:
+                self.stop_reason = "early_stop"
+                break
+
+        self.elapsed_s = time.perf_counter() - start_time
+        print(f"Stop at generation {self.generations_run} ({self.stop_reason}): "
+              f"Best fitness = {self.best_fitness:.6f}, {self.evaluation_count} evaluations, {self.elapsed_s:.3f}s")
+        return self._best_machining_parameters(), self.best_fitness
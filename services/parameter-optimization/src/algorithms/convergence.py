@@ -0,0 +1,177 @@
+"""
+收敛监测模块
+跟踪种群多样性（平均汉明距离、各参数基因熵）、适应度分位数与改进速率，
+在种群真正坍缩、继续进化只是浪费计算时判定收敛。
+"""
+import math
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from ..config.constants import DNAEncoding
+from .genome import is_packed, unpack_population
+
+
+@dataclass
+class ConvergenceSnapshot:
+    """单代收敛指标"""
+    generation: int
+    hamming_distance: float  # 平均两两汉明距离 / DNA 长度，范围 [0, 0.5]
+    gene_entropy: Dict[str, float] = field(default_factory=dict)  # 各参数平均位熵，范围 [0, 1]
+    fitness_percentiles: Dict[str, float] = field(default_factory=dict)
+    improvement_rate: float = float('inf')  # 最近窗口内最优适应度的相对改进
+    elite_spread: float = float('inf')      # 精英层（p90 ~ p99）适应度的相对离散度
+
+    def to_dict(self) -> Dict[str, object]:
+        """转换为字典（用于统计输出，非有限值转换为 None 以便 JSON 序列化）"""
+        data = asdict(self)
+        for key in ("improvement_rate", "elite_spread"):
+            if not math.isfinite(data[key]):
+                data[key] = None
+        return data
+
+
+class ConvergenceMonitor:
+    """
+    收敛监测器
+
+    收敛判据：最近 window 代最优适应度的相对改进低于 improvement_tol，
+    且种群多样性坍缩（平均汉明距离低于 min_diversity）或精英层适应度趋同（离散度低于 elite_spread_tol）。
+    最优适应度连续 patience 代无改进时同样停止（兜底）。
+    """
+
+    PERCENTILES = (10, 50, 90, 99)
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_diversity: float = 0.05,
+        elite_spread_tol: float = 1e-3,
+        improvement_tol: float = 1e-4,
+        patience: int = 50,
+        stagnation_threshold: float = 1e-6,
+        bit_ranges: Optional[Dict[str, Tuple[int, int]]] = None
+    ):
+        """
+        初始化收敛监测器
+
+        Args:
+            window: 改进速率的统计窗口（代）
+            min_diversity: 判定多样性坍缩的平均汉明距离阈值
+            elite_spread_tol: 判定精英层趋同的相对离散度阈值
+            improvement_tol: 判定停滞的窗口内相对改进阈值
+            patience: 最优适应度无改进的最大代数
+            stagnation_threshold: 视为无改进的最优适应度变化量
+            bit_ranges: 各参数在 DNA 中的位范围
+        """
+        self.window = window
+        self.min_diversity = min_diversity
+        self.elite_spread_tol = elite_spread_tol
+        self.improvement_tol = improvement_tol
+        self.patience = patience
+        self.stagnation_threshold = stagnation_threshold
+        self.bit_ranges = bit_ranges or DNAEncoding.get_bit_ranges()
+        self.dna_size = max(end for _, end in self.bit_ranges.values())
+
+        self.generation = 0
+        self.stagnant_generations = 0
+        self.best_history: List[Tuple[int, float]] = []
+        self.history: List[ConvergenceSnapshot] = []
+
+    @property
+    def latest(self) -> Optional[ConvergenceSnapshot]:
+        """最近一次的收敛指标"""
+        return self.history[-1] if self.history else None
+
+    def update(
+        self,
+        population: np.ndarray,
+        fitness: np.ndarray,
+        best_fitness: float,
+        generations: int = 1
+    ) -> ConvergenceSnapshot:
+        """
+        记录一次种群状态
+
+        Args:
+            population: 种群位矩阵或打包种群
+            fitness: 种群适应度
+            best_fitness: 迄今最优适应度
+            generations: 距上次记录经过的代数
+
+        Returns:
+            本次收敛指标
+        """
+        # 停滞计数
+        if self.best_history and abs(best_fitness - self.best_history[-1][1]) < self.stagnation_threshold:
+            self.stagnant_generations += generations
+        else:
+            self.stagnant_generations = 0
+        self.generation += generations
+        self.best_history.append((self.generation, best_fitness))
+
+        # 位频率：平均两两汉明距离 = Σ 2p(1-p)，位熵 = H(p)
+        bits = unpack_population(population, self.dna_size) if is_packed(population) else population
+        p = bits.sum(axis=0, dtype=np.int64) / len(bits)
+        hamming = float(np.mean(2.0 * p * (1.0 - p)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bit_entropy = -np.nan_to_num(p * np.log2(p)) - np.nan_to_num((1.0 - p) * np.log2(1.0 - p))
+        gene_entropy = {
+            name: round(float(bit_entropy[start:end].mean()), 4)
+            for name, (start, end) in self.bit_ranges.items()
+        }
+
+        # 适应度分位数与精英层离散度
+        values = np.percentile(fitness, self.PERCENTILES)
+        percentiles = {f"p{q}": float(v) for q, v in zip(self.PERCENTILES, values)}
+        p90, p99 = values[-2], values[-1]
+        elite_spread = float((p99 - p90) / max(abs(p99), 1e-12))
+
+        # 最近窗口内的相对改进
+        improvement_rate = float('inf')
+        start = self._window_start()
+        if start is not None:
+            improvement_rate = (best_fitness - start) / max(abs(start), 1e-12)
+
+        snapshot = ConvergenceSnapshot(
+            generation=self.generation,
+            hamming_distance=hamming,
+            gene_entropy=gene_entropy,
+            fitness_percentiles=percentiles,
+            improvement_rate=improvement_rate,
+            elite_spread=elite_spread,
+        )
+        self.history.append(snapshot)
+        return snapshot
+
+    def _window_start(self) -> Optional[float]:
+        """窗口起点的最优适应度（记录不足一个窗口时返回 None）"""
+        target = self.generation - self.window
+        if target < 0:
+            return None
+        for generation, best in reversed(self.best_history):
+            if generation <= target:
+                return best
+        return None
+
+    def should_stop(self) -> Optional[str]:
+        """
+        判断是否应停止进化
+
+        Returns:
+            停止原因（converged / early_stop），无需停止时返回 None
+        """
+        snapshot = self.latest
+        if snapshot is None:
+            return None
+
+        stalled = snapshot.improvement_rate < self.improvement_tol
+        collapsed = (
+            snapshot.hamming_distance < self.min_diversity
+            or snapshot.elite_spread < self.elite_spread_tol
+        )
+        if stalled and collapsed:
+            return "converged"
+        if self.stagnant_generations >= self.patience:
+            return "early_stop"
+        return None
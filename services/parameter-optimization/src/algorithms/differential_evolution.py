@@ -0,0 +1,93 @@
+"""
+差分进化（Differential Evolution）
+DE/current-to-best/1/bin：整代变异、交叉与贪婪选择全部向量化，在连续参数上搜索。
+"""
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+from .microbial_ga import GAConfig, OptimizationConstraints
+from .continuous import ContinuousOptimizer
+from .optimizer import register_optimizer
+
+
+@dataclass
+class DEConfig:
+    """差分进化配置"""
+    population_size: int = 32        # 种群大小
+    differential_weight: float = 0.6  # 差分权重 F
+    crossover_rate: float = 0.9      # 交叉概率 CR
+    tolerance: float = 1e-7          # 种群各轴跨度（单位坐标）低于该值时判定收敛
+
+
+@register_optimizer("de")
+class DifferentialEvolution(ContinuousOptimizer):
+    """差分进化优化器"""
+
+    def __init__(
+        self,
+        config: GAConfig,
+        constraints: OptimizationConstraints,
+        de_config: Optional[DEConfig] = None
+    ):
+        """
+        初始化优化器
+
+        Args:
+            config: 算法配置（使用其中的参数边界、代数、早停、随机种子与运行预算）
+            constraints: 约束条件
+            de_config: 差分进化配置
+        """
+        super().__init__(config, constraints)
+        self.de_config = de_config or DEConfig()
+        if self.de_config.population_size < 4:
+            raise ValueError("差分进化的种群大小至少为 4")
+        self.population = None
+        self.fitness = None
+
+    def _generation_size(self) -> int:
+        """每代评估整个种群"""
+        return self.de_config.population_size
+
+    def _initialize(self) -> None:
+        """拉丁超立方初始化种群（各轴分层抽样，覆盖更均匀）"""
+        size = self.de_config.population_size
+        strata = np.stack([self.rng.permutation(size) for _ in range(3)], axis=1)
+        self.population = (strata + self.rng.random((size, 3))) / size
+        self.fitness = self._evaluate(self.population)
+
+    def _step(self) -> None:
+        """一代：current-to-best/1 变异、二项式交叉、越界回弹、贪婪选择"""
+        de = self.de_config
+        size = len(self.population)
+        rows = np.arange(size)
+
+        # 为每个个体抽取两个互不相同且不同于自身的个体
+        others = self.rng.permuted(np.tile(np.arange(size - 1), (size, 1)), axis=1)[:, :2]
+        others += others >= rows[:, np.newaxis]
+        r1, r2 = others[:, 0], others[:, 1]
+
+        best = self.population[np.argmax(self.fitness)]
+        mutant = (
+            self.population
+            + de.differential_weight * (best - self.population)
+            + de.differential_weight * (self.population[r1] - self.population[r2])
+        )
+
+        # 二项式交叉（每个个体至少继承一维变异分量）
+        cross = self.rng.random((size, 3)) < de.crossover_rate
+        cross[rows, self.rng.integers(0, 3, size)] = True
+        trial = np.where(cross, mutant, self.population)
+
+        # 越界分量回弹到父代与边界之间
+        trial = np.where(trial < 0.0, self.population / 2, trial)
+        trial = np.where(trial > 1.0, (self.population + 1.0) / 2, trial)
+
+        trial_fitness = self._evaluate(trial)
+        better = trial_fitness >= self.fitness
+        self.population[better] = trial[better]
+        self.fitness[better] = trial_fitness[better]
+
+    def _converged(self) -> bool:
+        """种群坍缩到一点时收敛"""
+        return float(np.ptp(self.population, axis=0).max()) < self.de_config.tolerance
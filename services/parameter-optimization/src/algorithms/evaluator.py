@@ -0,0 +1,755 @@
+"""
+适应度评估模块
+- 基因查找表：每次运行只解码一次各基因的全部取值，并预计算只依赖单个变量的物理项
+- 评估计划：按约束条件编译一次的评估器，固化标量常数与加工方法对应的计算核
+- 分阶段评估：先检查只依赖 n、f 的廉价约束，只对通过的个体运行完整计算核
+- 分块评估：超大种群按缓存大小的块在线程池中评估，结果写入预分配的适应度数组，峰值内存与种群大小无关
+- 适应度缓存：按位打包基因组记忆适应度，批内去重，LRU 淘汰
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, astuple
+from typing import Dict, Optional, Tuple
+import logging
+import math
+import threading
+import numpy as np
+
+from ..config.constants import (
+    ConstraintPenalty,
+    PhysicalConstants,
+    MachiningMethod
+)
+from .genome import DecodingBounds, decode_genes, is_packed, pack_population, scale_genes
+from .objectives import ArrayObjective, mrr_objective
+
+logger = logging.getLogger(__name__)
+
+# 分块评估的默认块大小：计算核每个个体约 28 个 float64 临时量，32768 个个体约 7 MB，可留在 L3 缓存中
+EVALUATION_CHUNK_SIZE = 1 << 15
+
+
+@dataclass
+class GeneTables:
+    """基因查找表（按基因整数值索引）"""
+    # 转速基因
+    speed: np.ndarray               # 转速 n (r/min)，已下限截断
+    cutting_speed: np.ndarray       # 线速度 vc (m/min)
+    speed_life_factor: np.ndarray   # 刀具寿命转速项 max(vc, 0.001) ** speed_coefficient
+    teeth_speed: np.ndarray         # 齿数 × 转速 z·n，fz = f / (z·n)
+    teeth_speed_life: np.ndarray    # (z·n) ** -feed_coefficient
+    teeth_speed_slope: np.ndarray   # (z·n) ** -material_slope
+
+    # 进给基因
+    feed: np.ndarray                # 进给 f (mm/min)，已下限截断
+    feed_life: np.ndarray           # f ** feed_coefficient
+    feed_slope: np.ndarray          # f ** material_slope
+    chip_area_rate: np.ndarray      # 钻孔/镗孔材料去除率 q = f × 切屑面积 / 4000
+
+    # 切深基因
+    cut_depth: np.ndarray           # 切深 ap (mm)
+
+    # 每齿进给下限（避免 0 的负幂次方）的幂
+    min_fz_life: float
+    min_fz_slope: float
+
+    MIN_FEED_PER_TOOTH = 0.001
+
+    def feed_per_tooth_powers(self, speed_genes: np.ndarray, feed_genes: np.ndarray):
+        """
+        计算每齿进给及其幂次项
+
+        fz = f / (z·n)，当 fz ≥ 0.001 时 fz ** c = f ** c × (z·n) ** -c，
+        否则取下限 0.001 ** c，与 max(fz, 0.001) ** c 一致。
+
+        Args:
+            speed_genes: 转速基因
+            feed_genes: 进给基因
+
+        Returns:
+            (fz, max(fz, 0.001), fz ** feed_coefficient, fz ** material_slope)
+        """
+        fz = self.feed[feed_genes] / self.teeth_speed[speed_genes]
+        clamped = fz < self.MIN_FEED_PER_TOOTH
+        safe_fz = np.maximum(fz, self.MIN_FEED_PER_TOOTH)
+
+        fz_life = self.feed_life[feed_genes] * self.teeth_speed_life[speed_genes]
+        fz_life[clamped] = self.min_fz_life
+        fz_slope = self.feed_slope[feed_genes] * self.teeth_speed_slope[speed_genes]
+        fz_slope[clamped] = self.min_fz_slope
+        return fz, safe_fz, fz_life, fz_slope
+
+
+def default_decoding_bounds(constraints) -> DecodingBounds:
+    """默认解码边界：转速、进给 [0, 8000]，切深 [0, 最大切深]"""
+    return DecodingBounds(cut_depth=(0.0, constraints.max_cut_depth))
+
+
+def build_gene_tables(constraints, bounds: Optional[DecodingBounds] = None) -> GeneTables:
+    """
+    构建基因查找表
+
+    Args:
+        constraints: 优化约束条件（OptimizationConstraints）
+        bounds: 解码边界（默认见 default_decoding_bounds）
+
+    Returns:
+        基因查找表
+    """
+    bounds = bounds or default_decoding_bounds(constraints)
+
+    # 解码各基因的全部取值（取值个数由基因组布局决定）
+    layout = bounds.layout
+    speed = scale_genes(np.arange(2 ** layout.speed_bits), "speed", bounds)
+    feed = scale_genes(np.arange(2 ** layout.feed_bits), "feed", bounds)
+    cut_depth = scale_genes(np.arange(2 ** layout.cut_depth_bits), "cut_depth", bounds)
+
+    # 参数边界检查
+    n = np.maximum(speed, 1.0)
+    f = np.maximum(feed, 0.1)
+
+    vc = (n * constraints.tool_diameter) / 318.0 + 0.1  # 与旧版本保持一致
+    teeth_speed = constraints.tool_teeth * n
+
+    if constraints.machining_method == MachiningMethod.BORING:
+        chip_area = constraints.tool_diameter ** 2 - constraints.bottom_hole_diameter ** 2
+    else:
+        chip_area = constraints.tool_diameter ** 2
+
+    return GeneTables(
+        speed=n,
+        cutting_speed=vc,
+        speed_life_factor=np.maximum(vc, 0.001) ** constraints.speed_coefficient,
+        teeth_speed=teeth_speed,
+        teeth_speed_life=teeth_speed ** -constraints.feed_coefficient,
+        teeth_speed_slope=teeth_speed ** -constraints.material_slope,
+        feed=f,
+        feed_life=f ** constraints.feed_coefficient,
+        feed_slope=f ** constraints.material_slope,
+        chip_area_rate=f * np.pi * chip_area / 4000 + 1e-7,
+        cut_depth=cut_depth,
+        min_fz_life=GeneTables.MIN_FEED_PER_TOOTH ** constraints.feed_coefficient,
+        min_fz_slope=GeneTables.MIN_FEED_PER_TOOTH ** constraints.material_slope,
+    )
+
+
+class EvaluatorPlan:
+    """
+    评估计划
+
+    由一组约束条件编译而成：标量常数（惯性矩、主偏角正弦、进给力系数、
+    切宽比分支、切屑面积等）和加工方法对应的计算核只在构建时确定一次。
+    遗传算法、evaluate_batch 和 AI 审查器共用同一计划。
+    """
+
+    # 加工参数明细字段（铣削另含 tool_deflection）
+    BREAKDOWN_KEYS = (
+        "speed", "feed", "cut_depth", "cut_width", "material_removal_rate", "tool_life",
+        "bottom_roughness", "side_roughness", "power", "torque", "feed_force",
+        "feed_per_tooth", "cutting_speed",
+    )
+
+    def __init__(self, constraints, bounds: Optional[DecodingBounds] = None):
+        """
+        编译评估计划
+
+        Args:
+            constraints: 优化约束条件（OptimizationConstraints）
+            bounds: 基因解码边界（默认见 default_decoding_bounds）
+        """
+        c = constraints
+        self.constraints = constraints
+        self.bounds = bounds or default_decoding_bounds(c)
+        self.machining_method = c.machining_method
+        self.tables = build_gene_tables(c, self.bounds)
+
+        # 通用标量常数
+        self.life_factor = c.tool_life_coefficient * c.wear_coefficient
+        self.power_factor = PhysicalConstants.POWER_WATT_TO_KW / c.machine_efficiency
+        self.sin_kr = math.sin(c.main_cutting_angle * math.pi / 180)
+
+        if c.machining_method == MachiningMethod.BORING:
+            self.chip_area = c.tool_diameter ** 2 - c.bottom_hole_diameter ** 2
+        else:
+            self.chip_area = c.tool_diameter ** 2
+
+        if c.machining_method == MachiningMethod.MILLING:
+            # 平均切屑厚度 hm = 系数 × fz，系数由切宽比分支确定
+            self.ae_ratio = c.cut_width / c.tool_diameter
+            if self.ae_ratio <= 0.3:
+                self.fs = None
+                self.hm_factor = math.sqrt(self.ae_ratio)
+            else:
+                ratio = min(1.0, max(-1.0, (c.cut_width - 0.5 * c.tool_diameter) / (0.5 * c.tool_diameter)))
+                self.fs = 90 + math.asin(ratio) * 180 / math.pi  # 角度（度）
+                self.hm_factor = 1147 * self.sin_kr * self.ae_ratio / self.fs
+            self.kc_coefficient = (1 - 0.01 * c.rake_angle) * c.material_coefficient
+            self.feed_force_coeff = 0.3 + 0.2 * (1.0 - c.rake_angle / 20.0) * (90.0 / c.main_cutting_angle)
+            # 刀具挠度（悬臂梁）：δ = F × L³ / (3 × E × I)，I = π × D⁴ / 64
+            self.moment_of_inertia = 3.14159 * (c.tool_diameter ** 4) / 64.0
+            self.deflection_factor = (c.tool_overhang_length ** 3) / (
+                3.0 * c.tool_elastic_modulus * self.moment_of_inertia
+            )
+            self._kernel = self._milling_kernel
+        else:
+            self.hm_factor = self.sin_kr
+            self.kc_coefficient = c.material_coefficient
+            self._kernel = (
+                self._drilling_kernel if c.machining_method == MachiningMethod.DRILLING
+                else self._boring_kernel
+            )
+        self.hm_slope_factor = self.hm_factor ** c.material_slope
+
+    # ------------------------------------------------------------------
+    # 输入：基因（查表）或连续参数（直接计算）
+    # ------------------------------------------------------------------
+
+    def _gather(self, speed_genes: np.ndarray, feed_genes: np.ndarray, cut_depth_genes: np.ndarray) -> Dict[str, np.ndarray]:
+        """从基因查找表取值"""
+        t = self.tables
+        fz, safe_fz, fz_life, fz_slope = t.feed_per_tooth_powers(speed_genes, feed_genes)
+        return {
+            "n": t.speed[speed_genes],
+            "f": t.feed[feed_genes],
+            "ap": t.cut_depth[cut_depth_genes],
+            "vc": t.cutting_speed[speed_genes],
+            "fz": fz,
+            "safe_fz": safe_fz,
+            "fz_life": fz_life,
+            "fz_slope": fz_slope,
+            "speed_life": t.speed_life_factor[speed_genes],
+            "chip_rate": t.chip_area_rate[feed_genes],
+        }
+
+    def _direct(self, speed: np.ndarray, feed: np.ndarray, cut_depth: np.ndarray) -> Dict[str, np.ndarray]:
+        """由连续参数直接计算（与查表结果一致）"""
+        c = self.constraints
+        n = np.maximum(np.asarray(speed, dtype=float), 1.0)
+        f = np.maximum(np.asarray(feed, dtype=float), 0.1)
+        ap = np.asarray(cut_depth, dtype=float) * np.ones_like(n)
+        vc = (n * c.tool_diameter) / 318.0 + 0.1
+        fz = f / (c.tool_teeth * n)
+        safe_fz = np.maximum(fz, GeneTables.MIN_FEED_PER_TOOTH)
+        return {
+            "n": n,
+            "f": f,
+            "ap": ap,
+            "vc": vc,
+            "fz": fz,
+            "safe_fz": safe_fz,
+            "fz_life": safe_fz ** c.feed_coefficient,
+            "fz_slope": safe_fz ** c.material_slope,
+            "speed_life": np.maximum(vc, 0.001) ** c.speed_coefficient,
+            "chip_rate": f * np.pi * self.chip_area / 4000 + 1e-7,
+        }
+
+    # ------------------------------------------------------------------
+    # 计算核
+    # ------------------------------------------------------------------
+
+    def _common(self, v: Dict[str, np.ndarray], q: np.ndarray) -> Dict[str, np.ndarray]:
+        """各加工方法共用的刀具寿命、切削力、功率和扭矩"""
+        lft = self.life_factor * v["speed_life"] * v["fz_life"]
+        kc = self.kc_coefficient / (self.hm_slope_factor * v["fz_slope"] + 1e-3)
+        pmot = q * kc * self.power_factor
+        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (v["n"] + 1e-7)
+        return {
+            "speed": v["n"],
+            "feed": v["f"],
+            "cut_depth": v["ap"],
+            "material_removal_rate": q,
+            "tool_life": lft,
+            "power": pmot,
+            "torque": tnm,
+            "feed_per_tooth": v["fz"],
+            "cutting_speed": v["vc"],
+            "chip_thickness": self.hm_factor * v["safe_fz"],
+            "specific_cutting_force": kc,
+        }
+
+    def _milling_kernel(self, v: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """铣削计算核"""
+        c = self.constraints
+        q = v["f"] * v["ap"] * c.cut_width / 1000 + 1e-7
+        result = self._common(v, q)
+        safe_fz = v["safe_fz"]
+        # 进给力 Ff = 主切削力 Fc × 系数，Fc = kc × ap × ae / 齿数
+        ff = result["specific_cutting_force"] * v["ap"] * c.cut_width / c.tool_teeth * self.feed_force_coeff
+        result.update({
+            "cut_width": np.full_like(q, c.cut_width),
+            "bottom_roughness": PhysicalConstants.MILLING_ROUGHNESS_FACTOR * (safe_fz ** 2) / c.tool_diameter,
+            "side_roughness": (safe_fz * c.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / c.tool_diameter,
+            "feed_force": ff,
+            "tool_deflection": ff * self.deflection_factor,
+        })
+        return result
+
+    def _drilling_kernel(self, v: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """钻孔计算核"""
+        c = self.constraints
+        q = v["chip_rate"]
+        result = self._common(v, q)
+        zeros = np.zeros_like(q)
+        result.update({
+            "cut_width": zeros,
+            "bottom_roughness": zeros,
+            "side_roughness": zeros,
+            "feed_force": 0.63 * v["safe_fz"] * c.tool_teeth * c.tool_diameter * result["specific_cutting_force"] / 2,
+            "tool_deflection": zeros,
+        })
+        return result
+
+    def _boring_kernel(self, v: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """镗孔计算核"""
+        c = self.constraints
+        q = v["chip_rate"]
+        result = self._common(v, q)
+        zeros = np.zeros_like(q)
+        result.update({
+            "cut_width": np.full_like(q, c.cut_width),
+            "bottom_roughness": zeros,
+            "side_roughness": (v["safe_fz"] * c.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / c.tool_radius,
+            "feed_force": zeros,
+            "tool_deflection": zeros,
+        })
+        return result
+
+    # ------------------------------------------------------------------
+    # 约束惩罚与适应度
+    # ------------------------------------------------------------------
+
+    def _constraint_excess(self, p: Dict[str, np.ndarray]) -> Dict[str, Tuple[np.ndarray, float]]:
+        """各约束的超限量及惩罚系数（超限量 ≤ 0 表示满足约束）"""
+        c = self.constraints
+        excess = {
+            "tool_life": (c.min_tool_life - p["tool_life"], ConstraintPenalty.TOOL_LIFE),
+            "power": (p["power"] - c.max_power, ConstraintPenalty.POWER),
+            "torque": (p["torque"] - c.max_torque, ConstraintPenalty.TORQUE),
+            "surface_roughness": (p["bottom_roughness"] - c.min_surface_roughness, ConstraintPenalty.SURFACE_ROUGHNESS),
+            "feed_force": (p["feed_force"] - c.max_feed_force, ConstraintPenalty.FEED_FORCE),
+        }
+        if self.machining_method == MachiningMethod.MILLING:
+            # 使用较低的惩罚权重，避免过度限制切深
+            excess["tool_deflection"] = (
+                p["tool_deflection"] - c.max_tool_deflection, ConstraintPenalty.FEED_FORCE * 0.5
+            )
+        excess["feed_per_tooth"] = (p["feed_per_tooth"] - c.max_feed_per_tooth, ConstraintPenalty.MAX_FEED)
+        excess["cutting_speed"] = (p["cutting_speed"] - c.max_cutting_speed, ConstraintPenalty.MAX_SPEED)
+        return excess
+
+    def penalty(self, p: Dict[str, np.ndarray], log_violations: bool = False) -> np.ndarray:
+        """
+        计算约束惩罚
+
+        Args:
+            p: 计算核输出的加工参数数组
+            log_violations: 是否记录违规统计
+
+        Returns:
+            惩罚数组
+        """
+        penalty = np.zeros_like(p["material_removal_rate"])
+        violations_count = {}
+        for name, (excess, weight) in self._constraint_excess(p).items():
+            # 超限量数组为本次新建，原地计算惩罚项，不再分配临时数组
+            violated = np.maximum(excess, 0.0, out=excess)
+            if log_violations:
+                violations_count[name] = int(np.count_nonzero(violated))
+            np.square(violated, out=violated)
+            violated *= weight
+            penalty += violated
+
+        if log_violations and sum(violations_count.values()) > 0:
+            self._log_violations(p, penalty, violations_count)
+        return penalty
+
+    def _log_violations(self, p: Dict[str, np.ndarray], penalty: np.ndarray, violations_count: Dict[str, int]) -> None:
+        """记录违规统计（用于调试）"""
+        c = self.constraints
+        total_violations = sum(violations_count.values())
+        logger.warning(f"向量化评估: 发现 {total_violations} 个约束违规 - "
+                       f"功率:{violations_count['power']}, 扭矩:{violations_count['torque']}, "
+                       f"刀具寿命:{violations_count['tool_life']}, 粗糙度:{violations_count['surface_roughness']}, "
+                       f"进给力:{violations_count['feed_force']}, 每齿进给:{violations_count['feed_per_tooth']}, "
+                       f"线速度:{violations_count['cutting_speed']}, 刀具挠度:{violations_count.get('tool_deflection', 0)}")
+
+        if violations_count.get("tool_deflection", 0) > 0:
+            max_deflection_idx = int(np.argmax(p["tool_deflection"]))
+            logger.warning(f"挠度调试: L={c.tool_overhang_length:.1f}mm, E={c.tool_elastic_modulus:.0f}MPa, "
+                           f"max_deflection={c.max_tool_deflection:.3f}mm, "
+                           f"ff_max={p['feed_force'][max_deflection_idx]:.1f}N, "
+                           f"deflection_max={p['tool_deflection'][max_deflection_idx]:.3f}mm")
+
+        # 调试：记录最优个体的关键参数（仅当存在违反功率/扭矩约束时）
+        if violations_count["power"] > 0 or violations_count["torque"] > 0:
+            i = int(np.argmin(penalty))
+            logger.warning(f"调试 - 最优个体: n={p['speed'][i]:.1f}, f={p['feed'][i]:.1f}, "
+                           f"ap={p['cut_depth'][i]:.2f}, ae={c.cut_width:.2f}")
+            logger.warning(f"调试 - 物理参数: hm={p['chip_thickness'][i]:.4f}, kc={p['specific_cutting_force'][i]:.1f}, "
+                           f"q={p['material_removal_rate'][i]:.2f}, pmot={p['power'][i]:.2f}, tnm={p['torque'][i]:.2f}")
+            logger.warning(f"调试 - 约束: 最大功率={c.max_power}, 最大扭矩={c.max_torque}, 刀具直径={c.tool_diameter}")
+            if self.machining_method == MachiningMethod.MILLING and self.fs is not None:
+                logger.warning(f"调试 - ae_ratio={self.ae_ratio:.4f}, fs={self.fs:.2f}")
+
+    def fitness(
+        self,
+        p: Dict[str, np.ndarray],
+        log_violations: bool = False,
+        objective: ArrayObjective = mrr_objective,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """适应度：目标值（默认材料去除率）减去约束惩罚，给定 out 时写入 out"""
+        penalty = self.penalty(p, log_violations)
+        penalty *= -1e29
+        return np.add(objective(p), penalty, out=out)
+
+    # ------------------------------------------------------------------
+    # 对外接口
+    # ------------------------------------------------------------------
+
+    def evaluate(
+        self,
+        population: np.ndarray,
+        staged: bool = False,
+        objective: ArrayObjective = mrr_objective,
+        out: Optional[np.ndarray] = None,
+        log_violations: bool = True
+    ) -> np.ndarray:
+        """
+        评估种群适应度
+
+        Args:
+            population: 种群位矩阵 (N, dna_size) 或位打包种群 (N,)
+            staged: 是否分阶段评估（见 _evaluate_staged）
+            objective: 向量化目标函数（默认最大化材料去除率）
+            out: 预分配的适应度数组 (N,)（可选）
+            log_violations: 是否记录违规统计
+
+        Returns:
+            适应度数组 (N,)，给定 out 时即 out
+        """
+        genes = decode_genes(population, self.bounds.layout)
+        if staged:
+            return self._evaluate_staged(*genes, objective=objective, out=out, log_violations=log_violations)
+        p = self._kernel(self._gather(*genes))
+        return self.fitness(p, log_violations=log_violations, objective=objective, out=out)
+
+    def evaluate_chunked(
+        self,
+        population: np.ndarray,
+        staged: bool = False,
+        objective: ArrayObjective = mrr_objective,
+        out: Optional[np.ndarray] = None,
+        chunk_size: int = EVALUATION_CHUNK_SIZE,
+        n_workers: int = 1
+    ) -> np.ndarray:
+        """
+        分块评估种群适应度（用于超大种群）
+
+        种群按 chunk_size 切块，各块的临时数组只有块大小，峰值内存不随种群增长；
+        NumPy 运算期间释放 GIL，多个块可在线程池中并行计算，结果直接写入 out 的对应切片。
+        种群不超过一块时与 evaluate 相同；分多块时不记录违规统计（避免每块重复输出）。
+
+        Args:
+            population: 种群位矩阵 (N, dna_size) 或位打包种群 (N,)
+            staged: 是否分阶段评估
+            objective: 向量化目标函数
+            out: 预分配的适应度数组 (N,)（可选）
+            chunk_size: 每块个体数
+            n_workers: 线程数（1 表示在当前线程中逐块计算）
+
+        Returns:
+            适应度数组 (N,)，给定 out 时即 out
+        """
+        n = len(population)
+        if n <= chunk_size:
+            return self.evaluate(population, staged=staged, objective=objective, out=out)
+        if out is None:
+            out = np.empty(n, dtype=float)
+
+        def evaluate_block(start: int) -> None:
+            stop = min(start + chunk_size, n)
+            self.evaluate(population[start:stop], staged=staged, objective=objective,
+                          out=out[start:stop], log_violations=False)
+
+        starts = range(0, n, chunk_size)
+        if n_workers <= 1:
+            for start in starts:
+                evaluate_block(start)
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                # 迭代结果以抛出工作线程中的异常
+                for _ in executor.map(evaluate_block, starts):
+                    pass
+        return out
+
+    def _cheap_penalty(self, speed_genes: np.ndarray, feed_genes: np.ndarray) -> np.ndarray:
+        """只依赖转速与进给的约束惩罚（线速度、每齿进给）"""
+        c = self.constraints
+        t = self.tables
+        fz = t.feed[feed_genes] / t.teeth_speed[speed_genes]
+        fz_excess = np.maximum(fz - c.max_feed_per_tooth, 0.0)
+        vc_excess = np.maximum(t.cutting_speed[speed_genes] - c.max_cutting_speed, 0.0)
+        return fz_excess ** 2 * ConstraintPenalty.MAX_FEED + vc_excess ** 2 * ConstraintPenalty.MAX_SPEED
+
+    def _removal_rate(self, feed_genes: np.ndarray, cut_depth_genes: np.ndarray) -> np.ndarray:
+        """材料去除率（与计算核一致）"""
+        t = self.tables
+        if self.machining_method == MachiningMethod.MILLING:
+            return t.feed[feed_genes] * t.cut_depth[cut_depth_genes] * self.constraints.cut_width / 1000 + 1e-7
+        return t.chip_area_rate[feed_genes]
+
+    def _evaluate_staged(
+        self,
+        speed_genes: np.ndarray,
+        feed_genes: np.ndarray,
+        cut_depth_genes: np.ndarray,
+        objective: ArrayObjective = mrr_objective,
+        out: Optional[np.ndarray] = None,
+        log_violations: bool = True
+    ) -> np.ndarray:
+        """
+        分阶段评估
+
+        先计算线速度与每齿进给约束；违反者只计入这两项惩罚（其适应度是完整评估的上界，
+        但仍远低于所有可行个体），其余个体压缩后运行完整计算核，结果按索引写回。
+
+        注意：被拒个体的适应度不含其余约束的惩罚，不可行个体之间的排序与完整评估不同
+        （锦标赛胜负与种群最优个体都可能改变），因此只应显式开启（GAConfig.staged_evaluation）。
+        默认目标（材料去除率）的目标值无需计算核即可得到，被拒个体的适应度为 MRR - 1e29 × 惩罚；
+        其他目标（加工时间、成本、刀具寿命等）依赖计算核输出，被拒个体的目标值按 0 计，适应度为
+        0 - 1e29 × 惩罚，与完整评估相差的不只是惩罚项。两种情况下未被拒个体的适应度与完整评估相同，
+        被拒个体仍排在所有可行个体之后，可行个体的排序与最优解不变。
+
+        Args:
+            speed_genes: 转速基因
+            feed_genes: 进给基因
+            cut_depth_genes: 切深基因
+            objective: 向量化目标函数
+            out: 预分配的适应度数组 (N,)（可选）
+            log_violations: 是否记录违规统计
+
+        Returns:
+            适应度数组 (N,)，给定 out 时即 out
+        """
+        cheap_penalty = self._cheap_penalty(speed_genes, feed_genes)
+        rejected = cheap_penalty > 0
+        if not np.any(rejected):
+            p = self._kernel(self._gather(speed_genes, feed_genes, cut_depth_genes))
+            return self.fitness(p, log_violations=log_violations, objective=objective, out=out)
+
+        fitness = np.empty(len(speed_genes), dtype=float) if out is None else out
+        # 默认目标的目标值无需计算核即可得到；其他目标被拒个体只计惩罚
+        rejected_objective = (
+            self._removal_rate(feed_genes[rejected], cut_depth_genes[rejected])
+            if objective is mrr_objective else 0.0
+        )
+        fitness[rejected] = rejected_objective - 1e29 * cheap_penalty[rejected]
+        survivors = np.flatnonzero(~rejected)
+        if len(survivors) > 0:
+            p = self._kernel(self._gather(speed_genes[survivors], feed_genes[survivors], cut_depth_genes[survivors]))
+            fitness[survivors] = self.fitness(p, log_violations=log_violations, objective=objective)
+        return fitness
+
+    def evaluate_parameters(
+        self,
+        speed,
+        feed,
+        cut_depth,
+        objective: ArrayObjective = mrr_objective
+    ) -> Dict[str, np.ndarray]:
+        """
+        由连续参数计算全部加工参数及适应度
+
+        Args:
+            speed: 转速 (r/min)，标量或数组
+            feed: 进给 (mm/min)，标量或数组
+            cut_depth: 切深 (mm)，标量或数组
+            objective: 向量化目标函数（默认最大化材料去除率）
+
+        Returns:
+            加工参数数组字典（含 fitness 与 penalty）
+        """
+        speed, feed, cut_depth = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(speed, dtype=float)),
+            np.atleast_1d(np.asarray(feed, dtype=float)),
+            np.atleast_1d(np.asarray(cut_depth, dtype=float)),
+        )
+        p = self._kernel(self._direct(speed, feed, cut_depth))
+        p["penalty"] = self.penalty(p)
+        p["fitness"] = objective(p) - 1e29 * p["penalty"]
+        return p
+
+    def machining_parameters(
+        self,
+        speed,
+        feed,
+        cut_depth,
+        objective: ArrayObjective = mrr_objective
+    ) -> Dict[str, np.ndarray]:
+        """
+        一次向量化计算加工参数明细（字段与 MicrobialGeneticAlgorithm._calculate_machining_parameters 一致）
+
+        Args:
+            speed: 转速 (r/min)，标量或数组
+            feed: 进给 (mm/min)，标量或数组
+            cut_depth: 切深 (mm)，标量或数组
+            objective: 向量化目标函数（用于计算 fitness）
+
+        Returns:
+            加工参数数组字典（另含 fitness 与 penalty）
+        """
+        p = self.evaluate_parameters(speed, feed, cut_depth, objective)
+        keys = self.BREAKDOWN_KEYS
+        if self.machining_method == MachiningMethod.MILLING:
+            keys = keys + ("tool_deflection",)
+        result = {name: p[name] for name in keys + ("fitness", "penalty")}
+        if self.machining_method == MachiningMethod.DRILLING:
+            # 钻孔不使用切深
+            result["cut_depth"] = np.zeros_like(result["cut_depth"])
+        return result
+
+
+# 评估计划缓存（按约束值与解码边界）
+_PLAN_CACHE_SIZE = 64
+_plan_cache: "OrderedDict[tuple, EvaluatorPlan]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+def get_evaluator_plan(constraints, bounds: Optional[DecodingBounds] = None) -> EvaluatorPlan:
+    """
+    获取评估计划（同一组约束值与解码边界复用已编译的计划）
+
+    Args:
+        constraints: 优化约束条件（OptimizationConstraints）
+        bounds: 基因解码边界（默认见 default_decoding_bounds）
+
+    Returns:
+        评估计划
+    """
+    bounds = bounds or default_decoding_bounds(constraints)
+    key = (astuple(constraints), bounds)
+    with _plan_cache_lock:
+        plan = _plan_cache.get(key)
+        if plan is not None:
+            _plan_cache.move_to_end(key)
+            return plan
+
+    plan = EvaluatorPlan(constraints, bounds)
+    with _plan_cache_lock:
+        _plan_cache[key] = plan
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > _PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    return plan
+
+
+class FitnessCache:
+    """
+    基因型适应度缓存
+
+    以位打包基因组（uint64）为键，绑定到一个评估计划与目标函数（不同约束或目标的适应度不可混用）。
+    键按升序存放在数组中，查找使用 np.searchsorted；容量超限时按最近使用代次淘汰。
+    """
+
+    def __init__(
+        self,
+        plan: EvaluatorPlan,
+        capacity: int = 1 << 16,
+        staged: bool = False,
+        objective: ArrayObjective = mrr_objective
+    ):
+        """
+        初始化适应度缓存
+
+        Args:
+            plan: 评估计划
+            capacity: 最大缓存条目数
+            staged: 未命中的基因组是否分阶段评估
+            objective: 向量化目标函数
+        """
+        self.plan = plan
+        self.capacity = capacity
+        self.staged = staged
+        self.objective = objective
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._values = np.empty(0, dtype=float)
+        self._last_used = np.empty(0, dtype=np.int64)
+        self._clock = 0
+        self._lock = threading.Lock()
+
+        # 统计
+        self.lookups = 0  # 请求评估的个体数
+        self.hits = 0     # 未调用计算核即得到适应度的个体数（缓存命中 + 批内重复）
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def hit_rate(self) -> float:
+        """累计命中率"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        """
+        评估种群适应度（先批内去重，再查缓存，只对未命中的基因组调用计算核）
+
+        Args:
+            population: 种群位矩阵 (N, dna_size) 或位打包种群 (N,)
+
+        Returns:
+            适应度数组 (N,)
+        """
+        keys = population if is_packed(population) else pack_population(population)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        with self._lock:
+            self._clock += 1
+            values, found = self._lookup(unique_keys)
+
+        missing = ~found
+        if np.any(missing):
+            new_keys = unique_keys[missing]
+            new_values = self.plan.evaluate_chunked(new_keys, staged=self.staged, objective=self.objective)
+            values[missing] = new_values
+            with self._lock:
+                self._store(new_keys, new_values)
+
+        with self._lock:
+            self.lookups += len(keys)
+            self.hits += len(keys) - int(np.count_nonzero(missing))
+        return values[inverse.ravel()]
+
+    def _lookup(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """查找已缓存的适应度，并刷新命中条目的使用代次"""
+        values = np.empty(len(keys), dtype=float)
+        if len(self._keys) == 0:
+            return values, np.zeros(len(keys), dtype=bool)
+
+        pos = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        found = self._keys[pos] == keys
+        hit_pos = pos[found]
+        values[found] = self._values[hit_pos]
+        self._last_used[hit_pos] = self._clock
+        return values, found
+
+    def _store(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """插入新条目（保持键有序），超出容量时淘汰最久未使用的条目"""
+        insert_at = np.searchsorted(self._keys, keys)
+        if len(self._keys) > 0:
+            # 并发评估时其他线程可能已插入相同的键
+            fresh = self._keys[np.minimum(insert_at, len(self._keys) - 1)] != keys
+            keys, values, insert_at = keys[fresh], values[fresh], insert_at[fresh]
+
+        self._keys = np.insert(self._keys, insert_at, keys)
+        self._values = np.insert(self._values, insert_at, values)
+        self._last_used = np.insert(self._last_used, insert_at, self._clock)
+
+        if len(self._keys) > self.capacity:
+            # 一次淘汰到容量的 90%，摊薄淘汰开销
+            n_keep = int(self.capacity * 0.9)
+            keep = np.argpartition(self._last_used, len(self._keys) - n_keep)[len(self._keys) - n_keep:]
+            keep.sort()
+            self._keys = self._keys[keep]
+            self._values = self._values[keep]
+            self._last_used = self._last_used[keep]
@@ -0,0 +1,363 @@
+"""
+基因组编码模块
+提供 DNA 位矩阵与位打包（uint64）表示之间的转换、基因解码、基因到参数取值的映射以及位运算遗传算子
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+from ..config.constants import DNAEncoding
+
+# 参数在 DNA 中的排列顺序（高位在前）
+GENE_NAMES = ("speed", "feed", "cut_depth")
+
+# 随机位掩码置位概率的量化位数（见 random_bit_masks）
+MASK_PRECISION = 8
+
+
+@dataclass(frozen=True)
+class GenomeLayout:
+    """
+    基因组布局：各参数占用的位数与编码方式
+
+    DNA 中依次排列转速、进给、切深（高位在前），位范围与解码权重均由位数导出。
+    位数越多分辨率越高，但基因查找表按 2 ** 位数 分配，DNA 总长不超过 64 位（位打包表示）。
+
+    格雷码编码下相邻取值只差一位（二进制下 32767 → 32768 需要翻转全部 16 位），
+    变异可以做小步移动，收敛末段不易停滞。
+    """
+    speed_bits: int = DNAEncoding.SPEED_BITS
+    feed_bits: int = DNAEncoding.FEED_BITS
+    cut_depth_bits: int = DNAEncoding.CUT_DEPTH_BITS
+    gray_code: bool = False
+
+    MAX_BITS = 20  # 单个参数的最大位数（查找表最多 2 ** 20 项）
+
+    def __post_init__(self):
+        for name in GENE_NAMES:
+            bits = self.bits(name)
+            if not 1 <= bits <= self.MAX_BITS:
+                raise ValueError(f"{name} 基因位数无效: {bits}（取值范围 1 ~ {self.MAX_BITS}）")
+
+    @classmethod
+    def from_bits(cls, bits: Tuple[int, int, int], gray_code: bool = False) -> "GenomeLayout":
+        """由 (转速位数, 进给位数, 切深位数) 创建布局"""
+        speed_bits, feed_bits, cut_depth_bits = bits
+        return cls(int(speed_bits), int(feed_bits), int(cut_depth_bits), gray_code)
+
+    def bits(self, name: str) -> int:
+        """参数占用的位数"""
+        return getattr(self, f"{name}_bits")
+
+    @property
+    def total_bits(self) -> int:
+        """DNA 长度"""
+        return self.speed_bits + self.feed_bits + self.cut_depth_bits
+
+    def bit_ranges(self) -> Dict[str, Tuple[int, int]]:
+        """各参数在 DNA 中的位范围 [start, end)"""
+        ranges = {}
+        start = 0
+        for name in GENE_NAMES:
+            ranges[name] = (start, start + self.bits(name))
+            start += self.bits(name)
+        return ranges
+
+
+DEFAULT_LAYOUT = GenomeLayout()
+
+
+def pack_population(population: np.ndarray) -> np.ndarray:
+    """
+    将 DNA 位矩阵打包为 uint64（第 0 位为最高位，与位矩阵的解码顺序一致）
+
+    Args:
+        population: 种群位矩阵 (N, dna_size)，元素为 0/1
+
+    Returns:
+        打包后的种群 (N,) uint64
+    """
+    dna_size = population.shape[1]
+    packed_bytes = np.packbits(population, axis=1)  # 大端，末字节低位补 0
+    n_bytes = packed_bytes.shape[1]
+    buffer = np.zeros((population.shape[0], 8), dtype=np.uint8)
+    buffer[:, 8 - n_bytes:] = packed_bytes
+    packed = buffer.view(">u8").ravel().astype(np.uint64)
+    return packed >> np.uint64(n_bytes * 8 - dna_size)
+
+
+def unpack_population(packed: np.ndarray, dna_size: int = DNAEncoding.total_bits()) -> np.ndarray:
+    """
+    将 uint64 打包种群展开为 DNA 位矩阵
+
+    Args:
+        packed: 打包后的种群 (N,) uint64
+        dna_size: DNA 长度
+
+    Returns:
+        种群位矩阵 (N, dna_size) uint8
+    """
+    # 按大端字节展开，取低 dna_size 位
+    big_endian = np.ascontiguousarray(packed, dtype=">u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(big_endian, axis=1)[:, 64 - dna_size:]
+
+
+def is_packed(population: np.ndarray) -> bool:
+    """种群是否为位打包表示（一维 uint64）"""
+    return population.ndim == 1
+
+
+def gray_to_binary(genes: np.ndarray, n_bits: int) -> np.ndarray:
+    """
+    格雷码转自然二进制（前缀异或）
+
+    第 i 位二进制 = 格雷码最高位到第 i 位的异或，按 1, 2, 4, ... 位移折叠，共 log2(位数) 次整体运算。
+
+    Args:
+        genes: 格雷码基因整数值数组
+        n_bits: 基因位数
+
+    Returns:
+        二进制基因整数值数组
+    """
+    shift = 1
+    while shift < n_bits:
+        genes = genes ^ (genes >> shift)
+        shift <<= 1
+    return genes
+
+
+def binary_to_gray(genes: np.ndarray) -> np.ndarray:
+    """自然二进制转格雷码"""
+    return genes ^ (genes >> 1)
+
+
+def decode_genes(
+    population: np.ndarray,
+    layout: GenomeLayout = DEFAULT_LAYOUT
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    将种群解码为各参数的基因整数值
+
+    位矩阵先经 np.packbits 打包，再统一使用移位与掩码解码。
+
+    Args:
+        population: 种群位矩阵 (N, dna_size) 或打包种群 (N,)
+        layout: 基因组布局（格雷码布局解码为自然二进制取值）
+
+    Returns:
+        (转速基因, 进给基因, 切深基因)，均为 (N,) intp 数组（可直接用作查找表索引）
+    """
+    if not is_packed(population):
+        population = pack_population(population)
+
+    bit_ranges = layout.bit_ranges()
+    total_bits = layout.total_bits
+    genes = []
+    for name in GENE_NAMES:
+        start, end = bit_ranges[name]
+        shift = np.uint64(total_bits - end)
+        mask = np.uint64((1 << (end - start)) - 1)
+        gene = ((population >> shift) & mask).astype(np.intp)
+        if layout.gray_code:
+            gene = gray_to_binary(gene, end - start)
+        genes.append(gene)
+    return genes[0], genes[1], genes[2]
+
+
+@dataclass(frozen=True)
+class DecodingBounds:
+    """
+    基因解码边界：各参数基因的整数值线性（或对数）映射到 [lo, hi]
+
+    对数刻度只作用于转速与进给，切深始终线性映射。基因的取值个数由基因组布局决定。
+    """
+    speed: Tuple[float, float] = (0.0, 8000.0)
+    feed: Tuple[float, float] = (0.0, 8000.0)
+    cut_depth: Tuple[float, float] = (0.0, 5.0)
+    log_scale: bool = False
+    layout: GenomeLayout = field(default=DEFAULT_LAYOUT)
+
+    def __post_init__(self):
+        for name in GENE_NAMES:
+            lo, hi = getattr(self, name)
+            if hi < lo:
+                raise ValueError(f"{name} 解码边界无效: [{lo}, {hi}]")
+            if self.log_scale and name != "cut_depth" and lo <= 0:
+                raise ValueError(f"对数刻度解码要求 {name} 下限大于 0: [{lo}, {hi}]")
+
+
+def scale_genes(genes: np.ndarray, name: str, bounds: DecodingBounds) -> np.ndarray:
+    """
+    将基因整数值映射为参数取值
+
+    Args:
+        genes: 基因整数值数组
+        name: 参数名（speed / feed / cut_depth）
+        bounds: 解码边界
+
+    Returns:
+        参数取值数组
+    """
+    t = genes / (2 ** bounds.layout.bits(name) - 1)
+    lo, hi = getattr(bounds, name)
+    if bounds.log_scale and name != "cut_depth":
+        return lo * (hi / lo) ** t
+    return lo + t * (hi - lo)
+
+
+def unscale_values(values: np.ndarray, name: str, bounds: DecodingBounds, nearest: bool = False) -> np.ndarray:
+    """
+    将参数取值映射回基因整数值（默认向下取整，解码后不超过给定取值；低于下限时取 0）
+
+    Args:
+        values: 参数取值数组
+        name: 参数名（speed / feed / cut_depth）
+        bounds: 解码边界
+        nearest: 取解码值最接近给定取值的基因（用于编码已有的解）
+
+    Returns:
+        基因整数值数组 (intp)
+    """
+    max_gene = 2 ** bounds.layout.bits(name) - 1
+    lo, hi = getattr(bounds, name)
+    if hi <= lo:
+        return np.zeros(np.shape(values), dtype=np.intp)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if bounds.log_scale and name != "cut_depth":
+            t = np.log(np.maximum(values, lo) / lo) / np.log(hi / lo)
+        else:
+            t = (np.asarray(values) - lo) / (hi - lo)
+    if nearest:
+        genes = np.rint(np.nan_to_num(t) * max_gene)
+    else:
+        # 减去微小量，避免浮点误差使解码值略高于给定取值
+        genes = np.floor(np.nan_to_num(t) * max_gene - 1e-9)
+    return np.clip(genes, 0, max_gene).astype(np.intp)
+
+
+def encode_genes(
+    speed_genes: np.ndarray,
+    feed_genes: np.ndarray,
+    cut_depth_genes: np.ndarray,
+    layout: GenomeLayout = DEFAULT_LAYOUT
+) -> np.ndarray:
+    """
+    将各参数的基因整数值编码为打包种群（decode_genes 的逆运算）
+
+    Args:
+        speed_genes: 转速基因
+        feed_genes: 进给基因
+        cut_depth_genes: 切深基因
+        layout: 基因组布局（格雷码布局按格雷码写入）
+
+    Returns:
+        打包种群 (N,) uint64
+    """
+    bit_ranges = layout.bit_ranges()
+    total_bits = layout.total_bits
+    packed = np.zeros(len(speed_genes), dtype=np.uint64)
+    for name, genes in (("speed", speed_genes), ("feed", feed_genes), ("cut_depth", cut_depth_genes)):
+        genes = np.asarray(genes, dtype=np.uint64)
+        if layout.gray_code:
+            genes = binary_to_gray(genes)
+        packed |= genes << np.uint64(total_bits - bit_ranges[name][1])
+    return packed
+
+
+def decode_parameters(
+    population: np.ndarray,
+    bounds: DecodingBounds
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    将种群解码为参数取值
+
+    Args:
+        population: 种群位矩阵 (N, dna_size) 或打包种群 (N,)
+        bounds: 解码边界
+
+    Returns:
+        (转速, 进给, 切深)，均为 (N,) 数组
+    """
+    speed_genes, feed_genes, cut_depth_genes = decode_genes(population, bounds.layout)
+    return (
+        scale_genes(speed_genes, "speed", bounds),
+        scale_genes(feed_genes, "feed", bounds),
+        scale_genes(cut_depth_genes, "cut_depth", bounds),
+    )
+
+
+def random_packed_population(
+    size: int,
+    dna_size: int = DNAEncoding.total_bits(),
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    生成随机打包种群
+
+    Args:
+        size: 个体数量
+        dna_size: DNA 长度（不超过 64）
+        rng: 随机数生成器（默认新建一个）
+
+    Returns:
+        打包种群 (size,) uint64
+    """
+    rng = rng or np.random.default_rng()
+    return rng.integers(0, (1 << dna_size) - 1, size, dtype=np.uint64, endpoint=True)
+
+
+def random_bit_masks(
+    size: int,
+    dna_size: int,
+    rate: float,
+    rng: Optional[np.random.Generator] = None,
+    precision: int = MASK_PRECISION
+) -> np.ndarray:
+    """
+    生成随机位掩码（每一位以概率 rate 置 1）
+
+    直接在 uint64 随机字上按位组合，不为每一位生成浮点随机数：rate 量化为 precision 位二进制小数
+    0.b1 b2 ... bk，从最低位 bk 到最高位 b1 依次取一个随机字 w，bi 为 1 时 x = x | w，为 0 时 x = x & w，
+    每一位置 1 的概率即为量化后的 rate（rate = 0.5 时只需一个随机字）。
+
+    Args:
+        size: 掩码数量
+        dna_size: DNA 长度
+        rate: 置位概率
+        rng: 随机数生成器（默认新建一个）
+        precision: rate 的量化位数（误差不超过 2 ** -(precision + 1)）
+
+    Returns:
+        打包掩码 (size,) uint64
+    """
+    rng = rng or np.random.default_rng()
+    numerator = int(round(min(max(rate, 0.0), 1.0) * (1 << precision)))
+    valid = np.uint64((1 << dna_size) - 1)
+    if numerator == 0:
+        return np.zeros(size, dtype=np.uint64)
+    if numerator == 1 << precision:
+        return np.full(size, valid, dtype=np.uint64)
+    # 最低的若干 0 位作用在 x = 0 上（与运算后仍为 0），省略后结果不变
+    while numerator % 2 == 0:
+        numerator //= 2
+        precision -= 1
+
+    words = rng.integers(0, np.iinfo(np.uint64).max, (precision, size), dtype=np.uint64, endpoint=True)
+    mask = np.zeros(size, dtype=np.uint64)
+    for i, word in enumerate(words):
+        if (numerator >> i) & 1:
+            mask |= word
+        else:
+            mask &= word
+    return mask & valid
+
+
+def packed_crossover(losers: np.ndarray, winners: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """位运算交叉：掩码为 1 的位取赢者基因"""
+    return (losers & ~mask) | (winners & mask)
+
+
+def packed_mutate(individuals: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """位运算变异：掩码为 1 的位翻转"""
+    return individuals ^ mask
@@ -0,0 +1,231 @@
+"""
+网格细化求解器
+决策空间只有转速、进给、切深三个变量：先按块评估整个参数空间上的稠密网格，
+再反复放大最优可行单元周围的局部网格，直至最优适应度不再改进。
+求解过程不含随机性，相同输入总是得到相同结果。
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, Tuple, Optional
+import numpy as np
+
+from .microbial_ga import GAConfig, OptimizationConstraints
+from .continuous import ContinuousSearch
+from .optimizer import register_optimizer
+
+
+@dataclass
+class GridConfig:
+    """网格细化求解器配置"""
+    coarse_points: Tuple[int, int, int] = (64, 64, 32)  # 粗网格各轴点数（转速、进给、切深）
+    refine_points: int = 9          # 细化网格各轴点数（奇数时包含单元中心）
+    top_k: int = 8                  # 每轮放大的最优单元数
+    max_refinements: int = 12       # 最大细化轮数
+    tolerance: float = 1e-7         # 视为无改进的最优适应度相对改进
+    patience: int = 3               # 连续若干轮细化无改进时停止
+    chunk_size: int = 1 << 15       # 每块评估的网格点数（限制峰值内存）
+
+
+@register_optimizer("grid")
+class GridRefineSolver(ContinuousSearch):
+    """网格细化求解器（不含随机性）"""
+
+    def __init__(
+        self,
+        config: GAConfig,
+        constraints: OptimizationConstraints,
+        grid_config: Optional[GridConfig] = None
+    ):
+        """
+        初始化求解器
+
+        Args:
+            config: 算法配置（使用其中的参数边界、对数刻度与运行预算）
+            constraints: 约束条件
+            grid_config: 网格配置
+        """
+        super().__init__(config, constraints)
+        self.grid_config = grid_config or GridConfig()
+        if min(self.grid_config.coarse_points) < 2 or self.grid_config.refine_points < 3:
+            raise ValueError("网格各轴至少需要 2 个点，细化网格至少需要 3 个点")
+        self.refinements = 0
+        self.coarse_evaluations = 0
+
+    def _grid_chunks(self, lower: np.ndarray, upper: np.ndarray, points: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        按块生成若干个盒子上的规则网格点（不一次性展开整个网格）
+
+        Args:
+            lower: 各盒子下角单位坐标 (M, 3)
+            upper: 各盒子上角单位坐标 (M, 3)
+            points: 各轴点数 (3,)
+
+        Yields:
+            网格点单位坐标块 (≤chunk_size, 3)
+        """
+        per_box = int(np.prod(points))
+        total = len(lower) * per_box
+        step = (upper - lower) / (points - 1)
+        for start in range(0, total, self.grid_config.chunk_size):
+            flat = np.arange(start, min(start + self.grid_config.chunk_size, total))
+            box, local = np.divmod(flat, per_box)
+            index = np.stack(np.unravel_index(local, tuple(points)), axis=1)
+            yield lower[box] + index * step[box]
+
+    def _evaluate_grid(
+        self,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        points: np.ndarray,
+        candidates: Tuple[np.ndarray, np.ndarray],
+        deadline_at: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Tuple[np.ndarray, np.ndarray], Optional[str]]:
+        """
+        分块评估网格，并与已有候选合并保留最优的 top_k 个互不重复的点
+
+        每块评估前检查运行预算：超过截止时间或评估次数用尽时停止，最后一块按剩余评估次数截断。
+        尚无候选时第一块总是评估（至少评估一个点），保证有解可返回。
+
+        Args:
+            lower: 各盒子下角单位坐标 (M, 3)
+            upper: 各盒子上角单位坐标 (M, 3)
+            points: 各轴点数 (3,)
+            candidates: 已有候选 (单位坐标 (K, 3), 适应度 (K,))
+            deadline_at: 截止时刻（time.perf_counter()），None 表示不限制
+            max_evaluations: 物理模型评估次数上限，None 表示不限制
+
+        Returns:
+            (合并后的候选 (单位坐标, 适应度)，按适应度降序；预算耗尽时的停止原因，网格评估完整时为 None)
+        """
+        best_units, best_fitness = candidates
+        for units in self._grid_chunks(lower, upper, points):
+            if len(best_fitness) > 0:
+                if deadline_at is not None and time.perf_counter() >= deadline_at:
+                    return (best_units, best_fitness), "deadline"
+                if max_evaluations is not None and self.evaluation_count >= max_evaluations:
+                    return (best_units, best_fitness), "max_evaluations"
+            if max_evaluations is not None:
+                units = units[:max(max_evaluations - self.evaluation_count, 1)]
+            fitness = self._evaluate(units)
+            best_units, best_fitness = self._select(
+                np.concatenate([best_units, units]), np.concatenate([best_fitness, fitness])
+            )
+        return (best_units, best_fitness), None
+
+    def _select(self, units: np.ndarray, fitness: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        选出适应度最高的 top_k 个互不重复的点（稳定排序，结果确定）
+
+        Args:
+            units: 单位坐标 (N, 3)
+            fitness: 适应度 (N,)
+
+        Returns:
+            (单位坐标, 适应度)，按适应度降序
+        """
+        top_k = self.grid_config.top_k
+        if len(fitness) > 4 * top_k:
+            # 先粗筛出足够多的候选，再排序去重
+            keep = np.argpartition(-fitness, 4 * top_k)[:4 * top_k]
+            units, fitness = units[keep], fitness[keep]
+        order = np.argsort(-fitness, kind="stable")
+        # 相邻细化盒子的边界点会重复评估，按单位坐标（量化到 1e-9）去重
+        _, first = np.unique(np.round(units[order] * 1e9), axis=0, return_index=True)
+        order = order[np.sort(first)[:top_k]]
+        return units[order], fitness[order]
+
+    def evolve(
+        self,
+        iterations_per_generation: int = 384,
+        deadline_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        执行网格细化搜索
+
+        Args:
+            iterations_per_generation: 保留兼容（未使用）
+            deadline_s: 墙钟时间上限（秒），默认取 config.deadline_s
+            max_evaluations: 物理模型评估次数上限，默认取 config.max_evaluations
+
+        Returns:
+            (最优参数, 最优适应度)
+        """
+        if deadline_s is None:
+            deadline_s = self.config.deadline_s
+        if max_evaluations is None:
+            max_evaluations = self.config.max_evaluations
+        grid = self.grid_config
+        start_time = time.perf_counter()
+        deadline_at = start_time + deadline_s if deadline_s is not None else None
+
+        # 粗网格：评估次数上限不足网格规模的两倍时按比例缩小各轴点数，留出一半预算用于细化
+        coarse = np.array(grid.coarse_points, dtype=np.intp)
+        if max_evaluations is not None and 2 * np.prod(coarse) > max_evaluations:
+            scale = (max_evaluations / (2 * np.prod(coarse))) ** (1.0 / 3.0)
+            coarse = np.maximum(2, (coarse * scale).astype(np.intp))
+        # 粗网格分块评估，块之间检查截止时间与评估次数；预算在粗网格阶段耗尽时不再细化
+        candidates = (np.empty((0, 3)), np.empty(0))
+        candidates, coarse_stop = self._evaluate_grid(
+            np.zeros((1, 3)), np.ones((1, 3)), coarse, candidates, deadline_at, max_evaluations
+        )
+        self.coarse_evaluations = self.evaluation_count
+        spacing = 1.0 / (coarse - 1)
+
+        refine = np.full(3, grid.refine_points, dtype=np.intp)
+        slowest_level = 0.0
+        stalled_levels = 0
+        self.stop_reason = coarse_stop or "refinements"
+        for level in range(0 if coarse_stop else grid.max_refinements):
+            if deadline_s is not None and time.perf_counter() - start_time + slowest_level > deadline_s:
+                self.stop_reason = "deadline"
+                break
+            # 剩余评估次数不足以细化全部候选时只细化最优的若干个
+            n_boxes = len(candidates[0])
+            if max_evaluations is not None:
+                n_boxes = min(n_boxes, (max_evaluations - self.evaluation_count) // int(np.prod(refine)))
+                if n_boxes <= 0:
+                    self.stop_reason = "max_evaluations"
+                    break
+
+            # 在每个候选点周围一个网格间距的范围内放大
+            level_start = time.perf_counter()
+            previous_best = float(candidates[1][0])
+            lower = np.clip(candidates[0][:n_boxes] - spacing, 0.0, 1.0)
+            upper = np.clip(candidates[0][:n_boxes] + spacing, 0.0, 1.0)
+            candidates, budget_stop = self._evaluate_grid(
+                lower, upper, refine, candidates, deadline_at, max_evaluations
+            )
+            spacing = 2.0 * spacing / (refine - 1)
+            self.refinements = level + 1
+            slowest_level = max(slowest_level, time.perf_counter() - level_start)
+            if budget_stop is not None:
+                self.stop_reason = budget_stop
+                break
+
+            improvement = (float(candidates[1][0]) - previous_best) / max(abs(previous_best), 1e-12)
+            stalled_levels = stalled_levels + 1 if improvement < grid.tolerance else 0
+            if stalled_levels >= grid.patience:
+                self.stop_reason = "converged"
+                break
+
+        self.elapsed_s = time.perf_counter() - start_time
+        print(f"Grid search finished ({self.stop_reason}): Best fitness = {self.best_fitness:.6f}, "
+              f"{self.refinements} refinements, {self.evaluation_count} evaluations, {self.elapsed_s:.3f}s")
+
+        return self._best_machining_parameters(), self.best_fitness
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（停止原因、细化轮数、粗网格评估点数、评估次数、可行点数）；
+            stop_reason 为 deadline / max_evaluations 且 refinements 为 0 时粗网格未评估完整
+        """
+        stats = super().get_statistics()
+        del stats["generations"]
+        stats["refinements"] = self.refinements
+        stats["coarse_evaluations"] = self.coarse_evaluations
+        return stats
@@ -0,0 +1,465 @@
+"""
+岛屿模型并行遗传算法
+种群划分为多个子种群（岛屿），各岛屿在常驻工作进程中独立进化，每隔若干代将最优个体迁移到相邻岛屿。
+种群与适应度存放在共享内存中：工作进程直接原地进化，迁移只在共享内存内复制个体，进程间不传输种群数据。
+每个岛屿的遗传算法在整个运行期间只创建一次，迁移周期之间保留其适应度缓存等状态。
+"""
+import math
+import time
+from dataclasses import replace
+from multiprocessing import shared_memory
+import multiprocessing as mp
+from typing import Dict, Any, List, Tuple, Optional
+import numpy as np
+
+from .microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+from .optimizer import Optimizer, register_optimizer
+
+
+def _attach_array(name: str, shape: Tuple[int, ...], dtype: str) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    挂接共享内存并创建数组视图
+
+    Args:
+        name: 共享内存名称
+        shape: 数组形状
+        dtype: 数组类型
+
+    Returns:
+        (共享内存对象, 数组视图)
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+class _IslandGroup:
+    """
+    一组岛屿的遗传算法
+
+    每个岛屿的遗传算法在整个运行期间只创建一次并挂接到共享内存中的种群，
+    迁移周期之间保留各岛屿的随机数流、适应度缓存、约束修复统计与进化状态。
+    """
+
+    def __init__(
+        self,
+        islands: List[int],
+        seeds: List[int],
+        config: GAConfig,
+        constraints: OptimizationConstraints,
+        populations: np.ndarray,
+        fitnesses: np.ndarray
+    ):
+        """
+        创建各岛屿的遗传算法
+
+        Args:
+            islands: 岛屿编号
+            seeds: 各岛屿的随机种子（主进程分配）
+            config: 岛屿配置
+            constraints: 约束条件
+            populations: 全部岛屿的种群 (n_islands, island_size, ...)
+            fitnesses: 全部岛屿的适应度 (n_islands, island_size)
+        """
+        self.gas: Dict[int, MicrobialGeneticAlgorithm] = {}
+        for island, seed in zip(islands, seeds):
+            # 直接挂接共享内存中的种群，不另外分配随机初始种群
+            self.gas[island] = MicrobialGeneticAlgorithm(
+                replace(config, seed=seed), constraints,
+                population=populations[island], fitness=fitnesses[island]
+            )
+
+    def run_epoch(
+        self,
+        start_generation: int,
+        n_generations: int,
+        deadline_at: float,
+        max_evaluations: Optional[int]
+    ) -> List[Tuple[int, int, int, Optional[str], Dict[str, int]]]:
+        """
+        各岛屿依次进化一个迁移周期
+
+        周期开始时评估迁移后仍未评估的个体（首个周期为整个初始种群），每代结束后评估本代被修改的个体，
+        因此周期结束时共享内存中的适应度与种群一致。
+
+        Args:
+            start_generation: 起始代数（用于自适应交叉/变异率）
+            n_generations: 最多进化的代数
+            deadline_at: 截止时间（time.time() 时间戳）
+            max_evaluations: 每个岛屿本周期的物理评估次数上限（None 表示不限制，初始种群的评估总会完成）
+
+        Returns:
+            各岛屿的 (岛屿编号, 本周期物理评估次数, 实际进化代数, 提前停止原因, 累计约束修复个体数)
+        """
+        results = []
+        for island, ga in self.gas.items():
+            evaluations_before = ga.evaluation_count
+            fitnesses = ga._evaluate_population()
+            # 每代至多修改一半个体（每对锦标赛的输者），它们须在本周期内评估
+            generation_cost = len(ga.population) // 2
+            generations_run = 0
+            stop_reason = None
+            slowest_generation = 0.0
+            for generation in range(start_generation, start_generation + n_generations):
+                if time.time() + slowest_generation > deadline_at:
+                    stop_reason = "deadline"
+                    break
+                used = ga.evaluation_count - evaluations_before
+                if max_evaluations is not None and used + generation_cost > max_evaluations:
+                    stop_reason = "max_evaluations"
+                    break
+                generation_start = time.perf_counter()
+                ga._adapt_rates(generation)
+                ga._generation_step(fitnesses)
+                fitnesses = ga._evaluate_population()
+                generations_run += 1
+                slowest_generation = max(slowest_generation, time.perf_counter() - generation_start)
+
+            repairs = ga.repair.get_counts() if ga.repair is not None else {}
+            results.append((island, ga.evaluation_count - evaluations_before, generations_run, stop_reason, repairs))
+        return results
+
+
+def _island_worker(
+    connection,
+    islands: List[int],
+    seeds: List[int],
+    config: GAConfig,
+    constraints: OptimizationConstraints,
+    population_spec: Tuple[str, Tuple[int, ...], str],
+    fitness_spec: Tuple[str, Tuple[int, ...], str]
+) -> None:
+    """
+    工作进程入口：挂接共享内存，为分配到的岛屿创建遗传算法，然后逐个执行主进程发来的迁移周期
+
+    Args:
+        connection: 与主进程通信的管道端（收到 None 时退出）
+        islands: 分配到本进程的岛屿编号
+        seeds: 各岛屿的随机种子
+        config: 岛屿配置
+        constraints: 约束条件
+        population_spec: 种群共享内存 (名称, 形状, 类型)
+        fitness_spec: 适应度共享内存 (名称, 形状, 类型)
+    """
+    population_shm, populations = _attach_array(*population_spec)
+    fitness_shm, fitnesses = _attach_array(*fitness_spec)
+    group = None
+    try:
+        group = _IslandGroup(islands, seeds, config, constraints, populations, fitnesses)
+        while True:
+            command = connection.recv()
+            if command is None:
+                break
+            connection.send(group.run_epoch(*command))
+    except Exception as exc:
+        # 异常交给主进程重新抛出
+        connection.send(exc)
+    finally:
+        # 释放所有视图后才能关闭共享内存
+        del group, populations, fitnesses
+        population_shm.close()
+        fitness_shm.close()
+        connection.close()
+
+
+@register_optimizer("island")
+class IslandModelGA(Optimizer):
+    """岛屿模型遗传算法（接口与 MicrobialGeneticAlgorithm 一致）"""
+
+    def __init__(self, config: GAConfig, constraints: OptimizationConstraints):
+        """
+        初始化岛屿模型
+
+        Args:
+            config: 算法配置（n_islands、migration_interval、migration_size 控制岛屿与迁移）
+            constraints: 约束条件
+        """
+        self.config = config
+        self.constraints = constraints
+        self.n_islands = max(1, config.n_islands)
+        self.island_size = config.population_size // self.n_islands
+        if self.island_size < 2:
+            raise ValueError(
+                f"种群大小 {config.population_size} 不足以划分为 {self.n_islands} 个岛屿"
+            )
+
+        # 各岛屿使用的配置：预算由主进程统一控制；共享内存中的种群大小固定，不使用自适应种群规模；
+        # 种群在共享内存中，不使用内存映射检查点
+        self.island_config = replace(
+            config,
+            population_size=self.island_size,
+            n_islands=1,
+            deadline_s=None,
+            max_evaluations=None,
+            adaptive_population=False,
+            checkpoint_dir=None,
+        )
+
+        # 主进程中的 GA 负责初始化种群、解码最优个体与计算最终加工参数
+        self.ga = MicrobialGeneticAlgorithm(
+            replace(config, n_islands=1, adaptive_population=False, checkpoint_dir=None), constraints
+        )
+        self.plan = self.ga.plan
+
+        if config.enable_parallel:
+            self.n_workers = min(self.n_islands, config.n_workers or mp.cpu_count())
+        else:
+            self.n_workers = 1
+
+        self.monitor = self.ga._create_monitor()
+        self.best_individual = None
+        self.best_fitness = float('-inf')
+        self.evaluation_count = 0
+        self.generations_run = 0
+        self.migrations = 0
+        self.repairs: Dict[str, int] = {}
+        self.elapsed_s = 0.0
+        self.stop_reason = None
+
+    def _migrate(self, populations: np.ndarray, fitnesses: np.ndarray) -> None:
+        """
+        环形迁移：第 i 个岛屿的最优个体替换第 i+1 个岛屿的最差个体（连同适应度，无需重新评估）
+
+        Args:
+            populations: 各岛屿种群 (n_islands, island_size, ...)
+            fitnesses: 各岛屿适应度 (n_islands, island_size)
+        """
+        migration_size = min(self.config.migration_size, self.island_size // 2)
+        if self.n_islands < 2 or migration_size <= 0:
+            return
+
+        rows = np.arange(self.n_islands)[:, np.newaxis]
+        best = np.argpartition(-fitnesses, migration_size - 1, axis=1)[:, :migration_size]
+        worst = np.argpartition(fitnesses, migration_size - 1, axis=1)[:, :migration_size]
+
+        migrants = np.roll(populations[rows, best], 1, axis=0)
+        migrant_fitness = np.roll(fitnesses[rows, best], 1, axis=0)
+        populations[rows, worst] = migrants
+        fitnesses[rows, worst] = migrant_fitness
+        self.migrations += 1
+
+    def _initial_populations(self) -> np.ndarray:
+        """
+        将主进程 GA 的初始种群分配到各岛屿
+
+        按行轮流分配（第 k 个个体进入第 k % n_islands 个岛屿）：初始种群前部的热启动个体
+        （历史最优解及其邻居）均匀分布到所有岛屿，而不是全部落在第一个岛屿。
+
+        Returns:
+            各岛屿种群 (n_islands, island_size, ...)
+        """
+        initial = self.ga.population[:self.n_islands * self.island_size]
+        rows = initial.reshape((self.island_size, self.n_islands) + initial.shape[1:])
+        return np.ascontiguousarray(np.swapaxes(rows, 0, 1))
+
+    def evolve(
+        self,
+        iterations_per_generation: int = 384,
+        deadline_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        执行岛屿模型进化
+
+        每个迁移周期内各岛屿并行进化 migration_interval 代，周期结束后在主进程中迁移并检查早停与预算。
+        剩余评估次数平均分配给各岛屿，周期内的代数受其限制（初始种群的评估总会完成）。
+
+        Args:
+            iterations_per_generation: 每代迭代次数（保留兼容）
+            deadline_s: 墙钟时间上限（秒），默认取 config.deadline_s
+            max_evaluations: 物理模型评估次数上限，默认取 config.max_evaluations
+
+        Returns:
+            (最优参数, 最优适应度)
+        """
+        if deadline_s is None:
+            deadline_s = self.config.deadline_s
+        if max_evaluations is None:
+            max_evaluations = self.config.max_evaluations
+        start_time = time.perf_counter()
+        deadline_at = time.time() + deadline_s if deadline_s is not None else math.inf
+
+        # 共享内存中的种群与适应度
+        initial = self._initial_populations()
+        shape = initial.shape
+        population_shm = shared_memory.SharedMemory(create=True, size=initial.nbytes)
+        fitness_shm = shared_memory.SharedMemory(
+            create=True, size=self.n_islands * self.island_size * np.dtype(np.float64).itemsize
+        )
+        populations = np.ndarray(shape, dtype=initial.dtype, buffer=population_shm.buf)
+        fitnesses = np.ndarray(shape[:2], dtype=np.float64, buffer=fitness_shm.buf)
+        populations[:] = initial
+        fitnesses[:] = -np.inf
+
+        population_spec = (population_shm.name, shape, initial.dtype.str)
+        fitness_spec = (fitness_shm.name, shape[:2], np.dtype(np.float64).str)
+
+        # 各岛屿的遗传算法在整个运行期间保持：并行时岛屿轮流分配给常驻工作进程，串行时在主进程中
+        seeds = [int(seed) for seed in self.ga.rng.integers(0, 2 ** 63 - 1, self.n_islands)]
+        workers = []
+        group = None
+
+        try:
+            if self.n_workers > 1:
+                for worker in range(self.n_workers):
+                    islands = list(range(worker, self.n_islands, self.n_workers))
+                    connection, child_connection = mp.Pipe()
+                    process = mp.Process(
+                        target=_island_worker,
+                        args=(child_connection, islands, [seeds[i] for i in islands], self.island_config,
+                              self.constraints, population_spec, fitness_spec),
+                        daemon=True,
+                    )
+                    process.start()
+                    child_connection.close()
+                    workers.append((process, connection))
+            else:
+                group = _IslandGroup(
+                    list(range(self.n_islands)), seeds, self.island_config, self.constraints, populations, fitnesses
+                )
+
+            generation = 0
+            slowest_epoch = 0.0
+            island_repairs: Dict[int, Dict[str, int]] = {}
+            self.stop_reason = "generations"
+
+            while generation < self.config.generations:
+                # 预算检查：下一个迁移周期预计超时、或剩余评估次数不足以让各岛屿再进化一代时停止
+                island_budget = None
+                if max_evaluations is not None:
+                    island_budget = max(0, max_evaluations - self.evaluation_count) // self.n_islands
+                if generation > 0:
+                    if time.time() + slowest_epoch > deadline_at:
+                        self.stop_reason = "deadline"
+                        break
+                    if island_budget is not None and island_budget < self.island_size // 2:
+                        self.stop_reason = "max_evaluations"
+                        break
+
+                epoch_start = time.perf_counter()
+                n_generations = min(self.config.migration_interval, self.config.generations - generation)
+                command = (generation, n_generations, deadline_at, island_budget)
+                if workers:
+                    for _, connection in workers:
+                        connection.send(command)
+                    results = []
+                    for _, connection in workers:
+                        result = connection.recv()
+                        if isinstance(result, Exception):
+                            raise result
+                        results.extend(result)
+                else:
+                    results = group.run_epoch(*command)
+
+                epoch_evaluations = 0
+                epoch_generations = 0
+                epoch_stop_reason = None
+                for island, evaluations, generations_run, stop_reason, repairs in results:
+                    epoch_evaluations += evaluations
+                    epoch_generations = max(epoch_generations, generations_run)
+                    epoch_stop_reason = epoch_stop_reason or stop_reason
+                    island_repairs[island] = repairs
+                self.evaluation_count += epoch_evaluations
+                self.repairs = {}
+                for repairs in island_repairs.values():
+                    for name, count in repairs.items():
+                        self.repairs[name] = self.repairs.get(name, 0) + count
+                generation += epoch_generations
+                self.generations_run = generation
+                slowest_epoch = max(slowest_epoch, time.perf_counter() - epoch_start)
+
+                # 跟踪全局最优个体
+                best_island, best_idx = np.unravel_index(np.argmax(fitnesses), fitnesses.shape)
+                best_fitness = float(fitnesses[best_island, best_idx])
+                if best_fitness > self.best_fitness:
+                    self.best_fitness = best_fitness
+                    self.best_individual = populations[best_island, best_idx].copy()
+
+                # 收敛检查与备选方案存档基于全部岛屿（迁移前）的种群
+                snapshot = self.monitor.update(
+                    populations.reshape((-1,) + shape[2:]), fitnesses.ravel(), self.best_fitness, epoch_generations
+                )
+                if self.ga.archive is not None:
+                    self.ga._update_archive(populations.reshape((-1,) + shape[2:]), fitnesses.ravel())
+                self._migrate(populations, fitnesses)
+
+                if epoch_generations < n_generations and epoch_stop_reason is not None:
+                    # 岛屿因截止时间或评估预算提前结束
+                    self.stop_reason = epoch_stop_reason
+                    break
+                stop_reason = self.monitor.should_stop()
+                if stop_reason is not None:
+                    print(f"Stop at generation {generation} ({stop_reason}: "
+                          f"diversity={snapshot.hamming_distance:.4f}, elite spread={snapshot.elite_spread:.2e}, "
+                          f"no improvement for {self.monitor.stagnant_generations} generations)")
+                    self.stop_reason = stop_reason
+                    break
+
+                print(f"Generation {generation}: Best fitness = {self.best_fitness:.6f}, "
+                      f"Islands = {self.n_islands}, Migrations = {self.migrations}")
+
+            # 局部精修（预算已耗尽时跳过）：在共享内存释放前从全部岛屿中选取起点
+            best_params = self.ga._translate_dna(self.best_individual)
+            if self.config.polish and self.stop_reason not in ("deadline", "max_evaluations"):
+                polished_params, polished_fitness = self.ga._polish(
+                    populations.reshape((-1,) + shape[2:]), fitnesses.ravel()
+                )
+                self.evaluation_count += self.ga.polish_stats["evaluations"]
+                if polished_fitness > self.best_fitness:
+                    best_params, self.best_fitness = polished_params, polished_fitness
+        finally:
+            for process, connection in workers:
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                connection.close()
+            for process, _ in workers:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            del group, populations, fitnesses
+            population_shm.close()
+            population_shm.unlink()
+            fitness_shm.close()
+            fitness_shm.unlink()
+
+        self.elapsed_s = time.perf_counter() - start_time
+        if self.stop_reason in ("deadline", "max_evaluations"):
+            print(f"Budget exhausted ({self.stop_reason}) after {self.generations_run} generations, "
+                  f"{self.evaluation_count} evaluations, {self.elapsed_s:.2f}s")
+
+        best_machining_params = self.ga._calculate_machining_parameters(best_params)
+        return best_machining_params, self.best_fitness
+
+    def get_alternatives(self) -> List[Dict[str, float]]:
+        """
+        获取备选方案（各迁移周期结束时从全部岛屿中收集）
+
+        Returns:
+            互不相近的可行解的加工参数列表（含 fitness），按适应度降序
+        """
+        return self.ga.get_alternatives()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（停止原因、代数、评估次数、岛屿与迁移信息）
+        """
+        stats = {
+            "stop_reason": self.stop_reason,
+            "generations": self.generations_run,
+            "evaluations": self.evaluation_count,
+            "elapsed_s": round(self.elapsed_s, 4),
+            "n_islands": self.n_islands,
+            "n_workers": self.n_workers,
+            "migrations": self.migrations,
+        }
+        if self.repairs:
+            stats["repairs"] = dict(self.repairs)
+        if self.ga.polish_stats:
+            stats["polish"] = dict(self.ga.polish_stats)
+        if self.monitor.latest is not None:
+            stats["convergence"] = self.monitor.latest.to_dict()
+        return stats
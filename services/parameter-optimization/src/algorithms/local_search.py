@@ -0,0 +1,133 @@
+"""
+局部精修模块
+进化结束后，从前 K 个个体出发在连续的 (转速, 进给, 切深) 上做模式搜索（坐标方向搜索），
+弥补二进制基因分辨率的限制。所有起点同时搜索，每轮的全部试探点一次向量化评估。
+进给以每齿进给 fz = f/(z·n) 为坐标：每齿进给、刀具寿命等约束的边界近似为 fz 恒定的斜带，
+在 (n, fz) 坐标下沿边界移动只需改变转速一个坐标。
+只接受适应度提高的移动，因此从可行解出发时始终停留在可行域内。
+"""
+from typing import Tuple
+import numpy as np
+
+from .evaluator import EvaluatorPlan
+from .genome import DecodingBounds
+from .objectives import ArrayObjective, mrr_objective
+
+
+class PatternSearch:
+    """向量化模式搜索"""
+
+    def __init__(
+        self,
+        plan: EvaluatorPlan,
+        bounds: DecodingBounds,
+        objective: ArrayObjective = mrr_objective,
+        initial_step: float = 0.02,
+        tolerance: float = 1e-7,
+        max_iterations: int = 200
+    ):
+        """
+        初始化模式搜索
+
+        Args:
+            plan: 评估计划（物理模型与约束惩罚）
+            bounds: 参数边界（搜索不越出该范围）
+            objective: 向量化目标函数
+            initial_step: 初始步长（相对参数范围）
+            tolerance: 步长低于该值（相对参数范围）时停止
+            max_iterations: 最大迭代轮数
+        """
+        self.plan = plan
+        self.bounds = bounds
+        self.objective = objective
+        c = plan.constraints
+        # 搜索坐标：转速、每齿进给、切深
+        self.teeth = c.tool_teeth
+        self.lower = np.array([bounds.speed[0], 0.0, bounds.cut_depth[0]], dtype=float)
+        self.span = np.array([
+            bounds.speed[1] - bounds.speed[0],
+            c.max_feed_per_tooth,
+            bounds.cut_depth[1] - bounds.cut_depth[0],
+        ], dtype=float)
+        self.initial_step = initial_step
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+        # 坐标方向 ±e_i
+        self.directions = np.concatenate([np.eye(3), -np.eye(3)])
+        self.evaluation_count = 0
+        self.iterations = 0
+
+    def _to_values(self, points: np.ndarray) -> np.ndarray:
+        """
+        相对坐标转换为参数取值
+
+        Args:
+            points: 相对坐标 (N, 3)，各轴取值范围 [0, 1]
+
+        Returns:
+            参数 (N, 3)，列为转速、进给、切深（进给限制在进给边界内）
+        """
+        speed, feed_per_tooth, cut_depth = (self.lower + points * self.span).T
+        feed = np.clip(feed_per_tooth * self.teeth * speed, *self.bounds.feed)
+        return np.stack([speed, feed, cut_depth], axis=1)
+
+    def _evaluate(self, points: np.ndarray) -> np.ndarray:
+        """
+        评估相对坐标点
+
+        Args:
+            points: 相对坐标 (N, 3)，各轴取值范围 [0, 1]
+
+        Returns:
+            适应度 (N,)
+        """
+        values = self._to_values(points)
+        self.evaluation_count += len(points)
+        return self.plan.evaluate_parameters(values[:, 0], values[:, 1], values[:, 2], self.objective)["fitness"]
+
+    def run(self, speed: np.ndarray, feed: np.ndarray, cut_depth: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        从一组起点同时执行模式搜索
+
+        每轮对每个未收敛的点评估 6 个坐标方向上的试探点：有改进时移动到最优试探点并把步长加倍（不超过参数范围的一半），
+        否则步长减半；步长低于容差的点不再参与评估。
+
+        Args:
+            speed: 起点转速 (K,)
+            feed: 起点进给 (K,)
+            cut_depth: 起点切深 (K,)
+
+        Returns:
+            (精修后的参数 (K, 3)，列为转速、进给、切深；对应适应度 (K,))
+        """
+        speed = np.asarray(speed, dtype=float)
+        feed_per_tooth = np.asarray(feed, dtype=float) / (self.teeth * np.maximum(speed, 1e-9))
+        values = np.stack([speed, feed_per_tooth, np.asarray(cut_depth, dtype=float)], axis=1)
+        span = np.where(self.span > 0, self.span, 1.0)
+        points = np.clip((values - self.lower) / span, 0.0, 1.0)
+        fitness = self._evaluate(points)
+        steps = np.full(len(points), self.initial_step)
+
+        for iteration in range(self.max_iterations):
+            active = np.flatnonzero(steps >= self.tolerance)
+            if len(active) == 0:
+                break
+            self.iterations = iteration + 1
+
+            # 全部活动点的全部试探点一次评估 (A, 6, 3)
+            trials = points[active, np.newaxis, :] + steps[active, np.newaxis, np.newaxis] * self.directions
+            trials = np.clip(trials, 0.0, 1.0)
+            trial_fitness = self._evaluate(trials.reshape(-1, 3)).reshape(len(active), -1)
+
+            best = np.argmax(trial_fitness, axis=1)
+            best_fitness = trial_fitness[np.arange(len(active)), best]
+            improved = best_fitness > fitness[active]
+
+            moved = active[improved]
+            points[moved] = trials[improved, best[improved]]
+            fitness[moved] = best_fitness[improved]
+            steps[moved] = np.minimum(2.0 * steps[moved], 0.5)
+            steps[active[~improved]] *= 0.5
+
+        return self._to_values(points), fitness
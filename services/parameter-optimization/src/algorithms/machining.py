@@ -0,0 +1,212 @@
+"""
+加工参数计算
+由 (转速, 进给, 切深) 与约束条件中的刀具、材料、机床参数计算一组加工参数的完整明细（标量版本），
+遗传算法与连续参数优化器共用，用于返回最优解的加工参数。
+"""
+from typing import Dict
+import logging
+import math
+
+from ..config.constants import MachiningMethod, PhysicalConstants
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_machining_parameters(params: Dict[str, float], constraints) -> Dict[str, float]:
+    """
+    计算加工参数
+
+    Args:
+        params: 基本参数 {speed, feed, cut_depth}
+        constraints: 约束条件（OptimizationConstraints）
+
+    Returns:
+        加工参数字典
+    """
+    c = constraints
+    n = params["speed"]
+    f = params["feed"]
+    ap = params["cut_depth"]  # 修复：params["cut_depth"] 已经是实际切深，不需要再乘
+    ae = c.cut_width
+
+    # 每齿进给量
+    fz = f / (c.tool_teeth * n) if n > 0 else 0
+
+    # 切削速度
+    vc = (n * c.tool_diameter) / 318.0 + 0.1 if n > 0 else 0  # 与旧版本保持一致
+
+    # 根据加工方法计算参数
+    if c.machining_method == MachiningMethod.MILLING:
+        return _milling_parameters(c, n, f, ap, ae, vc, fz)
+    elif c.machining_method == MachiningMethod.DRILLING:
+        return _drilling_parameters(c, n, f, vc, fz)
+    else:  # BORING
+        return _boring_parameters(c, n, f, ap, ae, vc, fz)
+
+
+def _milling_parameters(
+    c, n: float, f: float, ap: float, ae: float, vc: float, fz: float
+) -> Dict[str, float]:
+    """计算铣削参数"""
+    # 材料去除率
+    q = f * ap * ae / 1000 + 1e-7
+
+    # 刀具寿命
+    lft = (
+        c.tool_life_coefficient *
+        (vc ** c.speed_coefficient) *
+        (fz ** c.feed_coefficient) *
+        c.wear_coefficient
+    )
+
+    # 表面粗糙度
+    rz = PhysicalConstants.MILLING_ROUGHNESS_FACTOR * (fz ** 2) / c.tool_diameter
+    rx = (fz * c.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / c.tool_diameter
+
+    # 平均切屑厚度
+    if ae / c.tool_diameter <= 0.3:
+        hm = fz * (ae / c.tool_diameter) ** 0.5
+    else:
+        # 确保 asin 的输入在有效范围内 [-1, 1]
+        ratio = min(1.0, max(-1.0, (ae - 0.5 * c.tool_diameter) / (0.5 * c.tool_diameter)))
+        # 修复：fs 应该是角度（度），不是弧度
+        fs = 90 + math.asin(ratio) * 180 / math.pi
+        hm = 1147 * fz * math.sin(c.main_cutting_angle * math.pi / 180) * (ae / c.tool_diameter) / fs
+
+    # 单位切削力
+    kc = (1 - 0.01 * c.rake_angle) * c.material_coefficient / (hm ** c.material_slope + 1e-3)
+
+    # 功率和扭矩（瓦尔特功率计算公式）
+    # pmot = Q * kc / 60000 / machine_efficiency (Kw)
+    # 备用：山德威克功率计算公式（Sandvik Power Formula）
+    # pmot = AE * ap * f * KC11 / 60037200 / machine_efficiency (Kw)
+    pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / c.machine_efficiency
+    tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
+
+    # 进给力计算（铣削）- 修正公式
+    # 主切削力 Fc = kc × ap × ae / (齿数) (N)
+    # 进给力 Ff = Fc × 系数 (取决于前角和主偏角)
+    cutting_force = kc * ap * ae / c.tool_teeth  # 主切削力 (N)
+    # 进给力系数：前角越大，进给力越小；主偏角越大，进给力越小
+    feed_force_coeff = 0.3 + 0.2 * (1.0 - c.rake_angle / 20.0) * (90.0 / c.main_cutting_angle)
+    ff = cutting_force * feed_force_coeff  # 进给力 (N)
+
+    # 刀具挠度计算（悬臂梁模型）
+    # 截面惯性矩: I = π * D⁴ / 64
+    moment_of_inertia = 3.14159 * (c.tool_diameter ** 4) / 64.0
+    # 挠度: δ = (F * L³) / (3 * E * I)
+    tool_deflection = (ff * (c.tool_overhang_length ** 3)) / (3.0 * c.tool_elastic_modulus * moment_of_inertia)
+
+    logger.warning(f"调试 - _milling_parameters返回: n={n:.1f}, f={f:.1f}, ap={ap:.2f}, ae={ae:.2f}")
+    logger.warning(f"调试 - _milling_parameters物理: hm={hm:.4f}, kc={kc:.1f}, q={q:.2f}, pmot={pmot:.2f}, tnm={tnm:.2f}, ff={ff:.1f}, deflection={tool_deflection:.4f}")
+
+    return {
+        "speed": n,
+        "feed": f,
+        "cut_depth": ap,
+        "cut_width": ae,
+        "material_removal_rate": q,
+        "tool_life": lft,
+        "bottom_roughness": rz,
+        "side_roughness": rx,
+        "power": pmot,
+        "torque": tnm,
+        "feed_force": ff,
+        "feed_per_tooth": fz,
+        "cutting_speed": vc,
+        "tool_deflection": tool_deflection,
+    }
+
+
+def _drilling_parameters(
+    c, n: float, f: float, vc: float, fz: float
+) -> Dict[str, float]:
+    """计算钻孔参数"""
+    # 材料去除率
+    q = f * math.pi * c.tool_diameter ** 2 / 4000 + 1e-7
+
+    # 刀具寿命
+    lft = (
+        c.tool_life_coefficient *
+        (vc ** c.speed_coefficient) *
+        (fz ** c.feed_coefficient) *
+        c.wear_coefficient
+    )
+
+    # 平均切屑厚度
+    h = fz * math.sin(c.main_cutting_angle * math.pi / 180)
+
+    # 单位切削力
+    kc = c.material_coefficient / (h ** c.material_slope + 1e-3)
+
+    # 功率和扭矩
+    pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / c.machine_efficiency
+    tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
+
+    # 进给力
+    ff = 0.63 * fz * c.tool_teeth * c.tool_diameter * kc / 2
+
+    return {
+        "speed": n,
+        "feed": f,
+        "cut_depth": 0.0,
+        "cut_width": 0.0,
+        "material_removal_rate": q,
+        "tool_life": lft,
+        "bottom_roughness": 0.0,
+        "side_roughness": 0.0,
+        "power": pmot,
+        "torque": tnm,
+        "feed_force": ff,
+        "feed_per_tooth": fz,
+        "cutting_speed": vc,
+    }
+
+
+def _boring_parameters(
+    c, n: float, f: float, ap: float, ae: float, vc: float, fz: float
+) -> Dict[str, float]:
+    """计算镗孔参数"""
+    # 材料去除率
+    q = f * math.pi * (c.tool_diameter ** 2 - c.bottom_hole_diameter ** 2) / 4000 + 1e-7
+
+    # 刀具寿命
+    lft = (
+        c.tool_life_coefficient *
+        (vc ** c.speed_coefficient) *
+        (fz ** c.feed_coefficient) *
+        c.wear_coefficient
+    )
+
+    # 表面粗糙度
+    rx = (fz * c.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / c.tool_radius
+
+    # 平均切屑厚度
+    h = fz * math.sin(c.main_cutting_angle * math.pi / 180) + 1e-7
+
+    # 单位切削力
+    kc = c.material_coefficient / (h ** c.material_slope + 1e-7)
+
+    # 功率和扭矩（瓦尔特功率计算公式）
+    pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / c.machine_efficiency
+    tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
+
+    # 进给力计算（镗孔）- 参照旧版公式
+    # 进给力与钻孔类似，但受底孔直径影响（切削面积减小）
+    ff = 0.63 * fz * c.tool_teeth * (c.tool_diameter - c.bottom_hole_diameter) * kc / 2
+
+    return {
+        "speed": n,
+        "feed": f,
+        "cut_depth": ap,
+        "cut_width": ae,
+        "material_removal_rate": q,
+        "tool_life": lft,
+        "bottom_roughness": 0.0,
+        "side_roughness": rx,
+        "power": pmot,
+        "torque": tnm,
+        "feed_force": ff,
+        "feed_per_tooth": fz,
+        "cutting_speed": vc,
+    }
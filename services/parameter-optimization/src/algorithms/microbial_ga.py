@@ -3,43 +3,141 @@
 重构版本：模块化、可配置、可测试
 优化版本：并行化、早停机制、自适应参数、向量化计算
 """
-from dataclasses import dataclass
-from typing import Callable, Tuple, List, Dict, Any
+from dataclasses import dataclass, asdict, replace
+from pathlib import Path
+from typing import Tuple, List, Dict, Any, Optional
 import numpy as np
-import math
+import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import multiprocessing as mp
 
 from ..config.constants import (
     DNAEncoding,
     ConstraintPenalty,
-    PhysicalConstants,
     MachiningMethod
 )
+from .genome import (
+    GENE_NAMES,
+    DecodingBounds,
+    GenomeLayout,
+    decode_parameters,
+    encode_genes,
+    unscale_values,
+    is_packed,
+    unpack_population,
+    random_packed_population,
+    random_bit_masks,
+    packed_crossover,
+    packed_mutate,
+)
+from .evaluator import EvaluatorPlan, FitnessCache, get_evaluator_plan
+from .convergence import ConvergenceMonitor
+from .repair import ConstraintRepair
+from .local_search import PatternSearch
+from .archive import SolutionArchive
+from .checkpoint import PopulationCheckpoint
+from .objectives import ArrayObjective, ObjectiveType, get_array_objective
+from .optimizer import Optimizer, register_optimizer
+from .machining import calculate_machining_parameters
 
 
 @dataclass
 class GAConfig:
     """遗传算法配置"""
-    dna_size: int = DNAEncoding.total_bits()
-    population_size: int = 10240
+    dna_size: int = DNAEncoding.total_bits()  # 保留兼容，实际 DNA 长度由 gene_bits 决定
+    population_size: int = 10240  # 种群大小（自适应种群规模时为上限）
     generations: int = 200
     crossover_rate: float = 0.6
     mutation_rate: float = 0.3
-    early_stop_generations: int = 50
+    early_stop_generations: int = 50  # 最优适应度连续无改进的最大代数（兜底）
+    
+    # 优化目标（向量化目标函数注册表 objectives.OBJECTIVES 中的名称）
+    objective: str = ObjectiveType.MAXIMIZE_MRR.value
+    
+    # 收敛判据（见 ConvergenceMonitor）
+    convergence_window: int = 20    # 改进速率统计窗口（代）
+    improvement_tol: float = 1e-4   # 窗口内相对改进低于该值视为停滞
+    min_diversity: float = 0.05     # 平均汉明距离（相对 DNA 长度）低于该值视为多样性坍缩
+    elite_spread_tol: float = 1e-3  # 精英层（p90 ~ p99）相对离散度低于该值视为趋同
+    
+    # 自适应种群规模：从 initial_population_size 个个体开始，较小的种群即将判定收敛、或多样性坍缩而最优解仍不可行时
+    # 注入拉丁超立方抽样的新个体，种群按 population_growth 倍增长，上限 population_size
+    adaptive_population: bool = False
+    initial_population_size: int = 512
+    population_growth: float = 2.0
+    
+    # 运行预算（None 表示不限制），预算耗尽时返回当前最优解
+    deadline_s: Optional[float] = None     # 墙钟时间上限（秒）
+    max_evaluations: Optional[int] = None  # 物理模型评估次数上限
     
     # 并行化配置
     enable_parallel: bool = True
     n_workers: int = None  # None 表示使用所有 CPU 核心
+    evaluation_chunk_size: int = 1 << 15  # 分块评估的块大小：超过一块的种群分块在线程池中评估，峰值内存不随种群增长
+    
+    # 岛屿模型配置（n_islands > 1 时各子种群在工作进程中独立进化，定期迁移最优个体）
+    n_islands: int = 1
+    migration_interval: int = 10  # 每隔多少代迁移一次
+    migration_size: int = 8       # 每个岛屿每次迁出的个体数
     
     # 增量优化配置
-    batch_size: int = 128  # 每批处理的个体数量
+    batch_size: int = 128  # 每批处理的个体数量（整代向量化后仅保留兼容）
     adaptive_rate: bool = True  # 自适应交叉和变异率
     
+    # 随机数（每次运行独立的 Generator，指定种子可复现结果）
+    seed: Optional[int] = None
+    
+    # 基因组表示
+    packed_genome: bool = False  # 使用 uint64 位打包基因组（内存占用约为位矩阵的 1/36）
+    
+    # 约束修复（需显式开启）：评估前将个体投影到线速度、每齿进给、功率/扭矩的解析可行域
+    # （钻孔/镗孔的功率修复为近似，修复后仍可能少量不可行）
+    enable_repair: bool = False
+    
+    # 分阶段评估（需显式开启）：违反线速度/每齿进给约束的个体不运行完整计算核，只计这两项惩罚，
+    # 这些不可行个体之间及与完整评估相比的排序会改变（锦标赛选择随之改变），仅在更看重速度时使用
+    staged_evaluation: bool = False
+    
+    # 适应度缓存配置
+    enable_fitness_cache: bool = False  # 按基因组缓存适应度（低变异率、种群收敛后重复个体多时收益明显）
+    fitness_cache_size: int = 1 << 16  # 缓存最大条目数（LRU 淘汰）
+    
     # 参数边界
-    speed_bound: Tuple[float, float] = (0, 8000)      # 转速边界
-    feed_bound: Tuple[float, float] = (0, 8000)        # 进给边界
-    cut_depth_bound: Tuple[float, float] = (0.0, 1.0)  # 切深百分比边界
+    # 基因解码到 [lo, hi]：边界越窄，同样的位数分辨率越高
+    speed_bound: Tuple[float, float] = (0, 8000)      # 转速边界 (r/min)
+    feed_bound: Tuple[float, float] = (0, 8000)        # 进给边界 (mm/min)
+    cut_depth_bound: Tuple[float, Optional[float]] = (0.0, None)  # 切深边界 (mm)，上限 None 表示约束中的最大切深（也不会超过它）
+    log_scale: bool = False  # 转速与进给按对数刻度解码（下限分别不低于 1 r/min、0.1 mm/min）
+    
+    # 基因组分辨率：(转速位数, 进给位数, 切深位数)，DNA 布局与解码权重由此导出
+    # 位数少则搜索空间小、收敛快，可先用粗分辨率快速求解，需要时再提高分辨率
+    gene_bits: Tuple[int, int, int] = (DNAEncoding.SPEED_BITS, DNAEncoding.FEED_BITS, DNAEncoding.CUT_DEPTH_BITS)
+    gray_code: bool = False  # 基因按格雷码编码（相邻取值只差一位，变异可以做小步移动）
+    
+    # 局部精修：进化结束后从适应度最高的若干个个体出发，在连续参数上做模式搜索
+    # 精修负责最后的微调，可配合较小的 generations 缩短总耗时
+    polish: bool = False
+    polish_top_k: int = 8              # 精修起点数
+    polish_max_iterations: int = 200   # 模式搜索最大迭代轮数
+    
+    # 备选方案：保留适应度最高且互不相近的可行解（0 表示不保留）
+    n_alternatives: int = 0
+    alternative_min_distance: float = 0.05  # 归一化参数空间中两方案的最小距离
+    
+    # 热启动：历史最优解 (转速, 进给, 切深) 原样编码放入初始种群，并在其周围生成变异邻居，
+    # 合计占初始种群的 warm_start_fraction，其余个体仍随机生成以保持多样性
+    warm_start: Tuple[Tuple[float, float, float], ...] = ()
+    warm_start_fraction: float = 0.1
+    warm_start_spread: float = 0.02  # 邻居在各基因整数值上扰动的标准差（相对基因取值范围）
+    warm_start_patience: int = 10    # 热启动时最优适应度连续无改进的最大代数（替代 early_stop_generations）
+    
+    # 多目标优化（algorithm=nsga2）的目标，可选值见 objectives.PARETO_OBJECTIVES
+    pareto_objectives: Tuple[str, ...] = ("material_removal_rate", "tool_life")
+    
+    # 检查点：种群与适应度保存在 checkpoint_dir 下的内存映射文件中，每 checkpoint_interval 代原子写入检查点，
+    # 进程重启后可用 MicrobialGeneticAlgorithm.resume() 从检查点继续（None 表示不使用）
+    checkpoint_dir: Optional[str] = None
+    checkpoint_interval: int = 10
 
 
 @dataclass
@@ -92,216 +190,61 @@ class OptimizationConstraints:
     max_cut_depth: float = 5.0  # 最大切深调整为5mm（更合理）
 
 
-def evaluate_vectorized(population: np.ndarray, constraints_dict: Dict) -> np.ndarray:
+def decoding_bounds(config: GAConfig, constraints: OptimizationConstraints) -> DecodingBounds:
     """
-    向量化评估适应度（批量计算，避免进程开销）
-    
+    由配置边界与约束条件确定基因解码边界（遗传算法与连续参数优化器共用）
+
     Args:
-        population: 种群矩阵 (N, dna_size)
-        constraints_dict: 约束字典
-    
+        config: 算法配置（参数边界、对数刻度与基因组分辨率）
+        constraints: 约束条件
+
     Returns:
-        适应度数组
+        解码边界（切深上限不超过约束中的最大切深，配置上限为 None 时即为最大切深）
     """
-    N = population.shape[0]
-    fitnesses = np.zeros(N)
-    
-    # 提取约束
-    constraints = OptimizationConstraints(**constraints_dict)
-    
-    # 向量化解码（使用正确的位范围）
-    speed_bits = population[:, :16]
-    feed_bits = population[:, 16:29]
-    cut_depth_bits = population[:, 29:]
-    
-    # 计算每位权重（从高位到低位，与旧版本保持一致）
-    speed_weights = 2 ** np.arange(16)[::-1]
-    feed_weights = 2 ** np.arange(13)[::-1]
-    cut_depth_weights = 2 ** np.arange(7)[::-1]
-    
-    # 向量化解码参数（与旧版本完全一致：直接乘以边界上限）
-    speed_vals = np.dot(speed_bits, speed_weights) / (2**16 - 1)
-    speed = speed_vals * 8000  # 旧版本：直接乘以 MAX_SPEED
-    
-    feed_vals = np.dot(feed_bits, feed_weights) / (2**13 - 1)
-    feed = feed_vals * 8000  # 旧版本：直接乘以 MAX_FEED
-    
-    cut_depth_vals = np.dot(cut_depth_bits, cut_depth_weights) / (2**7 - 1)
-    cut_depth = cut_depth_vals * constraints.max_cut_depth  # 修复：使用配置的最大切深而不是硬编码的1.0
-    
-    # 参数边界检查
-    n = np.maximum(speed, 1.0)
-    f = np.maximum(feed, 0.1)
-    ap = cut_depth  # 修复：cut_depth 已经是实际切深（0-max_cut_depth），不需要再乘
-    ae = constraints.cut_width
-    
-    # 向量化计算
-    fz = f / (constraints.tool_teeth * n)
-    vc = (n * constraints.tool_diameter) / 318.0 + 0.1  # 与旧版本保持一致
-    
-    # 根据加工方法计算
-    if constraints.machining_method == MachiningMethod.MILLING:
-        q = f * ap * ae / 1000 + 1e-7
-        safe_vc = np.maximum(vc, 0.001)
-        safe_fz = np.maximum(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        rz = PhysicalConstants.MILLING_ROUGHNESS_FACTOR * (safe_fz ** 2) / constraints.tool_diameter
+    speed_lo, speed_hi = config.speed_bound
+    feed_lo, feed_hi = config.feed_bound
+    if config.log_scale:
+        speed_lo, feed_lo = max(speed_lo, 1.0), max(feed_lo, 0.1)
+    cut_hi = constraints.max_cut_depth
+    if config.cut_depth_bound[1] is not None:
+        cut_hi = min(config.cut_depth_bound[1], cut_hi)
+    cut_lo = min(config.cut_depth_bound[0], cut_hi)
+    return DecodingBounds(
+        speed=(float(speed_lo), float(speed_hi)),
+        feed=(float(feed_lo), float(feed_hi)),
+        cut_depth=(float(cut_lo), float(cut_hi)),
+        log_scale=config.log_scale,
+        layout=GenomeLayout.from_bits(config.gene_bits, config.gray_code),
+    )
 
-        # ae_ratio是标量，直接使用
-        ae_ratio = ae / constraints.tool_diameter
 
-        # 根据ae_ratio的值选择计算方法
-        if ae_ratio <= 0.3:
-            hm = safe_fz * np.sqrt(ae_ratio)
-        else:
-            # 修复：使用正确的变量名
-            ratio = np.clip((ae - 0.5 * constraints.tool_diameter) / (0.5 * constraints.tool_diameter), -1, 1)
-            # fs 应该是角度（度），不是弧度
-            fs = 90 + np.arcsin(ratio) * 180 / np.pi  # 修复：将弧度转换为角度
-            hm = 1147 * safe_fz * np.sin(constraints.main_cutting_angle * np.pi / 180) * ae_ratio / fs
-
-        kc = (1 - 0.01 * constraints.rake_angle) * constraints.material_coefficient / (hm ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-
-        # 进给力计算（铣削）- 修正公式
-        # 主切削力 Fc = kc × ap × ae / (齿数) (N)
-        # 进给力 Ff = Fc × 系数 (取决于前角和主偏角)
-        cutting_force = kc * ap * ae / constraints.tool_teeth  # 主切削力 (N)
-        # 进给力系数：前角越大，进给力越小；主偏角越大，进给力越小
-        feed_force_coeff = 0.3 + 0.2 * (1.0 - constraints.rake_angle / 20.0) * (90.0 / constraints.main_cutting_angle)
-        ff = cutting_force * feed_force_coeff  # 进给力 (N)
-        
-    elif constraints.machining_method == MachiningMethod.DRILLING:
-        q = f * np.pi * constraints.tool_diameter ** 2 / 4000 + 1e-7
-        safe_vc = np.maximum(vc, 0.001)
-        safe_fz = np.maximum(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        h = safe_fz * np.sin(constraints.main_cutting_angle * np.pi / 180)
-        kc = constraints.material_coefficient / (h ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-        ff = 0.63 * safe_fz * constraints.tool_teeth * constraints.tool_diameter * kc / 2
-        rz = np.zeros(N)
-        
-    else:  # BORING
-        q = f * np.pi * (constraints.tool_diameter ** 2 - constraints.bottom_hole_diameter ** 2) / 4000 + 1e-7
-        safe_vc = np.maximum(vc, 0.001)
-        safe_fz = np.maximum(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        rx = (safe_fz * constraints.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / constraints.tool_radius
-        h = safe_fz * np.sin(constraints.main_cutting_angle * np.pi / 180)
-        kc = constraints.material_coefficient / (h ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-        ff = np.zeros(N)
-        rz = np.zeros(N)
-    
-    # 向量化计算惩罚
-    penalty = np.zeros(N)
-    
-    # 计算违规数量（用于调试）
-    violations_count = {
-        'power': 0,
-        'torque': 0,
-        'tool_life': 0,
-        'surface_roughness': 0,
-        'feed_force': 0,
-        'feed_per_tooth': 0,
-        'cutting_speed': 0
-    }
-    
-    mask_lft = lft < constraints.min_tool_life
-    violations_count['tool_life'] = np.sum(mask_lft)
-    penalty[mask_lft] += (constraints.min_tool_life - lft[mask_lft]) ** 2 * ConstraintPenalty.TOOL_LIFE
-    
-    mask_power = pmot > constraints.max_power
-    violations_count['power'] = np.sum(mask_power)
-    penalty[mask_power] += (pmot[mask_power] - constraints.max_power) ** 2 * ConstraintPenalty.POWER
-    
-    mask_torque = tnm > constraints.max_torque
-    violations_count['torque'] = np.sum(mask_torque)
-    penalty[mask_torque] += (tnm[mask_torque] - constraints.max_torque) ** 2 * ConstraintPenalty.TORQUE
-    
-    mask_rz = rz > constraints.min_surface_roughness
-    violations_count['surface_roughness'] = np.sum(mask_rz)
-    penalty[mask_rz] += (rz[mask_rz] - constraints.min_surface_roughness) ** 2 * ConstraintPenalty.SURFACE_ROUGHNESS
-    
-    mask_ff = ff > constraints.max_feed_force
-    violations_count['feed_force'] = np.sum(mask_ff)
-    penalty[mask_ff] += (ff[mask_ff] - constraints.max_feed_force) ** 2 * ConstraintPenalty.FEED_FORCE
-
-    # 计算刀具挠度（仅铣削）- 已优化约束检查
-    if constraints.machining_method == MachiningMethod.MILLING:
-        # 截面惯性矩: I = π * D⁴ / 64 (mm⁴)
-        moment_of_inertia = 3.14159 * (constraints.tool_diameter ** 4) / 64.0
-        # 挠度: δ = (F * L³) / (3 * E * I)
-        # 注意：E的单位是MPa，需要转换为N/mm²，F的单位是N，L的单位是mm
-        tool_deflection = (ff * (constraints.tool_overhang_length ** 3)) / (3.0 * constraints.tool_elastic_modulus * moment_of_inertia)
-        # 挠度约束检查 - 使用约束中的max_tool_deflection
-        mask_deflection = tool_deflection > constraints.max_tool_deflection
-        violations_count['tool_deflection'] = np.sum(mask_deflection)
-        # 使用较低的惩罚权重，避免过度限制切深
-        penalty[mask_deflection] += (tool_deflection[mask_deflection] - constraints.max_tool_deflection) ** 2 * ConstraintPenalty.FEED_FORCE * 0.5
-
-        # 调试：记录挠度参数
-        if np.sum(mask_deflection) > 0:
-            import logging
-            logger = logging.getLogger(__name__)
-            max_deflection_idx = np.argmax(tool_deflection)
-            logger.warning(f"挠度调试: L={constraints.tool_overhang_length:.1f}mm, E={constraints.tool_elastic_modulus:.0f}MPa, "
-                          f"max_deflection={constraints.max_tool_deflection:.3f}mm, "
-                          f"ff_max={ff[max_deflection_idx]:.1f}N, deflection_max={tool_deflection[max_deflection_idx]:.3f}mm")
-
-    mask_fz = fz > constraints.max_feed_per_tooth
-    violations_count['feed_per_tooth'] = np.sum(mask_fz)
-    penalty[mask_fz] += (fz[mask_fz] - constraints.max_feed_per_tooth) ** 2 * ConstraintPenalty.MAX_FEED
-    
-    mask_vc = vc > constraints.max_cutting_speed
-    violations_count['cutting_speed'] = np.sum(mask_vc)
-    penalty[mask_vc] += (vc[mask_vc] - constraints.max_cutting_speed) ** 2 * ConstraintPenalty.MAX_SPEED
+def evaluate_vectorized(
+    population: np.ndarray,
+    constraints_dict: Dict,
+    plan: Optional[EvaluatorPlan] = None,
+    bounds: Optional[DecodingBounds] = None,
+    staged: bool = False,
+    n_workers: int = 1
+) -> np.ndarray:
+    """
+    向量化评估适应度（批量计算，避免进程开销）
     
-    # 记录违规统计（用于调试）
-    total_violations = sum(violations_count.values())
-    if total_violations > 0:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"向量化评估: 发现 {total_violations} 个约束违规 - "
-                      f"功率:{violations_count['power']}, 扭矩:{violations_count['torque']}, "
-                      f"刀具寿命:{violations_count['tool_life']}, 粗糙度:{violations_count['surface_roughness']}, "
-                      f"进给力:{violations_count['feed_force']}, 每齿进给:{violations_count['feed_per_tooth']}, "
-                      f"线速度:{violations_count['cutting_speed']}, 刀具挠度:{violations_count.get('tool_deflection', 0)}")
-
-        # 调试：记录最优个体的关键参数（仅当存在违反功率/扭矩约束时）
-        if violations_count['power'] > 0 or violations_count['torque'] > 0:
-            best_idx = np.argmin(penalty)
-            logger.warning(f"调试 - 最优个体: n={n[best_idx]:.1f}, f={f[best_idx]:.1f}, ap={ap[best_idx]:.2f}, ae={ae:.2f}")
-            logger.warning(f"调试 - 物理参数: hm={hm[best_idx]:.4f}, kc={kc[best_idx]:.1f}, q={q[best_idx]:.2f}, pmot={pmot[best_idx]:.2f}, tnm={tnm[best_idx]:.2f}")
-            logger.warning(f"调试 - 约束: 最大功率={constraints.max_power}, 最大扭矩={constraints.max_torque}, 刀具直径={constraints.tool_diameter}")
-            if constraints.machining_method == MachiningMethod.MILLING:
-                ae_ratio = ae / constraints.tool_diameter
-                ratio = np.clip((ae - 0.5 * constraints.tool_diameter) / (0.5 * constraints.tool_diameter), -1, 1)
-                fs = 90 + np.arcsin(ratio) * 180 / np.pi
-                logger.warning(f"调试 - ae_ratio={ae_ratio:.4f}, fs={fs:.2f}")
+    大种群按块评估（见 EvaluatorPlan.evaluate_chunked），临时数组只有块大小。
     
-    fitnesses = q - 1e29 * penalty
+    Args:
+        population: 种群矩阵 (N, dna_size) 或位打包种群 (N,)
+        constraints_dict: 约束字典
+        plan: 评估计划（为 None 时按约束值与解码边界从缓存获取）
+        bounds: 基因解码边界（plan 为 None 时使用）
+        staged: 是否分阶段评估（违反线速度/每齿进给约束的个体跳过完整计算核）
+        n_workers: 分块评估的线程数
     
-    return fitnesses
+    Returns:
+        适应度数组
+    """
+    if plan is None:
+        plan = get_evaluator_plan(OptimizationConstraints(**constraints_dict), bounds)
+    return plan.evaluate_chunked(population, staged=staged, n_workers=n_workers)
 
 
 def evaluate_batch(args: Tuple[np.ndarray, int, Any]) -> Tuple[int, np.ndarray, float]:
@@ -309,163 +252,33 @@ def evaluate_batch(args: Tuple[np.ndarray, int, Any]) -> Tuple[int, np.ndarray,
     批量评估适应度（用于并行化）
 
     Args:
-        args: (individual, idx, constraints, objective_func_data)
+        args: (individual, idx, constraints_dict[, bounds])
+            individual 可以是 DNA 位向量或位打包的 uint64，bounds 为基因解码边界
 
     Returns:
         (idx, individual, fitness)
     """
-    individual, idx, constraints_dict = args
-
-    # 从字典重建约束对象
-    constraints = OptimizationConstraints(**constraints_dict)
-
-    # 转换 DNA 到参数
-    speed_bound = (0, 8000)
-    feed_bound = (0, 8000)
-    cut_depth_bound = (0.0, 1.0)
-
-    # 解码参数（使用正确的位范围，从高位到低位）
-    speed_bits = individual[:16]
-    feed_bits = individual[16:29]
-    cut_depth_bits = individual[29:]
-
-    # 使用加权求和方式：bit[i] * 2^(n-1-i)
-    # 注意：需要先转换为int类型，否则uint8会溢出
-    speed_val = sum(int(bit) * (2 ** (len(speed_bits) - 1 - i)) for i, bit in enumerate(speed_bits)) / (2**16 - 1)
-    speed = speed_val * speed_bound[1]  # 旧版本直接乘以边界上限
-
-    feed_val = sum(int(bit) * (2 ** (len(feed_bits) - 1 - i)) for i, bit in enumerate(feed_bits)) / (2**13 - 1)
-    feed = feed_val * feed_bound[1]  # 旧版本直接乘以边界上限
+    individual, idx, constraints_dict = args[:3]
+    bounds = args[3] if len(args) > 3 else None
 
-    cut_depth_val = sum(int(bit) * (2 ** (len(cut_depth_bits) - 1 - i)) for i, bit in enumerate(cut_depth_bits)) / (2**7 - 1)
-    cut_depth = cut_depth_val * cut_depth_bound[1]  # 旧版本直接乘以边界上限
-
-    params = {"speed": speed, "feed": feed, "cut_depth": cut_depth}
-    
-    # 计算加工参数
-    n = speed
-    f = feed
-    ap = cut_depth  # 修复：cut_depth 已经是实际切深，不需要再乘
-    ae = constraints.cut_width
-    
-    # 参数边界检查：确保最小转速和进给
-    n = max(n, 1.0)  # 最小转速 1 rpm
-    f = max(f, 0.1)  # 最小进给 0.1 mm/min
-    
-    # 每齿进给量
-    fz = f / (constraints.tool_teeth * n)
-    
-    # 切削速度
-    vc = (n * constraints.tool_diameter) / 318.0 + 0.1  # 与旧版本保持一致
-    
-    # 根据加工方法计算参数
-    if constraints.machining_method == MachiningMethod.MILLING:
-        # 铣削
-        q = f * ap * ae / 1000 + 1e-7
-        # 避免 0 的负幂次方
-        safe_vc = max(vc, 0.001)
-        safe_fz = max(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        rz = PhysicalConstants.MILLING_ROUGHNESS_FACTOR * (safe_fz ** 2) / constraints.tool_diameter
-        rx = (safe_fz * constraints.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / constraints.tool_diameter
-        
-        if ae / constraints.tool_diameter <= 0.3:
-            hm = safe_fz * (ae / constraints.tool_diameter) ** 0.5
-        else:
-            ratio = min(1.0, max(-1.0, (ae - 0.5 * constraints.tool_diameter) / (0.5 * constraints.tool_diameter)))
-            fs = 90 + math.asin(ratio) * 180 * math.pi
-            hm = 1147 * safe_fz * math.sin(constraints.main_cutting_angle * math.pi / 180) * (ae / constraints.tool_diameter) / fs
-        
-        kc = (1 - 0.01 * constraints.rake_angle) * constraints.material_coefficient / (hm ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / n
-        ff = 0.0
-        
-    elif constraints.machining_method == MachiningMethod.DRILLING:
-        # 钻孔
-        q = f * math.pi * constraints.tool_diameter ** 2 / 4000 + 1e-7
-        # 避免 0 的负幂次方
-        safe_vc = max(vc, 0.001)
-        safe_fz = max(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        h = safe_fz * math.sin(constraints.main_cutting_angle * math.pi / 180)
-        kc = constraints.material_coefficient / (h ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / n
-        ff = 0.63 * safe_fz * constraints.tool_teeth * constraints.tool_diameter * kc / 2
-        rz = 0.0
-        rx = 0.0
-        
-    else:  # BORING
-        # 镗孔
-        q = f * math.pi * (constraints.tool_diameter ** 2 - constraints.bottom_hole_diameter ** 2) / 4000 + 1e-7
-        # 避免 0 的负幂次方
-        safe_vc = max(vc, 0.001)
-        safe_fz = max(fz, 0.001)
-        lft = (
-            constraints.tool_life_coefficient *
-            (safe_vc ** constraints.speed_coefficient) *
-            (safe_fz ** constraints.feed_coefficient) *
-            constraints.wear_coefficient
-        )
-        rx = (safe_fz * constraints.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / constraints.tool_radius
-        h = safe_fz * math.sin(constraints.main_cutting_angle * math.pi / 180)
-        kc = constraints.material_coefficient / (h ** constraints.material_slope + 1e-3)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / n
-        ff = 0.0
-        rz = 0.0
-    
-    # 计算适应度
-    fitness = q
-    
-    # 约束惩罚
-    penalty = 0.0
-    
-    if lft < constraints.min_tool_life:
-        penalty += (constraints.min_tool_life - lft) ** 2 * ConstraintPenalty.TOOL_LIFE
-    
-    if pmot > constraints.max_power:
-        penalty += (pmot - constraints.max_power) ** 2 * ConstraintPenalty.POWER
-    
-    if tnm > constraints.max_torque:
-        penalty += (tnm - constraints.max_torque) ** 2 * ConstraintPenalty.TORQUE
-    
-    if rz > constraints.min_surface_roughness:
-        penalty += (rz - constraints.min_surface_roughness) ** 2 * ConstraintPenalty.SURFACE_ROUGHNESS
-    
-    if ff > constraints.max_feed_force:
-        penalty += (ff - constraints.max_feed_force) ** 2 * ConstraintPenalty.FEED_FORCE
-    
-    if fz > constraints.max_feed_per_tooth:
-        penalty += (fz - constraints.max_feed_per_tooth) ** 2 * ConstraintPenalty.MAX_FEED
-    
-    if vc > constraints.max_cutting_speed:
-        penalty += (vc - constraints.max_cutting_speed) ** 2 * ConstraintPenalty.MAX_SPEED
-    
-    fitness = q - 1e29 * penalty
+    # 按约束值与解码边界获取评估计划（只编译一次），与向量化评估使用同一计算核
+    plan = get_evaluator_plan(OptimizationConstraints(**constraints_dict), bounds)
+    fitness = float(plan.evaluate(np.asarray(individual)[np.newaxis, ...])[0])
     
     return idx, individual, fitness
 
 
-class MicrobialGeneticAlgorithm:
+@register_optimizer("ga")
+class MicrobialGeneticAlgorithm(Optimizer):
     """微生物遗传算法（优化版）"""
 
     def __init__(
         self,
         config: GAConfig,
         constraints: OptimizationConstraints,
-        objective_func: Callable = None
+        objective_func: Optional[ArrayObjective] = None,
+        population: Optional[np.ndarray] = None,
+        fitness: Optional[np.ndarray] = None
     ):
         """
         初始化遗传算法
@@ -473,15 +286,40 @@ class MicrobialGeneticAlgorithm:
         Args:
             config: 算法配置
             constraints: 约束条件
-            objective_func: 目标函数（默认使用内置目标函数）
+            objective_func: 向量化目标函数（输入计算核输出的加工参数数组字典，返回目标值数组），
+                默认按 config.objective 从注册表选取
+            population: 外部种群（如共享内存视图，见 attach_population），给出时不生成随机初始种群
+            fitness: 外部种群对应的适应度数组，-inf 表示尚未评估
         """
         self.config = config
         self.constraints = constraints
-        self.objective_func = objective_func or self._default_objective
-        self.population = self._initialize_population()
+        self.objective_func = objective_func or get_array_objective(config.objective)
+        # 每个实例独立的随机数流，避免并发请求共享全局随机状态
+        self.rng = np.random.default_rng(config.seed)
+        # 解码边界（含基因组布局）决定 DNA 长度，需在初始化种群之前确定
+        self.bounds = self._decoding_bounds()
+        self.dna_size = self.bounds.layout.total_bits
+        self.population_history: List[Tuple[int, int]] = []  # (代数, 新的种群大小)，每次种群增长时记录
+        
+        # 持久化适应度与脏标记：只重新评估被交叉/变异修改过的个体
+        if population is not None:
+            self.attach_population(population, fitness)
+        else:
+            self.population = self._initialize_population()
+            self.fitness = np.full(len(self.population), -np.inf)
+            self.dirty = np.ones(len(self.population), dtype=bool)
+        self._fitness_buffer = np.empty(len(self.population))  # 部分个体重新评估时的预分配输出
+        self.evaluation_count = 0
+        
+        # 运行统计
+        self.generations_run = 0
+        self.elapsed_s = 0.0
+        self.stop_reason = None  # generations / early_stop / deadline / max_evaluations
+        
         self.best_individual = None
         self.best_fitness = float('-inf')
         self.stagnation_count = 0
+        self.monitor = self._create_monitor()
         
         # 约束字典（用于并行化）
         self.constraints_dict = {
@@ -510,247 +348,294 @@ class MicrobialGeneticAlgorithm:
             'max_feed_per_tooth': constraints.max_feed_per_tooth,
             'max_cutting_speed': constraints.max_cutting_speed,
             'max_cut_depth': constraints.max_cut_depth,
+            'tool_elastic_modulus': constraints.tool_elastic_modulus,
+            'tool_overhang_length': constraints.tool_overhang_length,
+            'max_tool_deflection': constraints.max_tool_deflection,
         }
         
+        # 评估计划（按约束值与解码边界缓存，同一刀具/机床组合的重复请求无需重新构建）
+        self.plan = get_evaluator_plan(constraints, self.bounds)
+        self.repair = ConstraintRepair(self.plan) if self.config.enable_repair else None
+        self.staged_evaluation = self.config.staged_evaluation
+        self.fitness_cache = (
+            FitnessCache(self.plan, self.config.fitness_cache_size, self.staged_evaluation, self.objective_func)
+            if self.config.enable_fitness_cache else None
+        )
+        self.cache_hit_history = []  # 每代缓存命中率
+        self.polish_stats: Dict[str, Any] = {}
+        self.archive = (
+            SolutionArchive(self.bounds, self.config.n_alternatives, self.config.alternative_min_distance)
+            if self.config.n_alternatives > 0 else None
+        )
+        self.checkpoint = PopulationCheckpoint(self.config.checkpoint_dir) if self.config.checkpoint_dir else None
+        self._map_population()
+        
         # 确定工作进程数
         if self.config.enable_parallel:
             self.n_workers = self.config.n_workers or min(mp.cpu_count(), 8)
         else:
             self.n_workers = 1
 
+    def attach_population(self, population: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        挂接外部种群与适应度数组（如共享内存视图），进化过程直接原地修改
+        
+        Args:
+            population: 种群位矩阵或打包种群
+            fitness: 对应的适应度数组，-inf 表示尚未评估
+        """
+        self.population = population
+        self.fitness = fitness
+        self.dirty = ~np.isfinite(fitness)
+
+    def _decoding_bounds(self) -> DecodingBounds:
+        """
+        由配置边界与约束条件确定基因解码边界
+        
+        Returns:
+            解码边界（切深上限不超过约束中的最大切深）
+        """
+        return decoding_bounds(self.config, self.constraints)
+
     def _initialize_population(self) -> np.ndarray:
-        """初始化种群"""
-        return np.random.randint(0, 2, (self.config.population_size, self.config.dna_size), dtype=np.uint8)
+        """初始化种群（位矩阵或位打包表示；自适应种群规模时从较小的初始种群开始；配置热启动时前部为历史解及其邻居）"""
+        size = self.config.population_size
+        if self.config.adaptive_population:
+            size = min(size, self.config.initial_population_size)
+        if self.config.packed_genome:
+            population = random_packed_population(size, self.dna_size, self.rng)
+        else:
+            population = self.rng.integers(0, 2, (size, self.dna_size), dtype=np.uint8)
+        if self.config.warm_start:
+            n_seeded = min(size, max(len(self.config.warm_start), int(size * self.config.warm_start_fraction)))
+            population[:n_seeded] = self._warm_start_individuals(n_seeded, self.config.packed_genome)
+        return population
 
-    def _translate_dna(self, dna: np.ndarray) -> Dict[str, float]:
+    def _warm_start_individuals(self, size: int, packed: bool) -> np.ndarray:
         """
-        将 DNA 转换为参数
+        由历史最优解生成热启动个体
+        
+        每个历史解原样编码一份，其余个体轮流围绕各历史解，在基因整数值上做高斯扰动
+        （在参数空间中是小步移动，不受二进制编码相邻取值位差大的影响）。
         
         Args:
-            dna: DNA 序列
+            size: 个体数量
+            packed: 是否返回位打包表示
             
         Returns:
-            参数字典 {speed, feed, cut_depth}
+            热启动个体
         """
-        speed_bits = dna[:16]
-        feed_bits = dna[16:29]
-        cut_depth_bits = dna[29:]
+        values = np.asarray(self.config.warm_start, dtype=float).reshape(-1, 3)
+        layout = self.bounds.layout
+        parents = np.arange(size) % len(values)
+        genes = []
+        for i, name in enumerate(GENE_NAMES):
+            max_gene = 2 ** layout.bits(name) - 1
+            centers = unscale_values(values[:, i], name, self.bounds, nearest=True)[parents]
+            noise = self.rng.normal(0.0, self.config.warm_start_spread * max_gene, size)
+            noise[:len(values)] = 0.0
+            genes.append(np.clip(np.rint(centers + noise), 0, max_gene).astype(np.int64))
+        individuals = encode_genes(*genes, layout)
+        return individuals if packed else unpack_population(individuals, self.dna_size)
 
-        # 从高位到低位解码（与旧版本保持一致）
-        # 使用加权求和方式：bit[i] * 2^(n-1-i)
-        # 注意：需要先转换为int类型，否则uint8会溢出
-        speed_val = sum(int(bit) * (2 ** (len(speed_bits) - 1 - i)) for i, bit in enumerate(speed_bits)) / (2**16 - 1)
-        speed = speed_val * self.config.speed_bound[1]  # 旧版本直接乘以边界上限
+    def _latin_hypercube_individuals(self, size: int) -> np.ndarray:
+        """
+        在基因整数值空间中拉丁超立方抽样生成新个体（各基因分层抽样，覆盖比均匀随机更均匀）
+        
+        Args:
+            size: 个体数量
+            
+        Returns:
+            新个体（与种群表示相同）
+        """
+        layout = self.bounds.layout
+        genes = []
+        for bits in (layout.speed_bits, layout.feed_bits, layout.cut_depth_bits):
+            strata = (self.rng.permutation(size) + self.rng.random(size)) / size
+            genes.append(np.minimum((strata * 2 ** bits).astype(np.int64), 2 ** bits - 1))
+        packed = encode_genes(*genes, layout)
+        if is_packed(self.population):
+            return packed
+        return unpack_population(packed, self.dna_size)
 
-        feed_val = sum(int(bit) * (2 ** (len(feed_bits) - 1 - i)) for i, bit in enumerate(feed_bits)) / (2**13 - 1)
-        feed = feed_val * self.config.feed_bound[1]  # 旧版本直接乘以边界上限
+    def _should_grow(self, snapshot, stop_reason: Optional[str]) -> bool:
+        """
+        是否增长种群
+        
+        较小的种群即将判定收敛（可能是过早收敛），或多样性已坍缩而最优解仍不可行时增长；
+        种群已达上限时不再增长。
+        
+        Args:
+            snapshot: 本代收敛指标
+            stop_reason: 收敛监测器给出的停止原因
+            
+        Returns:
+            是否增长
+        """
+        if not self.config.adaptive_population or len(self.population) >= self.config.population_size:
+            return False
+        if stop_reason is not None:
+            return True
+        collapsed = (
+            snapshot.hamming_distance < self.config.min_diversity
+            or snapshot.elite_spread < self.config.elite_spread_tol
+        )
+        if not collapsed:
+            return False
+        speed, feed, cut_depth = decode_parameters(self.best_individual[np.newaxis, ...], self.bounds)
+        return bool(self.plan.evaluate_parameters(speed, feed, cut_depth)["penalty"][0] > 0)
 
-        cut_depth_val = sum(int(bit) * (2 ** (len(cut_depth_bits) - 1 - i)) for i, bit in enumerate(cut_depth_bits)) / (2**7 - 1)
-        # 修复：使用约束对象的最大切深，而不是config的边界上限
-        cut_depth = cut_depth_val * self.constraints.max_cut_depth
+    def _settling(self) -> bool:
+        """种群刚增长：新个体参与竞争一个收敛统计窗口之前不判定收敛、不再增长"""
+        return bool(self.population_history) and (
+            self.generations_run - self.population_history[-1][0] < self.config.convergence_window
+        )
 
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"调试 - _translate_dna: speed={speed:.1f}, feed={feed:.1f}, cut_depth={cut_depth:.2f}")
-        logger.warning(f"调试 - _translate_dna边界: cut_depth_bound={self.config.cut_depth_bound}, max_cut_depth={self.constraints.max_cut_depth}")
+    def _grow_population(self) -> None:
+        """按 population_growth 倍增长种群，新个体待下一代评估"""
+        current = len(self.population)
+        size = min(self.config.population_size, max(current + 2, int(current * self.config.population_growth)))
+        fresh = self._latin_hypercube_individuals(size - current)
+        self.population = np.concatenate([self.population, fresh])
+        self.fitness = np.concatenate([self.fitness, np.full(len(fresh), -np.inf)])
+        self.dirty = np.concatenate([self.dirty, np.ones(len(fresh), dtype=bool)])
+        self.population_history.append((self.generations_run, size))
+        self._map_population()
 
-        return {"speed": speed, "feed": feed, "cut_depth": cut_depth}
+    def _map_population(self) -> None:
+        """启用检查点时，将种群与适应度移入内存映射文件（进化在映射上原地进行）"""
+        if self.checkpoint is None:
+            return
+        self.population = self.checkpoint.map_array("population", self.population)
+        self.fitness = self.checkpoint.map_array("fitness", self.fitness)
 
-    def _calculate_machining_parameters(self, params: Dict[str, float]) -> Dict[str, float]:
+    def save_checkpoint(self) -> Path:
         """
-        计算加工参数
+        原子写入检查点（种群、适应度、脏标记、最优个体、随机数与收敛监测状态、配置与约束）
+        
+        Returns:
+            检查点目录
+        """
+        if self.checkpoint is None:
+            raise ValueError("未配置 checkpoint_dir")
+        arrays = {
+            "population": self.population,
+            "fitness": self.fitness,
+            "dirty": self.dirty,
+        }
+        if self.best_individual is not None:
+            arrays["best_individual"] = self.best_individual
+        if self.archive is not None:
+            arrays["archive_points"] = self.archive.points
+            arrays["archive_fitness"] = self.archive.fitness
+        state = {
+            "generations_run": self.generations_run,
+            "evaluation_count": self.evaluation_count,
+            "best_fitness": self.best_fitness,
+            "population_history": [list(entry) for entry in self.population_history],
+            "rng": self.rng.bit_generator.state,
+            "monitor": {
+                "generation": self.monitor.generation,
+                "stagnant_generations": self.monitor.stagnant_generations,
+                "best_history": [list(entry) for entry in self.monitor.best_history],
+            },
+            "config": asdict(self.config),
+            "constraints": asdict(self.constraints),
+        }
+        return self.checkpoint.save(self.generations_run, arrays, state)
+
+    @classmethod
+    def resume(
+        cls,
+        path: str,
+        objective_func: Optional[ArrayObjective] = None
+    ) -> "MicrobialGeneticAlgorithm":
+        """
+        从检查点恢复遗传算法，之后调用 evolve() 从检查点的下一代继续进化
         
         Args:
-            params: 基本参数 {speed, feed, cut_depth}
+            path: 检查点目录（checkpoint_dir，读取最近的检查点）或某个检查点目录
+            objective_func: 自定义向量化目标函数（检查点只记录 config.objective 名称）
             
         Returns:
-            加工参数字典
+            恢复后的遗传算法（继续在 path 所在的检查点目录中写入检查点）
         """
-        n = params["speed"]
-        f = params["feed"]
-        ap = params["cut_depth"]  # 修复：params["cut_depth"] 已经是实际切深，不需要再乘
-        ae = self.constraints.cut_width
-        
-        # 每齿进给量
-        fz = f / (self.constraints.tool_teeth * n) if n > 0 else 0
-        
-        # 切削速度
-        vc = (n * self.constraints.tool_diameter) / 318.0 + 0.1 if n > 0 else 0  # 与旧版本保持一致
-        
-        # 根据加工方法计算参数
-        if self.constraints.machining_method == MachiningMethod.MILLING:
-            return self._calculate_milling_parameters(n, f, ap, ae, vc, fz)
-        elif self.constraints.machining_method == MachiningMethod.DRILLING:
-            return self._calculate_drilling_parameters(n, f, vc, fz)
-        else:  # BORING
-            return self._calculate_boring_parameters(n, f, ap, ae, vc, fz)
-
-    def _calculate_milling_parameters(
-        self, n: float, f: float, ap: float, ae: float, vc: float, fz: float
-    ) -> Dict[str, float]:
-        """计算铣削参数"""
-        # 材料去除率
-        q = f * ap * ae / 1000 + 1e-7
-        
-        # 刀具寿命
-        lft = (
-            self.constraints.tool_life_coefficient *
-            (vc ** self.constraints.speed_coefficient) *
-            (fz ** self.constraints.feed_coefficient) *
-            self.constraints.wear_coefficient
-        )
+        arrays, state = PopulationCheckpoint.load(path)
+        snapshot = PopulationCheckpoint.resolve(path)
+        # JSON 中的元组字段读回为列表
+        config_values = {k: tuple(v) if isinstance(v, list) else v for k, v in state["config"].items()}
+        config = replace(GAConfig(**config_values), checkpoint_dir=str(snapshot.parent))
+        ga = cls(config, OptimizationConstraints(**state["constraints"]), objective_func)
+        ga._restore(arrays, state)
+        return ga
+
+    def _restore(self, arrays: Dict[str, np.ndarray], state: Dict[str, Any]) -> None:
+        """
+        用检查点内容替换当前种群与运行状态
         
-        # 表面粗糙度
-        rz = PhysicalConstants.MILLING_ROUGHNESS_FACTOR * (fz ** 2) / self.constraints.tool_diameter
-        rx = (fz * self.constraints.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / self.constraints.tool_diameter
+        Args:
+            arrays: 检查点数组
+            state: 检查点状态
+        """
+        population = arrays["population"]
+        if is_packed(population) != self.config.packed_genome or (
+            population.ndim == 2 and population.shape[1] != self.dna_size
+        ):
+            raise ValueError(f"检查点种群形状 {population.shape} 与基因组布局不一致")
+        self.population = np.array(population)
+        self.fitness = np.array(arrays["fitness"])
+        self.dirty = np.array(arrays["dirty"])
+        self._fitness_buffer = np.empty(len(self.population))
+        self._map_population()
+        if "best_individual" in arrays:
+            self.best_individual = np.array(arrays["best_individual"])
+        if self.archive is not None and "archive_points" in arrays:
+            self.archive.points = np.array(arrays["archive_points"])
+            self.archive.fitness = np.array(arrays["archive_fitness"])
         
-        # 平均切屑厚度
-        if ae / self.constraints.tool_diameter <= 0.3:
-            hm = fz * (ae / self.constraints.tool_diameter) ** 0.5
-        else:
-            # 确保 asin 的输入在有效范围内 [-1, 1]
-            ratio = min(1.0, max(-1.0, (ae - 0.5 * self.constraints.tool_diameter) / (0.5 * self.constraints.tool_diameter)))
-            # 修复：fs 应该是角度（度），不是弧度
-            fs = 90 + math.asin(ratio) * 180 / math.pi
-            hm = 1147 * fz * math.sin(self.constraints.main_cutting_angle * math.pi / 180) * (ae / self.constraints.tool_diameter) / fs
-        
-        # 单位切削力
-        kc = (1 - 0.01 * self.constraints.rake_angle) * self.constraints.material_coefficient / (hm ** self.constraints.material_slope + 1e-3)
-        
-        # 功率和扭矩（瓦尔特功率计算公式）
-        # pmot = Q * kc / 60000 / machine_efficiency (Kw)
-        # 备用：山德威克功率计算公式（Sandvik Power Formula）
-        # pmot = AE * ap * f * KC11 / 60037200 / machine_efficiency (Kw)
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / self.constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-
-        # 进给力计算（铣削）- 修正公式
-        # 主切削力 Fc = kc × ap × ae / (齿数) (N)
-        # 进给力 Ff = Fc × 系数 (取决于前角和主偏角)
-        cutting_force = kc * ap * ae / self.constraints.tool_teeth  # 主切削力 (N)
-        # 进给力系数：前角越大，进给力越小；主偏角越大，进给力越小
-        feed_force_coeff = 0.3 + 0.2 * (1.0 - self.constraints.rake_angle / 20.0) * (90.0 / self.constraints.main_cutting_angle)
-        ff = cutting_force * feed_force_coeff  # 进给力 (N)
-
-        # 刀具挠度计算（悬臂梁模型）
-        # 截面惯性矩: I = π * D⁴ / 64
-        moment_of_inertia = 3.14159 * (self.constraints.tool_diameter ** 4) / 64.0
-        # 挠度: δ = (F * L³) / (3 * E * I)
-        tool_deflection = (ff * (self.constraints.tool_overhang_length ** 3)) / (3.0 * self.constraints.tool_elastic_modulus * moment_of_inertia)
+        self.generations_run = state["generations_run"]
+        self.evaluation_count = state["evaluation_count"]
+        self.best_fitness = state["best_fitness"]
+        self.population_history = [tuple(entry) for entry in state["population_history"]]
+        self.rng.bit_generator.state = state["rng"]
+        monitor = state["monitor"]
+        self.monitor.generation = monitor["generation"]
+        self.monitor.stagnant_generations = monitor["stagnant_generations"]
+        self.monitor.best_history = [tuple(entry) for entry in monitor["best_history"]]
+        self.stagnation_count = self.monitor.stagnant_generations
+
+    def _translate_dna(self, dna: np.ndarray) -> Dict[str, float]:
+        """
+        将 DNA 转换为参数
+        
+        Args:
+            dna: DNA 序列（位向量或位打包的 uint64）
+            
+        Returns:
+            参数字典 {speed, feed, cut_depth}
+        """
+        # 从高位到低位解码，与评估计划使用同一解码边界
+        speeds, feeds, cut_depths = decode_parameters(np.asarray(dna)[np.newaxis, ...], self.bounds)
+        speed, feed, cut_depth = float(speeds[0]), float(feeds[0]), float(cut_depths[0])
 
         import logging
         logger = logging.getLogger(__name__)
-        logger.warning(f"调试 - _calculate_milling_parameters返回: n={n:.1f}, f={f:.1f}, ap={ap:.2f}, ae={ae:.2f}")
-        logger.warning(f"调试 - _calculate_milling_parameters物理: hm={hm:.4f}, kc={kc:.1f}, q={q:.2f}, pmot={pmot:.2f}, tnm={tnm:.2f}, ff={ff:.1f}, deflection={tool_deflection:.4f}")
-
-        return {
-            "speed": n,
-            "feed": f,
-            "cut_depth": ap,
-            "cut_width": ae,
-            "material_removal_rate": q,
-            "tool_life": lft,
-            "bottom_roughness": rz,
-            "side_roughness": rx,
-            "power": pmot,
-            "torque": tnm,
-            "feed_force": ff,
-            "feed_per_tooth": fz,
-            "cutting_speed": vc,
-            "tool_deflection": tool_deflection,
-        }
+        logger.warning(f"调试 - _translate_dna: speed={speed:.1f}, feed={feed:.1f}, cut_depth={cut_depth:.2f}")
+        logger.warning(f"调试 - _translate_dna边界: cut_depth_bound={self.bounds.cut_depth}, max_cut_depth={self.constraints.max_cut_depth}")
 
-    def _calculate_drilling_parameters(
-        self, n: float, f: float, vc: float, fz: float
-    ) -> Dict[str, float]:
-        """计算钻孔参数"""
-        # 材料去除率
-        q = f * math.pi * self.constraints.tool_diameter ** 2 / 4000 + 1e-7
-        
-        # 刀具寿命
-        lft = (
-            self.constraints.tool_life_coefficient *
-            (vc ** self.constraints.speed_coefficient) *
-            (fz ** self.constraints.feed_coefficient) *
-            self.constraints.wear_coefficient
-        )
-        
-        # 平均切屑厚度
-        h = fz * math.sin(self.constraints.main_cutting_angle * math.pi / 180)
-        
-        # 单位切削力
-        kc = self.constraints.material_coefficient / (h ** self.constraints.material_slope + 1e-3)
-        
-        # 功率和扭矩
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / self.constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-        
-        # 进给力
-        ff = 0.63 * fz * self.constraints.tool_teeth * self.constraints.tool_diameter * kc / 2
-        
-        return {
-            "speed": n,
-            "feed": f,
-            "cut_depth": 0.0,
-            "cut_width": 0.0,
-            "material_removal_rate": q,
-            "tool_life": lft,
-            "bottom_roughness": 0.0,
-            "side_roughness": 0.0,
-            "power": pmot,
-            "torque": tnm,
-            "feed_force": ff,
-            "feed_per_tooth": fz,
-            "cutting_speed": vc,
-        }
+        return {"speed": speed, "feed": feed, "cut_depth": cut_depth}
 
-    def _calculate_boring_parameters(
-        self, n: float, f: float, ap: float, ae: float, vc: float, fz: float
-    ) -> Dict[str, float]:
-        """计算镗孔参数"""
-        # 材料去除率
-        q = f * math.pi * (self.constraints.tool_diameter ** 2 - self.constraints.bottom_hole_diameter ** 2) / 4000 + 1e-7
-        
-        # 刀具寿命
-        lft = (
-            self.constraints.tool_life_coefficient *
-            (vc ** self.constraints.speed_coefficient) *
-            (fz ** self.constraints.feed_coefficient) *
-            self.constraints.wear_coefficient
-        )
+    def _calculate_machining_parameters(self, params: Dict[str, float]) -> Dict[str, float]:
+        """
+        计算加工参数
         
-        # 表面粗糙度
-        rx = (fz * self.constraints.tool_teeth) ** 2 * PhysicalConstants.MILLING_SIDE_ROUGHNESS_FACTOR / self.constraints.tool_radius
-        
-        # 平均切屑厚度
-        h = fz * math.sin(self.constraints.main_cutting_angle * math.pi / 180) + 1e-7
-        
-        # 单位切削力
-        kc = self.constraints.material_coefficient / (h ** self.constraints.material_slope + 1e-7)
-        
-        # 功率和扭矩（瓦尔特功率计算公式）
-        pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / self.constraints.machine_efficiency
-        tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
-        
-        # 进给力计算（镗孔）- 参照旧版公式
-        # 进给力与钻孔类似，但受底孔直径影响（切削面积减小）
-        ff = 0.63 * fz * self.constraints.tool_teeth * (self.constraints.tool_diameter - self.constraints.bottom_hole_diameter) * kc / 2
-        
-        return {
-            "speed": n,
-            "feed": f,
-            "cut_depth": ap,
-            "cut_width": ae,
-            "material_removal_rate": q,
-            "tool_life": lft,
-            "bottom_roughness": 0.0,
-            "side_roughness": rx,
-            "power": pmot,
-            "torque": tnm,
-            "feed_force": ff,
-            "feed_per_tooth": fz,
-            "cutting_speed": vc,
-        }
+        Args:
+            params: 基本参数 {speed, feed, cut_depth}
+            
+        Returns:
+            加工参数字典
+        """
+        return calculate_machining_parameters(params, self.constraints)
 
     def _default_objective(self, params: Dict[str, float]) -> float:
         """
@@ -819,121 +704,346 @@ class MicrobialGeneticAlgorithm:
         
         return fitness
 
-    def _crossover(self, loser: np.ndarray, winner: np.ndarray) -> np.ndarray:
+    def _crossover(self, losers: np.ndarray, winners: np.ndarray) -> np.ndarray:
         """
-        交叉操作
+        交叉操作（整代向量化）
         
         Args:
-            loser: 输者的 DNA
-            winner: 赢者的 DNA
+            losers: 输者的 DNA 矩阵 (n_pairs, dna_size) 或打包数组 (n_pairs,)
+            winners: 赢者的 DNA 矩阵 (n_pairs, dna_size) 或打包数组 (n_pairs,)
             
         Returns:
-            交叉后的 DNA
+            交叉后的 DNA 矩阵
+        """
+        # 两种表示使用同一位掩码（uint64 随机字组合而成），相同随机数流下结果一致
+        mask = random_bit_masks(len(losers), self.dna_size, self.config.crossover_rate, self.rng)
+        if is_packed(losers):
+            return packed_crossover(losers, winners, mask)
+        
+        np.copyto(losers, winners, where=unpack_population(mask, self.dna_size).view(bool))
+        return losers
+
+    def _mutate(self, individuals: np.ndarray) -> np.ndarray:
+        """
+        变异操作（整代向量化）
+        
+        Args:
+            individuals: 个体 DNA 矩阵 (n, dna_size) 或打包数组 (n,)
+            
+        Returns:
+            变异后的 DNA 矩阵
+        """
+        mask = random_bit_masks(len(individuals), self.dna_size, self.config.mutation_rate, self.rng)
+        if is_packed(individuals):
+            return packed_mutate(individuals, mask)
+        
+        # 按位异或翻转基因位（uint8 上取反 ~ 会得到 254/255，而非 0/1）
+        individuals ^= unpack_population(mask, self.dna_size)
+        return individuals
+
+    def _generation_step(self, fitnesses: np.ndarray) -> None:
+        """
+        执行一代微生物锦标赛（整代向量化）
+        
+        随机两两配对，每对中适应度较低者向赢者交叉并变异，结果写回种群。
+        
+        Args:
+            fitnesses: 当前种群的适应度数组
+        """
+        population_size = len(self.population)
+        n_pairs = population_size // 2
+        
+        # 随机配对
+        order = self.rng.permutation(population_size)
+        first, second = order[:n_pairs], order[n_pairs:2 * n_pairs]
+        
+        # 确定输赢（与旧版本一致：平局时第二个个体为输者）
+        first_wins = fitnesses[first] >= fitnesses[second]
+        winner_idx = np.where(first_wins, first, second)
+        loser_idx = np.where(first_wins, second, first)
+        
+        # 跟踪最优个体（最优个体必然是某一对的赢者，本代不会被修改）
+        best_idx = int(np.argmax(fitnesses))
+        if fitnesses[best_idx] > self.best_fitness:
+            self.best_fitness = float(fitnesses[best_idx])
+            self.best_individual = self.population[best_idx].copy()
+        
+        # 对输者进行交叉和变异，并更新种群
+        original = self.population[loser_idx]
+        losers = self._crossover(original.copy(), self.population[winner_idx])
+        losers = self._mutate(losers)
+        self.population[loser_idx] = losers
+        
+        # 标记实际发生变化的个体，下一代只重新评估这些个体
+        if is_packed(losers):
+            changed = losers != original
+        else:
+            changed = np.any(losers != original, axis=1)
+        self.dirty[loser_idx[changed]] = True
+
+    def _evaluate_population(self) -> np.ndarray:
+        """
+        增量评估种群适应度（只评估脏个体，其余沿用持久化的适应度）
+        
+        Returns:
+            整个种群的适应度数组 (N,)
         """
-        crossover_mask = np.random.rand(self.config.dna_size) < self.config.crossover_rate
-        loser[crossover_mask] = winner[crossover_mask]
-        return loser
+        dirty_idx = np.flatnonzero(self.dirty)
+        if len(dirty_idx) > 0:
+            if self.repair is not None:
+                repaired_population, repaired = self.repair.repair(self.population[dirty_idx])
+                if np.any(repaired):
+                    self.population[dirty_idx[repaired]] = repaired_population[repaired]
+            if self.fitness_cache is not None:
+                lookups, hits = self.fitness_cache.lookups, self.fitness_cache.hits
+                self.fitness[dirty_idx] = self.fitness_cache.evaluate(self.population[dirty_idx])
+                hits = self.fitness_cache.hits - hits
+                self.cache_hit_history.append(hits / (self.fitness_cache.lookups - lookups))
+                self.evaluation_count += len(dirty_idx) - hits
+            elif len(dirty_idx) == len(self.population):
+                # 整个种群都需评估（首代）：直接写入适应度数组
+                self._parallel_evaluate(self.population, out=self.fitness)
+                self.evaluation_count += len(dirty_idx)
+            else:
+                if len(self._fitness_buffer) < len(dirty_idx):
+                    self._fitness_buffer = np.empty(len(self.population))
+                buffer = self._fitness_buffer[:len(dirty_idx)]
+                self.fitness[dirty_idx] = self._parallel_evaluate(self.population[dirty_idx], out=buffer)
+                self.evaluation_count += len(dirty_idx)
+            self.dirty[dirty_idx] = False
+        return self.fitness
 
-    def _mutate(self, individual: np.ndarray) -> np.ndarray:
+    def _polish(self, population: np.ndarray, fitness: np.ndarray) -> Tuple[Dict[str, float], float]:
         """
-        变异操作
+        局部精修：从适应度最高的若干个互不相同的个体出发，在连续参数上做模式搜索
         
         Args:
-            individual: 个体 DNA
+            population: 已评估的种群（位矩阵或位打包表示）
+            fitness: 种群适应度
             
         Returns:
-            变异后的 DNA
+            (精修后的最优参数 {speed, feed, cut_depth}, 对应适应度)
+        """
+        # 按适应度取候选并去除重复基因组（收敛后精英层重复个体很多，候选池取得较宽）
+        top_k = min(self.config.polish_top_k, len(fitness))
+        candidates = np.argsort(-fitness, kind="stable")[:64 * top_k]
+        _, first = np.unique(population[candidates], axis=0, return_index=True)
+        starts = candidates[np.sort(first)[:top_k]]
+
+        start_fitness = float(fitness[starts[0]])
+        speeds, feeds, cut_depths = decode_parameters(population[starts], self.bounds)
+        search = PatternSearch(
+            self.plan, self.bounds, objective=self.objective_func,
+            max_iterations=self.config.polish_max_iterations
+        )
+        values, polished = search.run(speeds, feeds, cut_depths)
+        if self.archive is not None:
+            self._archive_values(values)
+
+        best = int(np.argmax(polished))
+        self.polish_stats = {
+            "starts": len(starts),
+            "iterations": search.iterations,
+            "evaluations": search.evaluation_count,
+            "improvement": float(polished[best] - start_fitness),
+        }
+        speed, feed, cut_depth = (float(v) for v in values[best])
+        return {"speed": speed, "feed": feed, "cut_depth": cut_depth}, float(polished[best])
+
+    def _update_archive(self, population: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        用已评估种群中适应度最高的个体更新备选方案存档
+        
+        Args:
+            population: 已评估的种群（位矩阵或位打包表示）
+            fitness: 种群适应度
+        """
+        n_candidates = min(4 * self.archive.capacity, len(fitness))
+        top = np.argpartition(-fitness, n_candidates - 1)[:n_candidates]
+        self._archive_values(np.stack(decode_parameters(population[top], self.bounds), axis=1))
+
+    def _archive_values(self, values: np.ndarray) -> None:
+        """
+        评估一批参数的约束惩罚与适应度并更新存档
+        
+        Args:
+            values: 参数 (N, 3)，列为转速、进给、切深
+        """
+        p = self.plan.evaluate_parameters(values[:, 0], values[:, 1], values[:, 2], self.objective_func)
+        self.archive.update(values, p["fitness"], p["penalty"])
+
+    def get_alternatives(self) -> List[Dict[str, float]]:
+        """
+        获取备选方案
+        
+        Returns:
+            互不相近的可行解的加工参数列表（含 fitness），按适应度降序
+        """
+        return self.archive.solutions(self.plan, self.objective_func) if self.archive is not None else []
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+        
+        Returns:
+            统计字典（物理评估次数、缓存命中率等）
         """
-        mutation_mask = np.random.rand(self.config.dna_size) < self.config.mutation_rate
-        individual[mutation_mask] = ~individual[mutation_mask]
-        return individual
+        stats = {
+            "stop_reason": self.stop_reason,
+            "generations": self.generations_run,
+            "evaluations": self.evaluation_count,
+            "elapsed_s": round(self.elapsed_s, 4),
+        }
+        if self.repair is not None:
+            stats["repairs"] = self.repair.get_counts()
+        if self.monitor.latest is not None:
+            stats["convergence"] = self.monitor.latest.to_dict()
+        if self.polish_stats:
+            stats["polish"] = dict(self.polish_stats)
+        if self.config.warm_start:
+            stats["warm_start_solutions"] = len(self.config.warm_start)
+        if self.config.adaptive_population:
+            stats["population_size"] = len(self.population)
+            stats["population_history"] = [list(entry) for entry in self.population_history]
+        if self.fitness_cache is not None:
+            stats.update({
+                "cache_lookups": self.fitness_cache.lookups,
+                "cache_hits": self.fitness_cache.hits,
+                "cache_hit_rate": round(self.fitness_cache.hit_rate, 4),
+                "cache_size": len(self.fitness_cache),
+                "recent_cache_hit_rate": round(float(np.mean(self.cache_hit_history[-10:])), 4)
+                if self.cache_hit_history else 0.0,
+            })
+        return stats
 
-    def evolve(self, iterations_per_generation: int = 384) -> Tuple[Dict[str, float], float]:
+    def _create_monitor(self) -> ConvergenceMonitor:
+        """按配置创建收敛监测器"""
+        return ConvergenceMonitor(
+            window=self.config.convergence_window,
+            min_diversity=self.config.min_diversity,
+            elite_spread_tol=self.config.elite_spread_tol,
+            improvement_tol=self.config.improvement_tol,
+            patience=(
+                min(self.config.warm_start_patience, self.config.early_stop_generations)
+                if self.config.warm_start else self.config.early_stop_generations
+            ),
+            bit_ranges=self.bounds.layout.bit_ranges(),
+        )
+
+    def _adapt_rates(self, generation: int) -> None:
+        """
+        自适应参数调整：根据收敛进度逐渐降低交叉率和变异率
+        
+        Args:
+            generation: 当前代数
+        """
+        if self.config.adaptive_rate:
+            progress = generation / self.config.generations
+            self.config.crossover_rate = 0.6 * (1 - progress * 0.3)  # 逐渐降低
+            self.config.mutation_rate = 0.3 * (1 - progress * 0.2)  # 逐渐降低
+
+    def evolve(
+        self,
+        iterations_per_generation: int = 384,
+        deadline_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Dict[str, float], float]:
         """
-        执行进化（优化版：并行化 + 早停 + 自适应参数）
+        执行进化（优化版：整代向量化 + 早停 + 自适应参数）
+        
+        任一预算耗尽时立即返回当前最优解，停止原因与计数见 get_statistics()。
+        至少完成一代进化以保证有可返回的解。
         
         Args:
             iterations_per_generation: 每代迭代次数
+            deadline_s: 墙钟时间上限（秒），默认取 config.deadline_s
+            max_evaluations: 物理模型评估次数上限，默认取 config.max_evaluations
             
         Returns:
             (最优参数, 最优适应度)
         """
         import traceback
-        best_fitness_history = []
-        convergence_threshold = 1e-6  # 收敛阈值
+        
+        if deadline_s is None:
+            deadline_s = self.config.deadline_s
+        if max_evaluations is None:
+            max_evaluations = self.config.max_evaluations
+        start_time = time.perf_counter()
+        slowest_generation = 0.0
+        self.stop_reason = "generations"
+        # 从检查点恢复时从下一代继续
+        first_generation = self.generations_run
         
         try:
-            for generation in range(self.config.generations):
-                # 自适应参数调整
-                if self.config.adaptive_rate:
-                    # 根据收敛进度调整交叉率和变异率
-                    progress = generation / self.config.generations
-                    self.config.crossover_rate = 0.6 * (1 - progress * 0.3)  # 逐渐降低
-                    self.config.mutation_rate = 0.3 * (1 - progress * 0.2)  # 逐渐降低
+            for generation in range(first_generation, self.config.generations):
+                generation_start = time.perf_counter()
                 
-                # 分批处理种群（减少内存使用）
-                batch_start = 0
-                while batch_start < self.config.population_size:
-                    batch_end = min(batch_start + self.config.batch_size, self.config.population_size)
-                    batch_population = self.population[batch_start:batch_end]
-                    
-                    # 向量化评估批量中的个体（避免进程池开销）
-                    fitnesses = self._parallel_evaluate(batch_population)
-                    
-                    # 对批量内的个体进行微生物操作
-                    for i in range(0, len(fitnesses), 2):
-                        if i + 1 >= len(fitnesses):
-                            break
-                        
-                        idx1, ind1, fit1 = fitnesses[i]
-                        idx2, ind2, fit2 = fitnesses[i + 1]
-                        
-                        # 确定输赢
-                        if fit1 < fit2:
-                            loser, winner = ind1.copy(), ind2
-                            loser_idx, winner_idx = idx1, idx2
-                            winner_fit = fit2
-                        else:
-                            loser, winner = ind2.copy(), ind1
-                            loser_idx, winner_idx = idx2, idx1
-                            winner_fit = fit1
-                        
-                        # 对输者进行交叉和变异
-                        loser = self._crossover(loser, winner)
-                        loser = self._mutate(loser)
-                        
-                        # 更新种群
-                        actual_idx = batch_start + loser_idx
-                        self.population[actual_idx] = loser
-                        
-                        # 跟踪最优个体
-                        if winner_fit > self.best_fitness:
-                            self.best_fitness = winner_fit
-                            self.best_individual = winner.copy()
-                            self.stagnation_count = 0
-                    
-                    batch_start = batch_end
+                # 预算检查：下一代预计超时或评估次数已用尽时停止
+                if generation > first_generation:
+                    if deadline_s is not None and generation_start - start_time + slowest_generation > deadline_s:
+                        self.stop_reason = "deadline"
+                        break
+                    if max_evaluations is not None and self.evaluation_count + np.count_nonzero(self.dirty) > max_evaluations:
+                        self.stop_reason = "max_evaluations"
+                        break
                 
-                # 检查早停条件
-                if len(best_fitness_history) > 0:
-                    improvement = abs(self.best_fitness - best_fitness_history[-1])
-                    if improvement < convergence_threshold:
-                        self.stagnation_count += 1
-                    else:
-                        self.stagnation_count = 0
+                self._adapt_rates(generation)
                 
-                best_fitness_history.append(self.best_fitness)
+                # 增量评估 + 整代向量化锦标赛
+                fitnesses = self._evaluate_population()
+                if self.archive is not None:
+                    self._update_archive(self.population, fitnesses)
+                self._generation_step(fitnesses)
+                self.generations_run = generation + 1
+                slowest_generation = max(slowest_generation, time.perf_counter() - generation_start)
                 
-                # 早停检查
-                if self.stagnation_count >= self.config.early_stop_generations:
-                    print(f"Early stop at generation {generation} (no improvement for {self.stagnation_count} generations)")
+                # 收敛检查
+                snapshot = self.monitor.update(self.population, fitnesses, self.best_fitness)
+                self.stagnation_count = self.monitor.stagnant_generations
+                if self.checkpoint is not None and self.generations_run % self.config.checkpoint_interval == 0:
+                    self.save_checkpoint()
+                stop_reason = self.monitor.should_stop()
+                if self._settling():
+                    stop_reason = None
+                elif self._should_grow(snapshot, stop_reason):
+                    self._grow_population()
+                    print(f"Generation {generation}: population grown to {len(self.population)} "
+                          f"(diversity={snapshot.hamming_distance:.4f}, elite spread={snapshot.elite_spread:.2e})")
+                    continue
+                if stop_reason is not None:
+                    print(f"Stop at generation {generation} ({stop_reason}: "
+                          f"diversity={snapshot.hamming_distance:.4f}, elite spread={snapshot.elite_spread:.2e}, "
+                          f"no improvement for {self.stagnation_count} generations)")
+                    self.stop_reason = stop_reason
                     break
 
                 if generation % 10 == 0:
-                    print(f"Generation {generation}: Best fitness = {self.best_fitness:.6f}, Population size = {self.config.population_size}")
+                    cache_info = ""
+                    if self.cache_hit_history:
+                        cache_info = f", Cache hit rate = {self.cache_hit_history[-1]:.1%}"
+                    print(f"Generation {generation}: Best fitness = {self.best_fitness:.6f}, Population size = {len(self.population)}{cache_info}")
+
+            # 最终检查点：进化结束后的种群可供离线分析
+            if self.checkpoint is not None and self.generations_run % self.config.checkpoint_interval != 0:
+                self.save_checkpoint()
+            
+            self.elapsed_s = time.perf_counter() - start_time
+            if self.stop_reason in ("deadline", "max_evaluations"):
+                print(f"Budget exhausted ({self.stop_reason}) after {self.generations_run} generations, "
+                      f"{self.evaluation_count} evaluations, {self.elapsed_s:.2f}s")
 
             # 获取最优参数
             best_params = self._translate_dna(self.best_individual)
+
+            # 局部精修（预算已耗尽时跳过）
+            if self.config.polish and self.stop_reason not in ("deadline", "max_evaluations"):
+                self._evaluate_population()
+                polished_params, polished_fitness = self._polish(self.population, self.fitness)
+                self.evaluation_count += self.polish_stats["evaluations"]
+                if polished_fitness > self.best_fitness:
+                    best_params, self.best_fitness = polished_params, polished_fitness
+                self.elapsed_s = time.perf_counter() - start_time
+
             best_machining_params = self._calculate_machining_parameters(best_params)
 
             import logging
@@ -948,42 +1058,37 @@ class MicrobialGeneticAlgorithm:
             print(error_msg)
             raise Exception(error_msg)
 
-    def _parallel_evaluate(self, population: np.ndarray) -> List[Tuple[int, np.ndarray, float]]:
+    def _parallel_evaluate(self, population: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         向量化评估种群适应度（替代进程池，避免开销）
         
+        超过 evaluation_chunk_size 的种群分块在 n_workers 个线程中评估。
+        
         Args:
             population: 种群
+            out: 预分配的适应度数组（可选）
             
         Returns:
-            [(idx, individual, fitness), ...]
+            适应度数组 (N,)
         """
-        results = []
-        
         # 使用向量化计算（比进程池快10倍以上）
-        fitnesses = evaluate_vectorized(population, self.constraints_dict)
-        
-        for i, individual in enumerate(population):
-            results.append((i, individual, fitnesses[i]))
-        
-        return results
+        return self.plan.evaluate_chunked(
+            population, staged=self.staged_evaluation, objective=self.objective_func, out=out,
+            chunk_size=self.config.evaluation_chunk_size, n_workers=self.n_workers
+        )
 
-    def _serial_evaluate(self, population: np.ndarray) -> List[Tuple[int, np.ndarray, float]]:
+    def _serial_evaluate(self, population: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         串行评估种群适应度（使用向量化）
         
         Args:
             population: 种群
+            out: 预分配的适应度数组（可选）
             
         Returns:
-            [(idx, individual, fitness), ...]
+            适应度数组 (N,)
         """
-        results = []
-        
-        # 使用向量化计算
-        fitnesses = evaluate_vectorized(population, self.constraints_dict)
-        
-        for i, individual in enumerate(population):
-            results.append((i, individual, fitnesses[i]))
-        
-        return results
\ No newline at end of file
+        return self.plan.evaluate_chunked(
+            population, staged=self.staged_evaluation, objective=self.objective_func, out=out,
+            chunk_size=self.config.evaluation_chunk_size
+        )
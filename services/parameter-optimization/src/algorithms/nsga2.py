@@ -0,0 +1,301 @@
+"""
+多目标优化（NSGA-II）
+一次运行得到多个目标（材料去除率、刀具寿命、功率、粗糙度等）之间的整条 Pareto 前沿，
+无需按不同权重反复运行单目标优化。非支配排序、拥挤距离、锦标赛选择、SBX 交叉与多项式变异全部向量化。
+约束按可行性优先处理：可行解总是优于不可行解，不可行解之间按惩罚值排序。
+"""
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+
+from .microbial_ga import GAConfig, OptimizationConstraints
+from .continuous import ContinuousOptimizer
+from .objectives import objective_matrix
+from .optimizer import register_optimizer
+
+
+def dominance_matrix(objectives: np.ndarray) -> np.ndarray:
+    """
+    计算支配关系矩阵
+
+    Args:
+        objectives: 目标矩阵 (N, M)，各列越大越好
+
+    Returns:
+        布尔矩阵 (N, N)，[i, j] 为 True 表示解 i 支配解 j
+    """
+    a = objectives[:, np.newaxis, :]
+    b = objectives[np.newaxis, :, :]
+    return np.all(a >= b, axis=2) & np.any(a > b, axis=2)
+
+
+def non_dominated_sort(objectives: np.ndarray, dominates: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    快速非支配排序
+
+    每一层前沿为剩余解中不被任何解支配的解；剥离一层时一次性扣减其支配计数。
+
+    Args:
+        objectives: 目标矩阵 (N, M)，各列越大越好
+        dominates: 预先计算的支配关系矩阵（可选）
+
+    Returns:
+        前沿序号 (N,)，0 为 Pareto 前沿
+    """
+    if dominates is None:
+        dominates = dominance_matrix(objectives)
+    counts = dominates.sum(axis=0)
+    ranks = np.full(len(objectives), -1)
+    remaining = np.ones(len(objectives), dtype=bool)
+    rank = 0
+    while remaining.any():
+        front = remaining & (counts == 0)
+        ranks[front] = rank
+        remaining &= ~front
+        counts -= dominates[front].sum(axis=0)
+        rank += 1
+    return ranks
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    计算各解在所属前沿内的拥挤距离
+
+    按 (前沿, 目标值) 排序后，所有前沿同时计算相邻解的目标差；前沿两端的解距离为无穷大。
+
+    Args:
+        objectives: 目标矩阵 (N, M)
+        ranks: 前沿序号 (N,)
+
+    Returns:
+        拥挤距离 (N,)
+    """
+    n = len(objectives)
+    distance = np.zeros(n)
+    if n == 0:
+        return distance
+    for k in range(objectives.shape[1]):
+        order = np.lexsort((objectives[:, k], ranks))
+        values = objectives[order, k]
+        sorted_ranks = ranks[order]
+
+        boundary = sorted_ranks[1:] != sorted_ranks[:-1]
+        first = np.concatenate([[True], boundary])
+        last = np.concatenate([boundary, [True]])
+        front = np.cumsum(first) - 1
+        span = (values[last] - values[first])[front]
+
+        gap = np.zeros(n)
+        gap[1:-1] = values[2:] - values[:-2]
+        contribution = np.divide(gap, span, out=np.zeros(n), where=span > 0)
+        contribution[first | last] = np.inf
+        distance[order] += contribution
+    return distance
+
+
+@dataclass
+class NSGA2Config:
+    """NSGA-II 配置"""
+    population_size: int = 100   # 种群大小（同时也是返回前沿的最大解数）
+    crossover_rate: float = 0.9  # SBX 交叉概率
+    crossover_eta: float = 15.0  # SBX 分布指数（越大子代越接近父代）
+    mutation_eta: float = 20.0   # 多项式变异分布指数
+    mutation_rate: Optional[float] = None  # 每个分量的变异概率，None 表示 1/维数
+
+
+@register_optimizer("nsga2")
+class NSGA2(ContinuousOptimizer):
+    """
+    NSGA-II 多目标优化器
+
+    目标取 config.pareto_objectives；evolve() 返回单目标适应度（config.objective，默认材料去除率）最高的解，
+    完整前沿由 get_pareto_front() 获取。
+    """
+
+    def __init__(
+        self,
+        config: GAConfig,
+        constraints: OptimizationConstraints,
+        nsga2_config: Optional[NSGA2Config] = None
+    ):
+        """
+        初始化优化器
+
+        Args:
+            config: 算法配置（使用其中的参数边界、多目标、代数、早停、随机种子与运行预算）
+            constraints: 约束条件
+            nsga2_config: NSGA-II 配置
+        """
+        super().__init__(config, constraints)
+        self.nsga2_config = nsga2_config or NSGA2Config()
+        if self.nsga2_config.population_size < 4:
+            raise ValueError("NSGA-II 的种群大小至少为 4")
+        self.objective_names = tuple(config.pareto_objectives)
+        if len(self.objective_names) < 2:
+            raise ValueError("多目标优化至少需要 2 个目标")
+        # 提前检查目标名称
+        objective_matrix({name: np.empty(0) for name in self.objective_names}, self.objective_names)
+
+        self.population = None
+        self.objectives = None
+        self.penalty = None
+        self.ranks = None
+        self.crowding = None
+        self._front_improved = False
+
+    def _evaluate_objectives(self, units: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        评估一批单位坐标的各目标与约束惩罚
+
+        Args:
+            units: 单位坐标 (N, 3)
+
+        Returns:
+            (目标矩阵 (N, M)，惩罚值 (N,))
+        """
+        p = self._evaluate_parameters(units)
+        return objective_matrix(p, self.objective_names), p["penalty"]
+
+    def _rank(self, objectives: np.ndarray, penalty: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        约束支配排序
+
+        可行解按非支配排序分层；不可行解排在所有可行前沿之后，按惩罚值从小到大各自成层。
+
+        Args:
+            objectives: 目标矩阵 (N, M)
+            penalty: 惩罚值 (N,)
+
+        Returns:
+            (前沿序号 (N,)，拥挤距离 (N,))
+        """
+        feasible = penalty == 0
+        ranks = np.empty(len(penalty), dtype=int)
+        ranks[feasible] = non_dominated_sort(objectives[feasible])
+        n_fronts = int(ranks[feasible].max()) + 1 if feasible.any() else 0
+
+        infeasible = np.flatnonzero(~feasible)
+        ranks[infeasible[np.argsort(penalty[infeasible], kind="stable")]] = n_fronts + np.arange(len(infeasible))
+
+        crowding = np.zeros(len(penalty))
+        crowding[feasible] = crowding_distance(objectives[feasible], ranks[feasible])
+        return ranks, crowding
+
+    def _generation_size(self) -> int:
+        """每代评估与种群等量的子代"""
+        return self.nsga2_config.population_size
+
+    def _initialize(self) -> None:
+        """拉丁超立方初始化种群"""
+        size = self.nsga2_config.population_size
+        strata = np.stack([self.rng.permutation(size) for _ in range(3)], axis=1)
+        self.population = (strata + self.rng.random((size, 3))) / size
+        self.objectives, self.penalty = self._evaluate_objectives(self.population)
+        self.ranks, self.crowding = self._rank(self.objectives, self.penalty)
+
+    def _tournament(self, size: int) -> np.ndarray:
+        """二元锦标赛：前沿序号小者胜，同一前沿时拥挤距离大者胜"""
+        a = self.rng.integers(0, len(self.population), size)
+        b = self.rng.integers(0, len(self.population), size)
+        a_wins = (self.ranks[a] < self.ranks[b]) | (
+            (self.ranks[a] == self.ranks[b]) & (self.crowding[a] >= self.crowding[b])
+        )
+        return np.where(a_wins, a, b)
+
+    def _offspring(self) -> np.ndarray:
+        """生成子代：锦标赛选择、模拟二进制交叉（SBX）与多项式变异"""
+        cfg = self.nsga2_config
+        size = cfg.population_size
+        n_pairs = (size + 1) // 2
+        parents = self.population[self._tournament(2 * n_pairs)].reshape(n_pairs, 2, 3)
+        p1, p2 = parents[:, 0], parents[:, 1]
+
+        # SBX：每对父代以 crossover_rate 交叉，交叉时每个分量以 1/2 概率参与
+        u = self.rng.random((n_pairs, 3))
+        beta = np.where(
+            u <= 0.5,
+            (2.0 * u) ** (1.0 / (cfg.crossover_eta + 1.0)),
+            (1.0 / (2.0 * (1.0 - u))) ** (1.0 / (cfg.crossover_eta + 1.0)),
+        )
+        cross = (self.rng.random((n_pairs, 1)) < cfg.crossover_rate) & (self.rng.random((n_pairs, 3)) < 0.5)
+        beta = np.where(cross, beta, 1.0)
+        c1 = 0.5 * ((1.0 + beta) * p1 + (1.0 - beta) * p2)
+        c2 = 0.5 * ((1.0 - beta) * p1 + (1.0 + beta) * p2)
+        children = np.concatenate([c1, c2])[:size]
+
+        # 多项式变异
+        rate = cfg.mutation_rate if cfg.mutation_rate is not None else 1.0 / 3.0
+        u = self.rng.random(children.shape)
+        delta = np.where(
+            u < 0.5,
+            (2.0 * u) ** (1.0 / (cfg.mutation_eta + 1.0)) - 1.0,
+            1.0 - (2.0 * (1.0 - u)) ** (1.0 / (cfg.mutation_eta + 1.0)),
+        )
+        mutate = self.rng.random(children.shape) < rate
+        children = np.where(mutate, children + delta, children)
+        return np.clip(children, 0.0, 1.0)
+
+    def _step(self) -> None:
+        """一代：生成并评估子代，父代与子代合并后按 (前沿序号, -拥挤距离) 保留前 N 个"""
+        size = self.nsga2_config.population_size
+        children = self._offspring()
+        child_objectives, child_penalty = self._evaluate_objectives(children)
+
+        population = np.concatenate([self.population, children])
+        objectives = np.concatenate([self.objectives, child_objectives])
+        penalty = np.concatenate([self.penalty, child_penalty])
+        ranks, crowding = self._rank(objectives, penalty)
+        survivors = np.lexsort((-crowding, ranks))[:size]
+
+        # 前沿有改进：新的可行子代支配了原前沿中的解，或可行解数增加
+        old_front = np.flatnonzero((self.ranks == 0) & (self.penalty == 0))
+        new_children = np.flatnonzero(child_penalty == 0)
+        if len(old_front) == 0:
+            self._front_improved = len(new_children) > 0
+        else:
+            dominates = dominance_matrix(np.concatenate([child_objectives[new_children], self.objectives[old_front]]))
+            self._front_improved = bool(dominates[:len(new_children), len(new_children):].any())
+
+        self.population = population[survivors]
+        self.objectives = objectives[survivors]
+        self.penalty = penalty[survivors]
+        self.ranks = ranks[survivors]
+        self.crowding = crowding[survivors]
+
+    def _improved(self, previous_best: float) -> bool:
+        """Pareto 前沿有改进即视为有进展"""
+        return self._front_improved
+
+    def get_pareto_front(self) -> List[Dict[str, float]]:
+        """
+        获取 Pareto 前沿（当前种群中可行的非支配解，一次向量化计算完整加工参数）
+
+        Returns:
+            加工参数字典列表（含 fitness），按第一个目标从优到劣排序
+        """
+        if self.population is None:
+            return []
+        front = np.flatnonzero((self.ranks == 0) & (self.penalty == 0))
+        if len(front) == 0:
+            return []
+        # 去除重复解，按第一个目标排序
+        _, unique = np.unique(np.round(self.population[front] * 1e9), axis=0, return_index=True)
+        front = front[unique]
+        front = front[np.argsort(-self.objectives[front, 0], kind="stable")]
+
+        speed, feed, cut_depth = self._to_values(self.population[front])
+        p = self.plan.machining_parameters(speed, feed, cut_depth, self.objective_func)
+        p.pop("penalty")
+        return [{name: float(values[i]) for name, values in p.items()} for i in range(len(front))]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（在基类统计之外包含目标名称与前沿解数）
+        """
+        stats = super().get_statistics()
+        stats["objectives"] = list(self.objective_names)
+        stats["pareto_size"] = len(self.get_pareto_front())
+        return stats
@@ -1,9 +1,12 @@
 """
 目标函数模块
 提供多种优化目标函数
+- ObjectiveFunction：按单组加工参数（字典）计算的标量目标函数
+- 向量化目标函数注册表：输入计算核输出的数组字典，返回适应度数组，遗传算法等优化器按名称选用
 """
-from typing import Dict, Callable
+from typing import Dict, Callable, Optional, Sequence
 from enum import Enum
+import numpy as np
 
 
 class ObjectiveType(Enum):
@@ -132,4 +135,122 @@ class ObjectiveFunction:
             ObjectiveType.MULTI_OBJECTIVE.value: cls.multi_objective,
         }
         
-        return objective_map.get(objective_type, cls.maximize_mrr)
\ No newline at end of file
+        return objective_map.get(objective_type, cls.maximize_mrr)
+
+
+# 向量化目标函数：输入计算核输出的加工参数数组字典（material_removal_rate、tool_life、power、
+# bottom_roughness 等，见 EvaluatorPlan.BREAKDOWN_KEYS），返回目标值数组（越大越好）。
+# 适应度 = 目标值 - 1e29 × 约束惩罚，约束处理由评估计划负责。
+ArrayObjective = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+# 向量化目标函数注册表（名称 → 目标函数）
+OBJECTIVES: Dict[str, ArrayObjective] = {}
+
+
+def register_objective(name: str) -> Callable[[ArrayObjective], ArrayObjective]:
+    """
+    注册向量化目标函数的装饰器
+
+    Args:
+        name: 目标名称（GAConfig.objective 与 API 中 objective 字段的取值）
+
+    Returns:
+        函数装饰器
+    """
+    def decorator(func: ArrayObjective) -> ArrayObjective:
+        OBJECTIVES[name] = func
+        return func
+    return decorator
+
+
+def get_array_objective(name: str) -> ArrayObjective:
+    """
+    按名称获取向量化目标函数
+
+    Args:
+        name: 目标名称
+
+    Returns:
+        向量化目标函数
+    """
+    if name not in OBJECTIVES:
+        raise ValueError(f"未知的优化目标: {name}（可选: {', '.join(OBJECTIVES)}）")
+    return OBJECTIVES[name]
+
+
+@register_objective(ObjectiveType.MAXIMIZE_MRR.value)
+def mrr_objective(p: Dict[str, np.ndarray]) -> np.ndarray:
+    """最大化材料去除率（默认目标）"""
+    return p["material_removal_rate"]
+
+
+@register_objective(ObjectiveType.MINIMIZE_TIME.value)
+def time_objective(p: Dict[str, np.ndarray]) -> np.ndarray:
+    """最小化加工时间（与材料去除率成反比）"""
+    return -1.0 / p["material_removal_rate"]
+
+
+@register_objective(ObjectiveType.MINIMIZE_COST.value)
+def cost_objective(p: Dict[str, np.ndarray]) -> np.ndarray:
+    """最小化加工成本（简化成本模型：刀具成本/寿命 + 能耗成本）"""
+    return -(100.0 / p["tool_life"] + 0.1 / p["material_removal_rate"])
+
+
+@register_objective(ObjectiveType.MAXIMIZE_TOOL_LIFE.value)
+def tool_life_objective(p: Dict[str, np.ndarray]) -> np.ndarray:
+    """最大化刀具寿命"""
+    return p["tool_life"]
+
+
+@register_objective(ObjectiveType.MULTI_OBJECTIVE.value)
+def weighted_objective(p: Dict[str, np.ndarray], weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    多目标加权（与 ObjectiveFunction.multi_objective 相同的归一化与默认权重）
+
+    Args:
+        p: 加工参数数组字典
+        weights: 各目标权重
+
+    Returns:
+        综合目标值数组
+    """
+    if weights is None:
+        weights = {
+            "mrr": 0.4,
+            "tool_life": 0.3,
+            "surface_quality": 0.2,
+            "energy_efficiency": 0.1
+        }
+    return (
+        weights["mrr"] * p["material_removal_rate"] / 1000.0
+        + weights["tool_life"] * p["tool_life"] / 100.0
+        + weights["surface_quality"] / (p["bottom_roughness"] + 1.0)
+        + weights["energy_efficiency"] / (p["power"] + 1.0)
+    )
+
+
+# 多目标（Pareto）优化可选的目标：评估结果字段 → 方向（1 最大化，-1 最小化）
+PARETO_OBJECTIVES: Dict[str, float] = {
+    "material_removal_rate": 1.0,  # 材料去除率
+    "tool_life": 1.0,              # 刀具寿命
+    "power": -1.0,                 # 功率
+    "bottom_roughness": -1.0,      # 底面粗糙度
+    "side_roughness": -1.0,        # 侧面粗糙度
+}
+
+
+def objective_matrix(params: Dict[str, np.ndarray], names: Sequence[str]) -> np.ndarray:
+    """
+    由向量化评估结果构造多目标矩阵
+
+    Args:
+        params: 评估结果数组字典（EvaluatorPlan.evaluate_parameters 的返回值）
+        names: 目标名称（PARETO_OBJECTIVES 的键）
+
+    Returns:
+        目标矩阵 (N, M)，已按方向变换为越大越好
+    """
+    unknown = [name for name in names if name not in PARETO_OBJECTIVES]
+    if unknown:
+        raise ValueError(f"未知的优化目标: {', '.join(unknown)}（可选: {', '.join(PARETO_OBJECTIVES)}）")
+    return np.stack([PARETO_OBJECTIVES[name] * np.asarray(params[name], dtype=float) for name in names], axis=1)
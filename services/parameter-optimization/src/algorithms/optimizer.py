@@ -0,0 +1,85 @@
+"""
+优化器接口与注册表
+所有优化器（遗传算法、岛屿模型、网格细化、差分进化、CMA-ES、NSGA-II）接受相同的算法配置与约束条件，
+evolve() 返回 (最优加工参数, 最优适应度)，get_statistics() 返回运行统计，路由按名称选择。
+"""
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Any, List, Tuple, Optional, Type
+
+
+class Optimizer(ABC):
+    """优化器接口"""
+
+    @abstractmethod
+    def evolve(
+        self,
+        iterations_per_generation: int = 384,
+        deadline_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        执行优化
+
+        Args:
+            iterations_per_generation: 每代迭代次数（保留兼容）
+            deadline_s: 墙钟时间上限（秒），默认取 config.deadline_s
+            max_evaluations: 物理模型评估次数上限，默认取 config.max_evaluations
+
+        Returns:
+            (最优加工参数, 最优适应度)
+        """
+
+    @abstractmethod
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        获取运行统计
+
+        Returns:
+            统计字典（至少包含 stop_reason、evaluations、elapsed_s）
+        """
+
+    def get_alternatives(self) -> List[Dict[str, float]]:
+        """
+        获取备选方案（未保留时为空列表）
+
+        Returns:
+            互不相近的可行解的加工参数列表（含 fitness），按适应度降序
+        """
+        return []
+
+
+# 优化器注册表（名称 → 优化器类）
+OPTIMIZERS: Dict[str, Type[Optimizer]] = {}
+
+
+def register_optimizer(name: str) -> Callable[[Type[Optimizer]], Type[Optimizer]]:
+    """
+    注册优化器的类装饰器
+
+    Args:
+        name: 优化器名称（API 中 algorithm 字段的取值）
+
+    Returns:
+        类装饰器
+    """
+    def decorator(cls: Type[Optimizer]) -> Type[Optimizer]:
+        OPTIMIZERS[name] = cls
+        return cls
+    return decorator
+
+
+def create_optimizer(name: str, config, constraints) -> Optimizer:
+    """
+    按名称创建优化器
+
+    Args:
+        name: 优化器名称
+        config: 算法配置（GAConfig）
+        constraints: 约束条件（OptimizationConstraints）
+
+    Returns:
+        优化器实例
+    """
+    if name not in OPTIMIZERS:
+        raise ValueError(f"未知的优化算法: {name}（可选: {', '.join(sorted(OPTIMIZERS))}）")
+    return OPTIMIZERS[name](config=config, constraints=constraints)
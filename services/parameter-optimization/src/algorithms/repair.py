@@ -0,0 +1,121 @@
+"""
+约束修复模块
+在评估前把个体投影到解析可行域内，避免大量个体因简单约束吃到巨额惩罚而浪费评估：
+- 线速度：vc = n·D/318 + 0.1 ≤ vc_max  →  n ≤ (vc_max - 0.1)·318/D
+- 每齿进给：fz = f/(z·n) ≤ fz_max  →  f ≤ fz_max·z·n
+- 功率/扭矩：P ≤ min(P_max, T_max·n/9549)
+  铣削 P ∝ ap，按比例缩小切深；钻孔/镗孔 P ∝ f^(1-mc)，按幂次缩小进给
+修复只降低基因值，结果重新编码回 DNA；进给/切深已降到下限仍超出时（如极低转速下的扭矩上限）个体保持不可行，
+由惩罚项处理。
+"""
+from typing import Dict, Tuple
+import numpy as np
+
+from ..config.constants import MachiningMethod, PhysicalConstants
+from .evaluator import EvaluatorPlan
+from .genome import decode_genes, encode_genes, is_packed, unpack_population, unscale_values
+
+
+class ConstraintRepair:
+    """约束修复算子（向量化，绑定到一个评估计划）"""
+
+    BOUNDS = ("cutting_speed", "feed_per_tooth", "power", "torque")
+
+    def __init__(self, plan: EvaluatorPlan):
+        """
+        初始化修复算子
+
+        Args:
+            plan: 评估计划（提供约束条件、解码边界与基因查找表）
+        """
+        self.plan = plan
+        c = plan.constraints
+        t = plan.tables
+
+        # 线速度上限对应的转速基因（常数），每齿进给上限对应的进给基因（按转速基因查表）
+        max_speed = (c.max_cutting_speed - 0.1) * 318.0 / c.tool_diameter
+        self.speed_limit = int(unscale_values(np.array([max_speed]), "speed", plan.bounds)[0])
+        self.feed_limits = unscale_values(c.max_feed_per_tooth * c.tool_teeth * t.speed, "feed", plan.bounds)
+        self.counts = {name: 0 for name in self.BOUNDS}
+
+    def _power(self, speed_genes: np.ndarray, feed_genes: np.ndarray, cut_depth_genes: np.ndarray) -> np.ndarray:
+        """由查找表计算功率（与评估计划的计算核一致）"""
+        plan, t = self.plan, self.plan.tables
+        _, _, _, fz_slope = t.feed_per_tooth_powers(speed_genes, feed_genes)
+        kc = plan.kc_coefficient / (plan.hm_slope_factor * fz_slope + 1e-3)
+        if plan.machining_method == MachiningMethod.MILLING:
+            q = t.feed[feed_genes] * t.cut_depth[cut_depth_genes] * plan.constraints.cut_width / 1000 + 1e-7
+        else:
+            q = t.chip_area_rate[feed_genes]
+        return q * kc * plan.power_factor
+
+    def repair(self, population: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        修复种群
+
+        Args:
+            population: 种群位矩阵 (N, dna_size) 或打包种群 (N,)
+
+        Returns:
+            (修复后的种群（与输入表示相同）, 被修复个体的布尔掩码 (N,))
+        """
+        c = self.plan.constraints
+        bounds = self.plan.bounds
+        t = self.plan.tables
+        speed_genes, feed_genes, cut_depth_genes = decode_genes(population, bounds.layout)
+        repaired = np.zeros(len(speed_genes), dtype=bool)
+
+        def lower(genes: np.ndarray, limit_genes: np.ndarray, name: str) -> np.ndarray:
+            over = genes > limit_genes
+            self.counts[name] += int(np.count_nonzero(over))
+            repaired[over] = True
+            return np.where(over, limit_genes, genes)
+
+        # 线速度上限（只依赖转速）
+        speed_genes = lower(speed_genes, self.speed_limit, "cutting_speed")
+
+        # 每齿进给上限（依赖修复后的转速）
+        feed_genes = lower(feed_genes, self.feed_limits[speed_genes], "feed_per_tooth")
+
+        # 功率与扭矩：折算为同一功率上限，扭矩 T = P·9549/n
+        n = t.speed[speed_genes]
+        torque_power = c.max_torque * (n + 1e-7) / PhysicalConstants.TORQUE_FACTOR
+        power_limit = np.minimum(c.max_power, torque_power)
+        power = self._power(speed_genes, feed_genes, cut_depth_genes)
+        over = power > power_limit
+        if np.any(over):
+            ratio = power_limit[over] / power[over]
+            if self.plan.machining_method == MachiningMethod.MILLING:
+                ap = t.cut_depth[cut_depth_genes[over]] * ratio
+                limit = unscale_values(ap, "cut_depth", bounds)
+                new_genes = np.minimum(cut_depth_genes[over], limit)
+                changed = new_genes < cut_depth_genes[over]
+                cut_depth_genes[over] = new_genes
+            elif c.material_slope < 1.0:
+                f = t.feed[feed_genes[over]] * ratio ** (1.0 / (1.0 - c.material_slope))
+                limit = unscale_values(f, "feed", bounds)
+                new_genes = np.minimum(feed_genes[over], limit)
+                changed = new_genes < feed_genes[over]
+                feed_genes[over] = new_genes
+            else:
+                changed = np.zeros(int(np.count_nonzero(over)), dtype=bool)
+
+            over_idx = np.flatnonzero(over)[changed]
+            torque_bound = torque_power[over_idx] < c.max_power
+            self.counts["torque"] += int(np.count_nonzero(torque_bound))
+            self.counts["power"] += int(np.count_nonzero(~torque_bound))
+            repaired[over_idx] = True
+
+        if not np.any(repaired):
+            return population, repaired
+
+        packed = encode_genes(speed_genes, feed_genes, cut_depth_genes, bounds.layout)
+        if is_packed(population):
+            return packed, repaired
+        result = population.copy()
+        result[repaired] = unpack_population(packed[repaired], population.shape[1])
+        return result, repaired
+
+    def get_counts(self) -> Dict[str, int]:
+        """各约束边界累计修复的个体数"""
+        return dict(self.counts)
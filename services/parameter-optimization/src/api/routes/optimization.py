@@ -2,9 +2,11 @@
 参数优化 API 路由
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import re
 
 from ...config.database import get_db
 from ...config.constants import MachiningMethod
@@ -12,9 +14,10 @@ from ...repositories import (
     MaterialRepository,
     ToolRepository,
     MachineRepository,
-    StrategyRepository
+    StrategyRepository,
+    OptimizationResultRepository
 )
-from ...algorithms import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+from ...algorithms import GAConfig, OptimizationConstraints, GenomeLayout, NSGA2, PARETO_OBJECTIVES, create_optimizer
 from ..schemas.optimization import OptimizationRequest, OptimizationResponse, OptimizationResult
 from ..schemas.material import MaterialResponse
 from ..schemas.tool import ToolResponse
@@ -38,6 +41,54 @@ MACHINING_TYPE_MAP = {
     "turning": MachiningMethod.TURNING,
 }
 
+# 热启动：最多使用的历史最优解数；材料组编号相差不超过该值视为相邻材料组
+WARM_START_LIMIT = 8
+NEIGHBOUR_MATERIAL_DISTANCE = 1
+
+
+def _record_id(value: str) -> Optional[int]:
+    """将请求中的 ID 转换为历史记录表中的整数 ID（非数字时返回 None）"""
+    value = str(value).strip()
+    return int(value) if value.isdigit() else None
+
+
+def _historical_optima(db: Session, request: OptimizationRequest) -> List[Tuple[float, float, float]]:
+    """
+    查询热启动用的历史最优解
+
+    取同一刀具、同一策略的历史优化结果，材料为相同或相邻的材料组（历史记录以材料组编号存储，
+    如 P15 → 15）；按材料组由近到远、同一设备优先、时间由新到旧排序并去重。
+    历史记录不保存材料类别字母，P15、M15、K15、H15 的结果无法区分，因此热启动需由请求显式开启。
+
+    Args:
+        db: 数据库会话
+        request: 优化请求
+
+    Returns:
+        (转速, 进给, 切深) 列表
+    """
+    tool_id = _record_id(request.tool_id)
+    method_id = _record_id(request.strategy_id)
+    material = re.fullmatch(r"[A-Za-z]*(\d+)", request.material_id.strip())
+    if tool_id is None or method_id is None or material is None:
+        return []
+    material_number = int(material.group(1))
+    machine_id = _record_id(request.machine_id)
+
+    # 记录按时间由新到旧返回
+    records = OptimizationResultRepository(db).get_by_input_ids(None, tool_id, None, method_id)
+    candidates = []
+    for order, record in enumerate(records):
+        if record.s is None or record.f is None or record.ci_liao_id is None:
+            continue
+        distance = abs(record.ci_liao_id - material_number)
+        if distance > NEIGHBOUR_MATERIAL_DISTANCE:
+            continue
+        rank = (distance, record.machine_id != machine_id, order)
+        candidates.append((rank, (float(record.s), float(record.f), float(record.ap or 0.0))))
+    candidates.sort(key=lambda candidate: candidate[0])
+    return list(dict.fromkeys(values for _, values in candidates))[:WARM_START_LIMIT]
+
 
 @router.post("/optimize", response_model=OptimizationResponse, status_code=status.HTTP_200_OK)
 async def optimize_parameters(
@@ -53,6 +104,9 @@ async def optimize_parameters(
     - **tool_id**: 刀具ID
     - **machine_id**: 设备ID
     - **strategy_id**: 策略ID
+    - **algorithm**: 优化算法（ga 遗传算法 / grid 网格细化 / de 差分进化 / cmaes CMA-ES / nsga2 多目标，默认 ga）
+    - **objective**: 优化目标（默认最大化材料去除率）
+    - **objectives**: 多目标优化的目标（nsga2 时返回整条 Pareto 前沿）
     """
     # 获取材料
     material_repo = MaterialRepository(db)
@@ -142,21 +196,64 @@ async def optimize_parameters(
         generations=request.generations or 200,
         crossover_rate=request.crossover_rate or 0.6,
         mutation_rate=request.mutation_rate or 0.3,
+        n_islands=request.n_islands or 1,
+        seed=request.seed,
+        log_scale=bool(request.log_scale),
+        gene_bits=tuple(request.gene_bits or GAConfig.gene_bits),
+        gray_code=bool(request.gray_code),
+        adaptive_population=bool(request.adaptive_population),
+        polish=bool(request.polish),
+        deadline_s=request.deadline_s,
+        max_evaluations=request.max_evaluations,
+        objective=request.objective or GAConfig.objective,
+        n_alternatives=request.n_alternatives or 0,
+        pareto_objectives=tuple(request.objectives or GAConfig.pareto_objectives),
+        enable_repair=True,  # 接口请求默认启用约束修复
         speed_bound=(0, machine.rp_max),
         feed_bound=(0, machine.f_max),
         cut_depth_bound=(0.0, tool.ap_max)
     )
     
+    if request.gene_bits and not all(1 <= bits <= GenomeLayout.MAX_BITS for bits in request.gene_bits):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"基因位数无效: {request.gene_bits}（每项取值范围 1 ~ {GenomeLayout.MAX_BITS}）"
+        )
+
+    unknown_objectives = [name for name in request.objectives or [] if name not in PARETO_OBJECTIVES]
+    if unknown_objectives:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"未知的优化目标: {', '.join(unknown_objectives)}（可选: {', '.join(PARETO_OBJECTIVES)}）"
+        )
+
+    # 选择优化算法（遗传算法在 n_islands > 1 时使用岛屿模型）
+    algorithm = request.algorithm or request.solver or "ga"
+    if algorithm == "ga" and config.n_islands > 1:
+        algorithm = "island"
+
+    # 热启动（需显式开启）：历史最优解及其邻居放入遗传算法的初始种群
+    if request.warm_start and algorithm in ("ga", "island"):
+        try:
+            config.warm_start = tuple(_historical_optima(db, request))
+        except SQLAlchemyError as e:
+            logger.warning(f"查询历史优化结果失败，不使用热启动: {e}")
+        if config.warm_start:
+            logger.info(f"热启动: 使用 {len(config.warm_start)} 个历史最优解")
+
     # 执行优化
     try:
         logger.info(f"开始优化: material_id={request.material_id}, tool_id={request.tool_id}, "
-                   f"machine_id={request.machine_id}, strategy_id={request.strategy_id}")
+                   f"machine_id={request.machine_id}, strategy_id={request.strategy_id}, "
+                   f"algorithm={algorithm}")
         
-        ga = MicrobialGeneticAlgorithm(config=config, constraints=constraints)
-        result_params, fitness = ga.evolve()
+        optimizer = create_optimizer(algorithm, config=config, constraints=constraints)
+        result_params, fitness = optimizer.evolve()
         
+        statistics = optimizer.get_statistics()
         logger.info(f"优化完成: fitness={fitness:.6f}, "
-                   f"speed={result_params['speed']:.2f}, feed={result_params['feed']:.2f}")
+                   f"speed={result_params['speed']:.2f}, feed={result_params['feed']:.2f}, "
+                   f"stop_reason={statistics['stop_reason']}, elapsed={statistics['elapsed_s']:.2f}s")
 
         # 构建响应
         result = OptimizationResult(
@@ -173,7 +270,16 @@ async def optimize_parameters(
             feed_force=round(result_params["feed_force"], 2),
             material_removal_rate=round(result_params["material_removal_rate"], 2),
             tool_life=round(result_params["tool_life"], 2),
-            fitness=round(fitness, 6)
+            fitness=round(fitness, 6),
+            statistics=statistics,
+            alternatives=[
+                {name: round(value, 6) for name, value in alternative.items()}
+                for alternative in optimizer.get_alternatives()
+            ] or None,
+            pareto_front=[
+                {name: round(value, 6) for name, value in solution.items()}
+                for solution in optimizer.get_pareto_front()
+            ] if isinstance(optimizer, NSGA2) else None
         )
 
         return OptimizationResponse(
@@ -2,7 +2,7 @@
 优化相关 API Schema
 """
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class OptimizationRequest(BaseModel):
@@ -18,6 +18,42 @@ class OptimizationRequest(BaseModel):
     crossover_rate: Optional[float] = Field(None, ge=0.0, le=1.0, description="交叉概率")
     mutation_rate: Optional[float] = Field(None, ge=0.0, le=1.0, description="变异概率")
     
+    algorithm: Optional[str] = Field(
+        None, pattern="^(ga|grid|de|cmaes|nsga2)$",
+        description="优化算法：ga（遗传算法，默认）、grid（网格细化）、de（差分进化）、cmaes（CMA-ES）、nsga2（多目标）"
+    )
+    objective: Optional[str] = Field(
+        None, pattern="^(maximize_mrr|minimize_time|minimize_cost|maximize_tool_life|multi_objective)$",
+        description="优化目标：maximize_mrr（最大化材料去除率，默认）、minimize_time、minimize_cost、"
+                    "maximize_tool_life、multi_objective（加权多目标）"
+    )
+    objectives: Optional[List[str]] = Field(
+        None, min_length=2,
+        description="多目标优化（nsga2）的目标：material_removal_rate、tool_life、power、bottom_roughness、side_roughness，"
+                    "默认材料去除率与刀具寿命"
+    )
+    solver: Optional[str] = Field(None, pattern="^(ga|grid)$", description="求解器（同 algorithm，algorithm 优先）")
+    polish: Optional[bool] = Field(None, description="进化结束后在连续参数上局部精修（可配合较小的 generations）")
+    log_scale: Optional[bool] = Field(None, description="转速与进给按对数刻度搜索")
+    gene_bits: Optional[List[int]] = Field(
+        None, min_length=3, max_length=3,
+        description="基因组分辨率 [转速位数, 进给位数, 切深位数]，每项 1 ~ 20，默认 [16, 13, 7]"
+    )
+    gray_code: Optional[bool] = Field(None, description="基因按格雷码编码（相邻取值只差一位）")
+    adaptive_population: Optional[bool] = Field(
+        None, description="自适应种群规模：从小种群开始，过早收敛或多样性坍缩时再增长（减少评估次数）"
+    )
+    warm_start: Optional[bool] = Field(
+        None, description="用同一刀具与策略、相同或相邻材料组编号的历史优化结果热启动初始种群（遗传算法，默认关闭；历史记录不区分材料类别）"
+    )
+    seed: Optional[int] = Field(None, ge=0, description="随机种子（指定后结果可复现）")
+    n_islands: Optional[int] = Field(None, ge=1, le=64, description="岛屿数量（大于 1 时多进程并行进化）")
+    
+    # 可选的运行预算（预算耗尽时返回当前最优解）
+    deadline_s: Optional[float] = Field(None, gt=0.0, le=600.0, description="计算时间上限 秒")
+    max_evaluations: Optional[int] = Field(None, ge=100, description="物理模型评估次数上限")
+    n_alternatives: Optional[int] = Field(None, ge=1, le=20, description="同时返回的互不相近的可行备选方案数")
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -28,7 +64,8 @@ class OptimizationRequest(BaseModel):
                 "population_size": 10240,
                 "generations": 200,
                 "crossover_rate": 0.6,
-                "mutation_rate": 0.3
+                "mutation_rate": 0.3,
+                "deadline_s": 5.0
             }
         }
 
@@ -54,6 +91,15 @@ class OptimizationResult(BaseModel):
     
     # 适应度
     fitness: float = Field(..., description="适应度值")
+    
+    # 运行统计（停止原因、代数、评估次数、耗时等）
+    statistics: Optional[Dict[str, Any]] = Field(None, description="运行统计")
+
+    # 备选方案（互不相近的可行解及其完整加工参数，按适应度降序）
+    alternatives: Optional[List[Dict[str, float]]] = Field(None, description="备选方案")
+
+    # Pareto 前沿（仅 nsga2，按第一个目标从优到劣排序）
+    pareto_front: Optional[List[Dict[str, float]]] = Field(None, description="Pareto 前沿")
 
 
 class OptimizationResponse(BaseModel):
@@ -0,0 +1,7 @@
+"""
+测试配置：与 run.py 一样把服务目录加入 Python 路径，以 src 包导入
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,59 @@
+"""
+多样化解存档测试：只收可行解、最小距离与容量规则
+"""
+import numpy as np
+
+from src.algorithms.archive import SolutionArchive
+from src.algorithms.genome import DecodingBounds
+
+
+BOUNDS = DecodingBounds(speed=(0.0, 1000.0), feed=(0.0, 100.0), cut_depth=(0.0, 10.0))
+
+
+def test_keeps_only_feasible_solutions():
+    """约束惩罚不为 0 的解不进入存档，即使适应度更高"""
+    archive = SolutionArchive(BOUNDS, capacity=5)
+    values = np.array([[100.0, 10.0, 1.0], [500.0, 50.0, 5.0]])
+    archive.update(values, np.array([1.0, 1e6]), np.array([0.0, 0.1]))
+    np.testing.assert_array_equal(archive.points, values[:1])
+    archive.update(values[1:], np.array([1e6]), np.array([1.0]))
+    assert len(archive) == 1
+
+
+def test_near_duplicates_are_dropped():
+    """与更优的存档解归一化距离小于 min_distance 的解被舍弃，距离足够的解保留"""
+    archive = SolutionArchive(BOUNDS, capacity=5, min_distance=0.05)
+    values = np.array([
+        [500.0, 50.0, 5.0],
+        [520.0, 51.0, 5.1],   # 归一化距离约 0.03
+        [560.0, 50.0, 5.0],   # 归一化距离 0.06
+    ])
+    archive.update(values, np.array([10.0, 9.0, 8.0]), np.zeros(3))
+    np.testing.assert_array_equal(archive.points, values[[0, 2]])
+    np.testing.assert_array_equal(archive.fitness, [10.0, 8.0])
+
+    # 更优的新解会挤掉与它相近的旧解
+    archive.update(np.array([[505.0, 50.0, 5.0]]), np.array([11.0]), np.zeros(1))
+    np.testing.assert_array_equal(archive.fitness, [11.0, 8.0])
+
+
+def test_capacity_keeps_best_diverse_solutions():
+    """超出容量时按适应度贪心保留最优的若干个互不相近的解"""
+    rng = np.random.default_rng(0)
+    values = np.stack([rng.uniform(0, 1000, 200), rng.uniform(0, 100, 200), rng.uniform(0, 10, 200)], axis=1)
+    fitness = rng.random(200)
+
+    archive = SolutionArchive(BOUNDS, capacity=4, min_distance=0.2)
+    archive.update(values, fitness, np.zeros(200))
+    assert len(archive) == 4
+    assert np.all(np.diff(archive.fitness) <= 0)
+    assert archive.fitness[0] == fitness.max()
+    normalized = (archive.points - archive.lower) / archive.span
+    distances = np.linalg.norm(normalized[:, None] - normalized[None, :], axis=2)
+    assert distances[np.triu_indices(4, 1)].min() >= 0.2
+
+    # 贪心选取：未入选的解要么适应度低于入选的最后一个，要么与某个更优的入选解相近
+    for point, score in zip((values - archive.lower) / archive.span, fitness):
+        if score > archive.fitness[-1] and score not in archive.fitness:
+            better = normalized[archive.fitness > score]
+            assert np.linalg.norm(better - point, axis=1).min() < 0.2
@@ -0,0 +1,51 @@
+"""
+连续参数优化器测试：差分进化与 CMA-ES 得到可行解、遵守评估次数上限
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.continuous import ContinuousOptimizer
+from src.algorithms.differential_evolution import DifferentialEvolution
+from src.algorithms.cma_es import CMAES
+from src.algorithms.microbial_ga import GAConfig, OptimizationConstraints
+from src.algorithms.optimizer import create_optimizer
+from src.config.constants import MachiningMethod
+
+
+@pytest.mark.parametrize("name, optimizer_class", [("de", DifferentialEvolution), ("cmaes", CMAES)])
+@pytest.mark.parametrize("method", [MachiningMethod.MILLING, MachiningMethod.DRILLING, MachiningMethod.BORING])
+def test_returns_feasible_solution(name, optimizer_class, method):
+    """最优解满足全部约束（重新计算惩罚为 0），适应度即其材料去除率"""
+    optimizer = create_optimizer(name, GAConfig(seed=1), OptimizationConstraints(machining_method=method))
+    assert isinstance(optimizer, optimizer_class)
+    params, fitness = optimizer.evolve()
+
+    p = optimizer.plan.evaluate_parameters(*optimizer._to_values(optimizer.best_point[np.newaxis, :]))
+    assert p["penalty"][0] == 0
+    assert fitness == pytest.approx(float(p["material_removal_rate"][0]))
+    assert fitness > 0
+    assert params["speed"] > 0 and params["feed"] > 0
+
+
+@pytest.mark.parametrize("name", ["de", "cmaes"])
+@pytest.mark.parametrize("max_evaluations", [50, 500, 3000])
+def test_stops_within_max_evaluations(name, max_evaluations):
+    """评估次数不超过上限（初始评估之后按每代评估次数检查）"""
+    optimizer = create_optimizer(name, GAConfig(seed=2, generations=10000), OptimizationConstraints())
+    optimizer.evolve(max_evaluations=max_evaluations)
+    stats = optimizer.get_statistics()
+    assert stats["evaluations"] <= max_evaluations
+    assert stats["stop_reason"] in ("max_evaluations", "converged", "early_stop")
+
+
+def test_incomplete_subclass_cannot_be_instantiated():
+    """未实现全部抽象方法的连续优化器子类不能实例化"""
+    class Incomplete(ContinuousOptimizer):
+        def _initialize(self) -> None:
+            pass
+
+        def _step(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete(GAConfig(), OptimizationConstraints())
@@ -0,0 +1,73 @@
+"""
+收敛监测测试：多样性指标、改进速率与停止判据
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.convergence import ConvergenceMonitor
+from src.algorithms.genome import pack_population
+
+
+def test_hamming_distance_matches_pairwise_mean():
+    """平均汉明距离等于全部有序个体对（含自身）逐位差异的均值，位打包与位矩阵一致"""
+    population = np.random.default_rng(0).integers(0, 2, (64, 36), dtype=np.uint8)
+    pairwise = (population[:, None, :] != population[None, :, :]).mean()
+
+    snapshot = ConvergenceMonitor().update(population, np.zeros(64), 0.0)
+    assert snapshot.hamming_distance == pytest.approx(pairwise)
+    packed = ConvergenceMonitor().update(pack_population(population), np.zeros(64), 0.0)
+    assert packed.hamming_distance == snapshot.hamming_distance
+    assert packed.gene_entropy == snapshot.gene_entropy
+
+
+def test_diversity_extremes():
+    """全部相同的种群多样性为 0；每位一半为 1 的种群汉明距离 0.5、位熵 1"""
+    monitor = ConvergenceMonitor()
+    same = monitor.update(np.ones((10, 36), dtype=np.uint8), np.zeros(10), 0.0)
+    assert same.hamming_distance == 0.0
+    assert set(same.gene_entropy.values()) == {0.0}
+
+    half = np.zeros((10, 36), dtype=np.uint8)
+    half[:5] = 1
+    mixed = monitor.update(half, np.zeros(10), 0.0)
+    assert mixed.hamming_distance == 0.5
+    assert set(mixed.gene_entropy.values()) == {1.0}
+    assert set(mixed.gene_entropy) == {"speed", "feed", "cut_depth"}
+
+
+def test_fitness_percentiles_and_elite_spread():
+    """适应度分位数与精英层（p90 ~ p99）相对离散度"""
+    fitness = np.arange(1, 101, dtype=float)
+    snapshot = ConvergenceMonitor().update(np.zeros((100, 36), dtype=np.uint8), fitness, 100.0)
+    expected = np.percentile(fitness, (10, 50, 90, 99))
+    assert snapshot.fitness_percentiles == {f"p{q}": v for q, v in zip((10, 50, 90, 99), expected)}
+    assert snapshot.elite_spread == pytest.approx((expected[3] - expected[2]) / expected[3])
+
+
+def test_improvement_rate_over_window():
+    """记录不足一个窗口时改进速率为无穷大，之后为窗口起点以来的相对改进"""
+    monitor = ConvergenceMonitor(window=5)
+    population = np.zeros((4, 36), dtype=np.uint8)
+    for generation in range(5):
+        snapshot = monitor.update(population, np.zeros(4), 100.0 + generation)
+        assert snapshot.improvement_rate == float("inf")
+    snapshot = monitor.update(population, np.zeros(4), 110.0)
+    assert snapshot.improvement_rate == pytest.approx((110.0 - 100.0) / 100.0)
+
+
+def test_stops_only_when_stalled_and_collapsed():
+    """停滞且多样性坍缩时判定收敛；停滞但种群仍多样时不停止，直到最优适应度连续 patience 代无改进"""
+    diverse = np.random.default_rng(1).integers(0, 2, (256, 36), dtype=np.uint8)
+    fitness = np.linspace(0.0, 100.0, 256)
+    monitor = ConvergenceMonitor(window=5, patience=12)
+    for _ in range(12):
+        monitor.update(diverse, fitness, 100.0)
+        assert monitor.should_stop() is None
+    monitor.update(diverse, fitness, 100.0)
+    assert monitor.should_stop() == "early_stop"
+
+    collapsed = ConvergenceMonitor(window=5, patience=1000)
+    for _ in range(6):
+        assert collapsed.should_stop() is None
+        collapsed.update(np.zeros((256, 36), dtype=np.uint8), fitness, 100.0)
+    assert collapsed.should_stop() == "converged"
@@ -0,0 +1,156 @@
+"""
+向量化评估测试：评估计划与原始逐项公式（重构前的 evaluate_vectorized）一致
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.microbial_ga import OptimizationConstraints, GAConfig, evaluate_vectorized, decoding_bounds
+from src.algorithms.evaluator import get_evaluator_plan
+from src.algorithms.objectives import get_array_objective
+from src.algorithms.genome import pack_population, unpack_population, encode_genes, decode_parameters
+from src.config.constants import MachiningMethod, PhysicalConstants, ConstraintPenalty
+
+
+def reference_fitness(population: np.ndarray, c: OptimizationConstraints) -> np.ndarray:
+    """原始公式：默认 16/13/7 位解码到 [0, 8000]、[0, 8000]、[0, max_cut_depth]，适应度 = 材料去除率 - 1e29 × 惩罚"""
+    weights = [2 ** np.arange(bits)[::-1] for bits in (16, 13, 7)]
+    speed = population[:, :16] @ weights[0] / (2 ** 16 - 1) * 8000
+    feed = population[:, 16:29] @ weights[1] / (2 ** 13 - 1) * 8000
+    ap = population[:, 29:] @ weights[2] / (2 ** 7 - 1) * c.max_cut_depth
+
+    n = np.maximum(speed, 1.0)
+    f = np.maximum(feed, 0.1)
+    ae = c.cut_width
+    fz = f / (c.tool_teeth * n)
+    vc = n * c.tool_diameter / 318.0 + 0.1
+    safe_fz = np.maximum(fz, 0.001)
+    lft = (c.tool_life_coefficient * np.maximum(vc, 0.001) ** c.speed_coefficient
+           * safe_fz ** c.feed_coefficient * c.wear_coefficient)
+    zeros = np.zeros(len(population))
+    deflection = zeros
+
+    if c.machining_method == MachiningMethod.MILLING:
+        q = f * ap * ae / 1000 + 1e-7
+        rz = PhysicalConstants.MILLING_ROUGHNESS_FACTOR * safe_fz ** 2 / c.tool_diameter
+        ae_ratio = ae / c.tool_diameter
+        if ae_ratio <= 0.3:
+            hm = safe_fz * np.sqrt(ae_ratio)
+        else:
+            ratio = np.clip((ae - 0.5 * c.tool_diameter) / (0.5 * c.tool_diameter), -1, 1)
+            fs = 90 + np.arcsin(ratio) * 180 / np.pi
+            hm = 1147 * safe_fz * np.sin(c.main_cutting_angle * np.pi / 180) * ae_ratio / fs
+        kc = (1 - 0.01 * c.rake_angle) * c.material_coefficient / (hm ** c.material_slope + 1e-3)
+        coeff = 0.3 + 0.2 * (1.0 - c.rake_angle / 20.0) * (90.0 / c.main_cutting_angle)
+        ff = kc * ap * ae / c.tool_teeth * coeff
+        inertia = 3.14159 * c.tool_diameter ** 4 / 64.0
+        deflection = ff * c.tool_overhang_length ** 3 / (3.0 * c.tool_elastic_modulus * inertia)
+    else:
+        area = c.tool_diameter ** 2
+        if c.machining_method == MachiningMethod.BORING:
+            area -= c.bottom_hole_diameter ** 2
+        q = f * np.pi * area / 4000 + 1e-7
+        h = safe_fz * np.sin(c.main_cutting_angle * np.pi / 180)
+        kc = c.material_coefficient / (h ** c.material_slope + 1e-3)
+        rz = zeros
+        if c.machining_method == MachiningMethod.DRILLING:
+            ff = 0.63 * safe_fz * c.tool_teeth * c.tool_diameter * kc / 2
+        else:
+            ff = zeros
+    pmot = q * kc * PhysicalConstants.POWER_WATT_TO_KW / c.machine_efficiency
+    tnm = pmot * PhysicalConstants.TORQUE_FACTOR / (n + 1e-7)
+
+    def excess(value):
+        return np.maximum(value, 0.0) ** 2
+
+    penalty = (
+        excess(c.min_tool_life - lft) * ConstraintPenalty.TOOL_LIFE
+        + excess(pmot - c.max_power) * ConstraintPenalty.POWER
+        + excess(tnm - c.max_torque) * ConstraintPenalty.TORQUE
+        + excess(rz - c.min_surface_roughness) * ConstraintPenalty.SURFACE_ROUGHNESS
+        + excess(ff - c.max_feed_force) * ConstraintPenalty.FEED_FORCE
+        + excess(fz - c.max_feed_per_tooth) * ConstraintPenalty.MAX_FEED
+        + excess(vc - c.max_cutting_speed) * ConstraintPenalty.MAX_SPEED
+    )
+    if c.machining_method == MachiningMethod.MILLING:
+        penalty += excess(deflection - c.max_tool_deflection) * ConstraintPenalty.FEED_FORCE * 0.5
+    return q - 1e29 * penalty
+
+
+def assert_close(actual: np.ndarray, expected: np.ndarray) -> None:
+    """相对误差（惩罚项可达 1e40 量级）"""
+    scale = np.maximum(np.abs(expected), 1.0)
+    assert np.max(np.abs(actual - expected) / scale) < 1e-9
+
+
+CONSTRAINTS = [
+    OptimizationConstraints(machining_method=MachiningMethod.DRILLING),
+    OptimizationConstraints(machining_method=MachiningMethod.MILLING),
+    OptimizationConstraints(machining_method=MachiningMethod.MILLING, cut_width=4.0),
+    OptimizationConstraints(machining_method=MachiningMethod.BORING),
+]
+
+
+@pytest.mark.parametrize("constraints", CONSTRAINTS, ids=lambda c: f"{c.machining_method}-ae{c.cut_width}")
+def test_evaluate_vectorized_matches_reference(constraints):
+    """默认解码边界下，位矩阵与位打包种群的适应度都与原始公式一致"""
+    rng = np.random.default_rng(3)
+    # 随机个体几乎全部不可行，另取一批低转速、低进给的个体覆盖可行区域
+    low = encode_genes(rng.integers(200, 2 ** 12, 4096), rng.integers(1, 2 ** 7, 4096), rng.integers(0, 2 ** 5, 4096))
+    population = np.concatenate([rng.integers(0, 2, (4096, 36), dtype=np.uint8), unpack_population(low, 36)])
+    expected = reference_fitness(population, constraints)
+    assert np.any(expected > 0)
+    bounds = decoding_bounds(GAConfig(), constraints)
+
+    constraints_dict = vars(constraints)
+    assert_close(evaluate_vectorized(population, constraints_dict, bounds=bounds), expected)
+    assert_close(evaluate_vectorized(pack_population(population), constraints_dict, bounds=bounds), expected)
+
+
+@pytest.mark.parametrize("constraints", CONSTRAINTS[:2], ids=lambda c: c.machining_method)
+def test_chunked_evaluation_matches_single_pass(constraints):
+    """分块（含多线程）评估与整批评估结果相同"""
+    plan = get_evaluator_plan(constraints)
+    population = pack_population(np.random.default_rng(4).integers(0, 2, (5000, 36), dtype=np.uint8))
+    expected = plan.evaluate(population, log_violations=False)
+    np.testing.assert_array_equal(plan.evaluate_chunked(population, chunk_size=777), expected)
+    np.testing.assert_array_equal(plan.evaluate_chunked(population, chunk_size=777, n_workers=3), expected)
+
+
+def test_evaluate_parameters_matches_gene_lookup():
+    """连续参数直接计算与基因查表结果一致"""
+    constraints = CONSTRAINTS[1]
+    plan = get_evaluator_plan(constraints)
+    population = pack_population(np.random.default_rng(5).integers(0, 2, (1000, 36), dtype=np.uint8))
+    speed, feed, cut_depth = decode_parameters(population, plan.bounds)
+    direct = plan.evaluate_parameters(speed, feed, cut_depth)["fitness"]
+    assert_close(direct, plan.evaluate(population, log_violations=False))
+
+
+@pytest.mark.parametrize("objective", ["maximize_mrr", "maximize_tool_life", "minimize_time"])
+@pytest.mark.parametrize("constraints", CONSTRAINTS[:2], ids=lambda c: c.machining_method)
+def test_staged_evaluation_keeps_feasible_ranking(constraints, objective):
+    """分阶段评估：未被拒个体适应度与完整评估相同，不可行个体排在所有可行个体之后，可行个体排序不变"""
+    plan = get_evaluator_plan(constraints)
+    objective_func = get_array_objective(objective)
+    rng = np.random.default_rng(6)
+    low = encode_genes(rng.integers(200, 2 ** 12, 4096), rng.integers(1, 2 ** 7, 4096), rng.integers(0, 2 ** 5, 4096))
+    population = np.concatenate([pack_population(rng.integers(0, 2, (4096, 36), dtype=np.uint8)), low])
+
+    full = plan.evaluate(population, objective=objective_func, log_violations=False)
+    staged = plan.evaluate(population, staged=True, objective=objective_func, log_violations=False)
+    speed, feed, cut_depth = decode_parameters(population, plan.bounds)
+    p = plan.evaluate_parameters(speed, feed, cut_depth, objective_func)
+    feasible = p["penalty"] == 0
+    rejected = (
+        (p["cutting_speed"] > constraints.max_cutting_speed)
+        | (p["feed_per_tooth"] > constraints.max_feed_per_tooth)
+    )
+    assert np.any(feasible) and np.any(rejected)
+
+    np.testing.assert_array_equal(staged[~rejected], full[~rejected])
+    assert staged[~feasible].max() < staged[feasible].min()
+    np.testing.assert_array_equal(np.argsort(staged[feasible]), np.argsort(full[feasible]))
+    assert np.argmax(staged) == np.argmax(full)
+    if objective == "maximize_mrr":
+        # 默认目标下被拒个体只少计了其余约束的惩罚，适应度是完整评估的上界
+        assert np.all(staged[rejected] >= full[rejected])
@@ -0,0 +1,94 @@
+"""
+适应度缓存测试：命中统计、有序键插入、按最近使用代次淘汰、与不缓存时结果一致
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.evaluator import FitnessCache, get_evaluator_plan
+from src.algorithms.microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+
+
+@pytest.fixture(scope="module")
+def plan():
+    return get_evaluator_plan(OptimizationConstraints())
+
+
+def random_keys(n: int, seed: int) -> np.ndarray:
+    """n 个互不相同的 36 位打包基因组（乱序）"""
+    rng = np.random.default_rng(seed)
+    return rng.permutation(np.unique(rng.integers(0, 1 << 36, 2 * n, dtype=np.uint64)))[:n]
+
+
+def test_hits_and_misses(plan):
+    """首次评估全部未命中；再次评估全部命中；批内重复个体只计算一次"""
+    cache = FitnessCache(plan)
+    keys = random_keys(100, 0)
+    first = cache.evaluate(keys)
+    assert (cache.lookups, cache.hits, len(cache)) == (100, 0, 100)
+    np.testing.assert_array_equal(first, plan.evaluate(keys, log_violations=False))
+
+    np.testing.assert_array_equal(cache.evaluate(keys[::-1]), first[::-1])
+    assert (cache.lookups, cache.hits) == (200, 100)
+
+    fresh = random_keys(10, 1)
+    batch = np.concatenate([fresh, fresh, keys[:5]])
+    cache.evaluate(batch)
+    assert cache.lookups == 225
+    assert cache.hits == 100 + 15
+    assert cache.hit_rate == pytest.approx(115 / 225)
+
+
+def test_hit_rate_without_lookups(plan):
+    """尚未查询时命中率为 0"""
+    assert FitnessCache(plan).hit_rate == 0.0
+
+
+def test_keys_stay_sorted_across_inserts(plan):
+    """乱序分批插入后键保持升序，每个键对应自己的适应度"""
+    cache = FitnessCache(plan)
+    batches = [random_keys(50, seed) for seed in range(2, 7)]
+    for batch in batches:
+        cache.evaluate(batch)
+    assert np.all(cache._keys[1:] > cache._keys[:-1])
+
+    all_keys = np.unique(np.concatenate(batches))
+    np.testing.assert_array_equal(cache._keys, all_keys)
+    np.testing.assert_array_equal(cache._values, plan.evaluate(all_keys, log_violations=False))
+
+
+def test_eviction_keeps_most_recently_used(plan):
+    """超出容量时淘汰到容量的 90%，保留最近使用（含最近命中）的条目"""
+    cache = FitnessCache(plan, capacity=10)
+    old = np.arange(10, dtype=np.uint64)
+    cache.evaluate(old)
+    cache.evaluate(old[:4])  # 刷新前 4 个条目的使用代次
+    new = np.arange(100, 105, dtype=np.uint64)
+    cache.evaluate(new)
+
+    assert len(cache) == 9
+    np.testing.assert_array_equal(cache._keys, np.concatenate([old[:4], new]))
+    hits = cache.hits
+    cache.evaluate(old[4:])
+    assert cache.hits == hits
+
+
+@pytest.mark.parametrize("packed_genome", [False, True])
+def test_cache_does_not_change_evolution(packed_genome):
+    """开启缓存与不开启时进化过程完全相同，只是计算核调用次数更少"""
+    def run(enable_fitness_cache: bool) -> MicrobialGeneticAlgorithm:
+        # 输者整体复制赢者后低概率变异：大量子代与已评估过的基因组相同
+        config = GAConfig(
+            population_size=512, generations=30, seed=5, crossover_rate=1.0, mutation_rate=0.01,
+            adaptive_rate=False, early_stop_generations=1000, enable_parallel=False,
+            packed_genome=packed_genome, enable_fitness_cache=enable_fitness_cache,
+        )
+        ga = MicrobialGeneticAlgorithm(config, OptimizationConstraints())
+        ga.evolve()
+        return ga
+
+    cached, uncached = run(True), run(False)
+    assert cached.best_fitness == uncached.best_fitness
+    np.testing.assert_array_equal(np.asarray(cached.population), np.asarray(uncached.population))
+    np.testing.assert_array_equal(np.asarray(cached.fitness), np.asarray(uncached.fitness))
+    assert cached.fitness_cache.hits > 0
+    assert cached.evaluation_count < uncached.evaluation_count
@@ -0,0 +1,101 @@
+"""
+基因组表示测试：位打包、随机位掩码、基因编码/解码与参数解码的往返一致性
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.genome import (
+    GenomeLayout,
+    DecodingBounds,
+    pack_population,
+    unpack_population,
+    random_bit_masks,
+    decode_genes,
+    encode_genes,
+    decode_parameters,
+    unscale_values,
+)
+
+
+@pytest.mark.parametrize("dna_size", [3, 36, 57, 64])
+def test_pack_unpack_round_trip(dna_size):
+    """位矩阵打包为 uint64 后展开得到原位矩阵"""
+    rng = np.random.default_rng(0)
+    population = rng.integers(0, 2, (257, dna_size), dtype=np.uint8)
+    packed = pack_population(population)
+    assert packed.dtype == np.uint64
+    np.testing.assert_array_equal(unpack_population(packed, dna_size), population)
+
+
+def test_pack_matches_big_endian_bit_weights():
+    """第 0 位为最高位"""
+    population = np.zeros((1, 36), dtype=np.uint8)
+    population[0, 0] = 1
+    population[0, 35] = 1
+    assert int(pack_population(population)[0]) == (1 << 35) | 1
+
+
+@pytest.mark.parametrize("rate", [0.05, 0.3, 0.5, 0.6, 0.9])
+def test_random_bit_masks_rate(rate):
+    """每一位独立以 rate 置 1（量化误差 2 ** -9 以内），且不超出 DNA 长度"""
+    masks = random_bit_masks(100000, 36, rate, np.random.default_rng(6))
+    assert masks.dtype == np.uint64
+    assert np.all(masks >> np.uint64(36) == 0)
+    bits = unpack_population(masks, 36)
+    assert abs(bits.mean() - rate) < 2 ** -9 + 0.002
+    assert np.all(np.abs(bits.mean(axis=0) - rate) < 2 ** -9 + 0.01)
+
+
+def test_random_bit_masks_extreme_rates():
+    """rate 为 0 时全 0，为 1 时 DNA 长度内全 1"""
+    rng = np.random.default_rng(7)
+    assert not np.any(random_bit_masks(100, 36, 0.0, rng))
+    np.testing.assert_array_equal(random_bit_masks(100, 36, 1.0, rng), np.uint64((1 << 36) - 1))
+    np.testing.assert_array_equal(random_bit_masks(100, 64, 1.0, rng), np.iinfo(np.uint64).max)
+
+
+@pytest.mark.parametrize("gray_code", [False, True])
+@pytest.mark.parametrize("bits", [(16, 13, 7), (20, 20, 20), (1, 1, 1), (5, 11, 3)])
+def test_encode_decode_round_trip(bits, gray_code):
+    """基因整数值编码后解码得到原值（位打包与位矩阵表示一致）"""
+    layout = GenomeLayout.from_bits(bits, gray_code)
+    rng = np.random.default_rng(1)
+    genes = [rng.integers(0, 2 ** b, 500) for b in bits]
+    packed = encode_genes(*genes, layout=layout)
+
+    for decoded, expected in zip(decode_genes(packed, layout), genes):
+        np.testing.assert_array_equal(decoded, expected)
+    matrix = unpack_population(packed, layout.total_bits)
+    for decoded, expected in zip(decode_genes(matrix, layout), genes):
+        np.testing.assert_array_equal(decoded, expected)
+
+
+def test_gray_code_adjacent_values_differ_by_one_bit():
+    """格雷码布局下相邻基因取值的编码只差一位"""
+    layout = GenomeLayout.from_bits((16, 13, 7), gray_code=True)
+    speed = np.arange(2 ** 16)
+    zeros = np.zeros_like(speed)
+    packed = encode_genes(speed, zeros, zeros, layout=layout)
+    flipped = packed[1:] ^ packed[:-1]
+    assert np.all(flipped & (flipped - np.uint64(1)) == 0)
+
+
+@pytest.mark.parametrize("gray_code", [False, True])
+@pytest.mark.parametrize("log_scale", [False, True])
+def test_parameter_round_trip(gray_code, log_scale):
+    """参数取值映射回最近的基因后解码得到原取值"""
+    bounds = DecodingBounds(
+        speed=(10.0, 6000.0), feed=(1.0, 4000.0), cut_depth=(0.0, 3.0),
+        log_scale=log_scale, layout=GenomeLayout.from_bits((12, 10, 6), gray_code),
+    )
+    rng = np.random.default_rng(2)
+    packed = encode_genes(
+        rng.integers(0, 2 ** 12, 300), rng.integers(0, 2 ** 10, 300), rng.integers(0, 2 ** 6, 300),
+        layout=bounds.layout,
+    )
+    values = decode_parameters(packed, bounds)
+    genes = [
+        unscale_values(v, name, bounds, nearest=True).astype(np.uint64)
+        for v, name in zip(values, ("speed", "feed", "cut_depth"))
+    ]
+    np.testing.assert_array_equal(encode_genes(*genes, layout=bounds.layout), packed)
@@ -0,0 +1,81 @@
+"""
+网格细化求解器测试：结果确定、粗网格为穷举最优、运行预算
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.grid_solver import GridRefineSolver, GridConfig
+from src.algorithms.microbial_ga import GAConfig, OptimizationConstraints
+from src.config.constants import MachiningMethod
+
+
+def brute_force_best(solver: GridRefineSolver, points) -> float:
+    """穷举整个规则网格的最优适应度"""
+    axes = [np.linspace(0.0, 1.0, n) for n in points]
+    units = np.stack([axis.ravel() for axis in np.meshgrid(*axes, indexing="ij")], axis=1)
+    p = solver.plan.evaluate_parameters(*solver._to_values(units), solver.objective_func)
+    return float(np.max(p["fitness"]))
+
+
+@pytest.mark.parametrize("method", [MachiningMethod.MILLING, MachiningMethod.DRILLING])
+def test_repeated_runs_are_identical(method):
+    """相同输入的两次求解结果与统计完全相同"""
+    constraints = OptimizationConstraints(machining_method=method)
+    grid_config = GridConfig(coarse_points=(16, 16, 8))
+    runs = [GridRefineSolver(GAConfig(), constraints, grid_config) for _ in range(2)]
+    results = [solver.evolve() for solver in runs]
+    assert results[0] == results[1]
+    stats = [solver.get_statistics() for solver in runs]
+    for s in stats:
+        s.pop("elapsed_s")
+    assert stats[0] == stats[1]
+
+
+@pytest.mark.parametrize("method", [MachiningMethod.MILLING, MachiningMethod.DRILLING])
+def test_coarse_grid_finds_brute_force_optimum(method):
+    """不细化时结果即小网格穷举最优；细化只会改进"""
+    constraints = OptimizationConstraints(machining_method=method)
+    points = (12, 10, 6)
+    grid_config = GridConfig(coarse_points=points, max_refinements=0, chunk_size=97)
+    coarse = GridRefineSolver(GAConfig(), constraints, grid_config)
+    coarse.evolve()
+    assert coarse.best_fitness == brute_force_best(coarse, points)
+    assert coarse.get_statistics()["evaluations"] == np.prod(points)
+
+    refined = GridRefineSolver(GAConfig(), constraints, GridConfig(coarse_points=points))
+    refined.evolve()
+    assert refined.refinements > 0
+    assert refined.best_fitness >= coarse.best_fitness
+
+
+@pytest.mark.parametrize("max_evaluations", [100, 5000, 40000])
+def test_max_evaluations(max_evaluations):
+    """评估次数不超过上限"""
+    solver = GridRefineSolver(GAConfig(), OptimizationConstraints(), GridConfig(chunk_size=1000))
+    params, fitness = solver.evolve(max_evaluations=max_evaluations)
+    stats = solver.get_statistics()
+    assert stats["evaluations"] <= max_evaluations
+    assert stats["stop_reason"] in ("max_evaluations", "converged")
+    assert params["speed"] > 0
+
+
+def test_deadline_stops_coarse_grid_between_chunks():
+    """截止时间已过时粗网格只评估第一块，不再细化，并在统计中给出停止原因"""
+    solver = GridRefineSolver(GAConfig(), OptimizationConstraints(), GridConfig(chunk_size=512))
+    params, fitness = solver.evolve(deadline_s=0.0)
+    stats = solver.get_statistics()
+    assert stats["stop_reason"] == "deadline"
+    assert stats["evaluations"] == stats["coarse_evaluations"] == 512
+    assert stats["refinements"] == 0
+    assert np.isfinite(fitness)
+
+
+def test_max_evaluations_truncates_coarse_grid():
+    """粗网格各轴已缩到最少点数仍超出评估次数上限时，按剩余次数截断并停止"""
+    grid_config = GridConfig(coarse_points=(2, 2, 2), chunk_size=3)
+    solver = GridRefineSolver(GAConfig(), OptimizationConstraints(), grid_config)
+    solver.evolve(max_evaluations=5)
+    stats = solver.get_statistics()
+    assert stats["stop_reason"] == "max_evaluations"
+    assert stats["evaluations"] == stats["coarse_evaluations"] == 5
+    assert stats["refinements"] == 0
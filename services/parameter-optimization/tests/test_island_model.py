@@ -0,0 +1,53 @@
+"""
+岛屿模型测试：评估预算与常驻工作进程
+"""
+import pytest
+
+from src.algorithms.island_model import IslandModelGA
+from src.algorithms.microbial_ga import GAConfig, OptimizationConstraints
+
+
+def island_config(**overrides) -> GAConfig:
+    """4 个岛屿、固定种子的配置"""
+    values = dict(
+        population_size=2048, n_islands=4, generations=60, migration_interval=10, seed=3,
+        early_stop_generations=1000, enable_parallel=False,
+    )
+    values.update(overrides)
+    return GAConfig(**values)
+
+
+@pytest.mark.parametrize("max_evaluations", [3000, 5000, 12000])
+def test_max_evaluations_limits_every_epoch(max_evaluations):
+    """评估次数不超过上限（包括第一个迁移周期），预算耗尽时停止"""
+    ga = IslandModelGA(island_config(), OptimizationConstraints())
+    ga.evolve(max_evaluations=max_evaluations)
+    stats = ga.get_statistics()
+    assert stats["evaluations"] <= max_evaluations
+    assert stats["stop_reason"] == "max_evaluations"
+    assert stats["generations"] < 60
+
+
+def test_initial_population_is_always_evaluated():
+    """预算小于初始种群时仍完成初始评估并返回解，不进化"""
+    ga = IslandModelGA(island_config(), OptimizationConstraints())
+    params, fitness = ga.evolve(max_evaluations=100)
+    stats = ga.get_statistics()
+    assert stats["evaluations"] == 2048
+    assert stats["generations"] == 0
+    assert stats["stop_reason"] == "max_evaluations"
+    assert params["speed"] > 0
+
+
+def test_worker_processes_match_serial_run():
+    """常驻工作进程中的岛屿与主进程串行运行结果相同"""
+    serial = IslandModelGA(island_config(generations=30), OptimizationConstraints())
+    serial_params, serial_fitness = serial.evolve()
+    parallel = IslandModelGA(island_config(generations=30, enable_parallel=True, n_workers=2), OptimizationConstraints())
+    parallel_params, parallel_fitness = parallel.evolve()
+
+    assert parallel.n_workers == 2
+    assert parallel_fitness == serial_fitness
+    assert parallel_params == serial_params
+    assert parallel.get_statistics()["evaluations"] == serial.get_statistics()["evaluations"]
+    assert parallel.migrations == serial.migrations == 3
@@ -0,0 +1,60 @@
+"""
+局部精修测试：模式搜索只接受改进，从可行解出发始终可行
+"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.algorithms.local_search import PatternSearch
+from src.algorithms.evaluator import get_evaluator_plan
+from src.algorithms.microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+from src.algorithms.genome import decode_parameters, encode_genes
+from src.config.constants import MachiningMethod
+
+
+def feasible_starts(plan, n: int, seed: int):
+    """低转速、低进给区域中随机抽取的 n 个可行起点"""
+    rng = np.random.default_rng(seed)
+    packed = encode_genes(
+        rng.integers(200, 2 ** 12, 4096), rng.integers(1, 2 ** 7, 4096), rng.integers(0, 2 ** 5, 4096)
+    )
+    speed, feed, cut_depth = decode_parameters(packed, plan.bounds)
+    feasible = plan.evaluate_parameters(speed, feed, cut_depth)["penalty"] == 0
+    return speed[feasible][:n], feed[feasible][:n], cut_depth[feasible][:n]
+
+
+@pytest.mark.parametrize("method", [MachiningMethod.MILLING, MachiningMethod.DRILLING, MachiningMethod.BORING])
+def test_pattern_search_improves_and_stays_feasible(method):
+    """精修结果不差于起点且多数严格改进，全部仍满足约束、不越出参数边界"""
+    plan = get_evaluator_plan(OptimizationConstraints(machining_method=method))
+    speed, feed, cut_depth = feasible_starts(plan, 16, 0)
+    assert len(speed) == 16
+    start_fitness = plan.evaluate_parameters(speed, feed, cut_depth)["fitness"]
+
+    search = PatternSearch(plan, plan.bounds)
+    values, fitness = search.run(speed, feed, cut_depth)
+    assert np.all(fitness >= start_fitness)
+    assert np.count_nonzero(fitness > start_fitness) >= 8
+
+    p = plan.evaluate_parameters(values[:, 0], values[:, 1], values[:, 2])
+    np.testing.assert_array_equal(p["fitness"], fitness)
+    assert np.all(p["penalty"] == 0)
+    for column, name in enumerate(("speed", "feed", "cut_depth")):
+        lo, hi = getattr(plan.bounds, name)
+        assert np.all((values[:, column] >= lo) & (values[:, column] <= hi))
+    assert search.evaluation_count <= 16 * (1 + 6 * search.iterations)
+
+
+def test_ga_polish_does_not_lose_fitness():
+    """开启局部精修后最优适应度不低于精修前，最优解仍可行"""
+    config = GAConfig(population_size=512, generations=20, seed=4, enable_parallel=False)
+    plain = MicrobialGeneticAlgorithm(config, OptimizationConstraints())
+    _, plain_fitness = plain.evolve()
+    polished = MicrobialGeneticAlgorithm(replace(config, polish=True), OptimizationConstraints())
+    params, polished_fitness = polished.evolve()
+
+    assert plain_fitness > 0
+    assert polished_fitness >= plain_fitness
+    p = polished.plan.evaluate_parameters(params["speed"], params["feed"], params["cut_depth"])
+    assert p["penalty"][0] == 0
@@ -0,0 +1,196 @@
+"""
+遗传算法测试：位打包与位矩阵基因组等价、脏个体增量评估、解码边界、自适应种群规模、检查点恢复
+"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.algorithms.microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints, decoding_bounds
+from src.algorithms.convergence import ConvergenceSnapshot
+from src.algorithms.genome import (
+    pack_population,
+    unpack_population,
+    encode_genes,
+    decode_genes,
+    decode_parameters,
+)
+from src.config.constants import MachiningMethod
+
+
+def small_config(**overrides) -> GAConfig:
+    """小种群、固定种子的配置（不早停，交叉/变异率固定）"""
+    values = dict(
+        population_size=256, generations=20, seed=7, adaptive_rate=False,
+        early_stop_generations=1000, enable_parallel=False,
+    )
+    values.update(overrides)
+    return GAConfig(**values)
+
+
+@pytest.mark.parametrize("method", [MachiningMethod.DRILLING, MachiningMethod.MILLING])
+@pytest.mark.parametrize("gray_code", [False, True])
+def test_packed_genome_matches_bit_matrix(method, gray_code):
+    """同一初始种群与随机数流下，位打包基因组逐代得到与位矩阵相同的种群与适应度"""
+    constraints = OptimizationConstraints(machining_method=method)
+    matrix_ga = MicrobialGeneticAlgorithm(small_config(gray_code=gray_code), constraints)
+    packed_ga = MicrobialGeneticAlgorithm(small_config(gray_code=gray_code, packed_genome=True), constraints)
+    size = len(matrix_ga.population)
+    packed_ga.attach_population(pack_population(matrix_ga.population), np.full(size, -np.inf))
+    matrix_ga.rng = np.random.default_rng(11)
+    packed_ga.rng = np.random.default_rng(11)
+
+    for _ in range(15):
+        matrix_fitness = matrix_ga._evaluate_population()
+        packed_fitness = packed_ga._evaluate_population()
+        np.testing.assert_array_equal(packed_fitness, matrix_fitness)
+        np.testing.assert_array_equal(packed_ga.population, pack_population(matrix_ga.population))
+        matrix_ga._generation_step(matrix_fitness)
+        packed_ga._generation_step(packed_fitness)
+    assert packed_ga.best_fitness == matrix_ga.best_fitness
+    assert packed_ga.evaluation_count == matrix_ga.evaluation_count
+
+
+@pytest.mark.parametrize("packed_genome", [False, True])
+def test_only_changed_individuals_are_reevaluated(packed_genome):
+    """一代之后只有被交叉/变异实际修改过的个体被标脏并重新评估，结果与整代重新评估相同"""
+    ga = MicrobialGeneticAlgorithm(small_config(packed_genome=packed_genome), OptimizationConstraints())
+    fitness = ga._evaluate_population().copy()
+    assert ga.evaluation_count == len(ga.population)
+    assert not np.any(ga.dirty)
+
+    before = ga.population.copy()
+    ga._generation_step(fitness)
+    changed = before != ga.population if packed_genome else np.any(before != ga.population, axis=1)
+    assert 0 < np.count_nonzero(changed) <= len(ga.population) // 2
+    np.testing.assert_array_equal(ga.dirty, changed)
+
+    fitness_after = ga._evaluate_population()
+    assert ga.evaluation_count == len(ga.population) + np.count_nonzero(changed)
+    np.testing.assert_array_equal(fitness_after[~changed], fitness[~changed])
+    np.testing.assert_array_equal(fitness_after, ga._parallel_evaluate(ga.population.copy()))
+
+
+@pytest.mark.parametrize("cut_depth_bound, expected", [
+    ((0.0, None), (0.0, 3.0)),
+    ((0.5, 2.0), (0.5, 2.0)),
+    ((0.0, 5.0), (0.0, 3.0)),
+    ((4.0, None), (3.0, 3.0)),
+])
+def test_cut_depth_bound_defaults_to_max_cut_depth(cut_depth_bound, expected):
+    """切深解码上限默认取约束中的最大切深，显式上限不超过最大切深"""
+    constraints = replace(OptimizationConstraints(), max_cut_depth=3.0)
+    config = GAConfig(cut_depth_bound=cut_depth_bound, speed_bound=(100, 5000), log_scale=True)
+    bounds = decoding_bounds(config, constraints)
+    assert bounds.cut_depth == expected
+    assert bounds.speed == (100.0, 5000.0)
+    assert bounds.feed == (0.1, 8000.0)
+
+
+def adaptive_ga(**overrides) -> MicrobialGeneticAlgorithm:
+    """自适应种群规模：初始 64 个个体，上限 256"""
+    values = dict(adaptive_population=True, initial_population_size=64, population_size=256)
+    values.update(overrides)
+    return MicrobialGeneticAlgorithm(small_config(**values), OptimizationConstraints())
+
+
+def snapshot(hamming_distance: float, elite_spread: float = 1.0) -> ConvergenceSnapshot:
+    """只含多样性指标的收敛快照"""
+    return ConvergenceSnapshot(generation=1, hamming_distance=hamming_distance, elite_spread=elite_spread)
+
+
+def test_should_grow():
+    """即将判定收敛时增长；多样性坍缩时仅在最优解不可行时增长；达到上限或未开启时不增长"""
+    ga = adaptive_ga()
+    plan = ga.plan
+    speed, feed, cut_depth = decode_parameters(ga.population, ga.bounds)
+    penalty = plan.evaluate_parameters(speed, feed, cut_depth)["penalty"]
+    ga.best_individual = ga.population[np.argmax(penalty)]
+    assert penalty.max() > 0
+
+    assert ga._should_grow(snapshot(0.3), "converged")
+    assert not ga._should_grow(snapshot(0.3), None)
+    assert ga._should_grow(snapshot(0.01), None)
+    assert ga._should_grow(snapshot(0.3, elite_spread=0.0), None)
+
+    low = encode_genes(np.arange(64, 4096, 64), np.full(63, 8), np.full(63, 4), layout=ga.bounds.layout)
+    feasible = plan.evaluate_parameters(*decode_parameters(low, ga.bounds))["penalty"] == 0
+    assert np.any(feasible)
+    ga.best_individual = unpack_population(low[feasible][:1], ga.dna_size)[0]
+    assert not ga._should_grow(snapshot(0.01), None)
+
+    assert not adaptive_ga(adaptive_population=False)._should_grow(snapshot(0.01), "converged")
+    full = adaptive_ga(initial_population_size=256)
+    assert not full._should_grow(snapshot(0.01), "converged")
+
+
+@pytest.mark.parametrize("packed_genome", [False, True])
+def test_grow_population(packed_genome):
+    """按 population_growth 倍增长到上限，原有个体与适应度保留，新个体按拉丁超立方抽样且待评估"""
+    ga = adaptive_ga(packed_genome=packed_genome)
+    fitness = ga._evaluate_population().copy()
+    before = ga.population.copy()
+
+    ga.generations_run = 7
+    ga._grow_population()
+    assert len(ga.population) == len(ga.fitness) == len(ga.dirty) == 128
+    np.testing.assert_array_equal(ga.population[:64], before)
+    np.testing.assert_array_equal(ga.fitness[:64], fitness)
+    assert not np.any(ga.dirty[:64]) and np.all(ga.dirty[64:])
+    assert np.all(np.isneginf(ga.fitness[64:]))
+    assert ga.population_history == [(7, 128)]
+
+    # 拉丁超立方：每个基因的 64 个新取值分别落在 64 个等宽分层中
+    for genes, bits in zip(decode_genes(ga.population[64:], ga.bounds.layout), ga.config.gene_bits):
+        np.testing.assert_array_equal(np.sort(genes * 64 // 2 ** bits), np.arange(64))
+
+    ga._evaluate_population()
+    assert ga.evaluation_count == 128
+    ga._grow_population()
+    ga._grow_population()
+    assert len(ga.population) == 256
+    assert [size for _, size in ga.population_history] == [128, 256, 256]
+
+
+def test_adaptive_population_grows_during_evolve():
+    """小种群即将判定收敛时增长而不是停止，增长到上限后才按收敛停止"""
+    ga = adaptive_ga(generations=200, convergence_window=5, improvement_tol=1.0, min_diversity=0.6)
+    ga.evolve()
+    stats = ga.get_statistics()
+    assert stats["population_size"] == 256
+    assert [size for _, size in ga.population_history] == [128, 256]
+    assert stats["stop_reason"] == "converged"
+
+
+@pytest.mark.parametrize("packed_genome", [False, True])
+def test_resume_from_checkpoint_is_deterministic(tmp_path, packed_genome):
+    """从中间检查点恢复后继续进化，与不中断的运行结果完全相同"""
+    config = small_config(packed_genome=packed_genome, checkpoint_dir=str(tmp_path / "run"), checkpoint_interval=5)
+    constraints = OptimizationConstraints()
+    ga = MicrobialGeneticAlgorithm(config, constraints)
+    params, fitness = ga.evolve()
+    assert ga.generations_run == config.generations
+
+    # 默认保留最近两个检查点：第 15 代与第 20 代
+    resumed = MicrobialGeneticAlgorithm.resume(str(tmp_path / "run" / "gen-000015"))
+    assert resumed.generations_run == 15
+    resumed_params, resumed_fitness = resumed.evolve()
+
+    assert resumed_fitness == fitness
+    assert resumed_params == params
+    assert resumed.evaluation_count == ga.evaluation_count
+    np.testing.assert_array_equal(np.asarray(resumed.population), np.asarray(ga.population))
+    np.testing.assert_array_equal(np.asarray(resumed.fitness), np.asarray(ga.fitness))
+
+
+def test_checkpoint_resume_keeps_configuration(tmp_path):
+    """恢复时沿用检查点中的配置与约束"""
+    config = small_config(generations=5, gene_bits=(12, 10, 6), gray_code=True, checkpoint_dir=str(tmp_path))
+    constraints = replace(OptimizationConstraints(), max_power=4.0)
+    MicrobialGeneticAlgorithm(config, constraints).evolve()
+
+    resumed = MicrobialGeneticAlgorithm.resume(str(tmp_path))
+    assert resumed.config.gene_bits == (12, 10, 6)
+    assert resumed.config.gray_code
+    assert resumed.constraints.max_power == 4.0
+    assert resumed.dna_size == 28
@@ -0,0 +1,65 @@
+"""
+NSGA-II 测试：非支配排序、拥挤距离、约束支配排序与 Pareto 前沿输出
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.nsga2 import NSGA2, dominance_matrix, non_dominated_sort, crowding_distance
+from src.algorithms.microbial_ga import GAConfig, OptimizationConstraints
+from src.algorithms.objectives import objective_matrix
+from src.config.constants import MachiningMethod
+
+
+# 两个目标都越大越好：A、B、C 互不支配；D、H、F 各被 B 支配；E 被 D 支配
+POINTS = np.array([
+    [4.0, 1.0],  # A
+    [3.0, 3.0],  # B
+    [1.0, 4.0],  # C
+    [2.0, 2.0],  # D
+    [1.0, 1.0],  # E
+    [3.0, 1.0],  # F
+    [2.5, 1.5],  # H
+])
+
+
+def test_non_dominated_sort_known_fronts():
+    """手工验证的前沿序号；相同的解互不支配"""
+    np.testing.assert_array_equal(non_dominated_sort(POINTS), [0, 0, 0, 1, 2, 1, 1])
+    np.testing.assert_array_equal(non_dominated_sort(np.array([[1.0, 1.0], [1.0, 1.0]])), [0, 0])
+    assert not dominance_matrix(np.array([[1.0, 1.0], [1.0, 1.0]])).any()
+
+
+def test_crowding_distance_known_values():
+    """前沿两端为无穷大，内部解为相邻解目标差与前沿跨度之比的和"""
+    distance = crowding_distance(POINTS, non_dominated_sort(POINTS))
+    assert distance[1] == pytest.approx(2.0)   # B：两个目标各 (4 - 1) / 3
+    assert distance[6] == pytest.approx(2.0)   # H：两个目标各 (3 - 2) / 1 与 (2 - 1) / 1
+    assert np.all(np.isinf(distance[[0, 2, 3, 4, 5]]))
+
+
+def test_rank_puts_feasible_before_infeasible():
+    """不可行解排在所有可行前沿之后（即使目标值更好），按惩罚值从小到大各自成层，拥挤距离为 0"""
+    objectives = np.concatenate([POINTS, [[10.0, 10.0], [0.0, 0.0]]])
+    penalty = np.concatenate([np.zeros(len(POINTS)), [2.0, 1.0]])
+    optimizer = NSGA2(GAConfig(), OptimizationConstraints())
+    ranks, crowding = optimizer._rank(objectives, penalty)
+
+    np.testing.assert_array_equal(ranks, [0, 0, 0, 1, 2, 1, 1, 4, 3])
+    np.testing.assert_array_equal(crowding[-2:], 0.0)
+    np.testing.assert_array_equal(crowding[:-2], crowding_distance(POINTS, ranks[:-2]))
+
+
+@pytest.mark.parametrize("method", [MachiningMethod.MILLING, MachiningMethod.BORING])
+def test_pareto_front_is_feasible_and_non_dominated(method):
+    """get_pareto_front() 只返回可行、互不支配的解"""
+    constraints = OptimizationConstraints(machining_method=method)
+    optimizer = NSGA2(GAConfig(seed=3, generations=40), constraints)
+    optimizer.evolve()
+    front = optimizer.get_pareto_front()
+    assert len(front) > 1
+    assert optimizer.get_statistics()["pareto_size"] == len(front)
+
+    values = {name: np.array([solution[name] for solution in front]) for name in front[0]}
+    p = optimizer.plan.evaluate_parameters(values["speed"], values["feed"], values["cut_depth"])
+    assert np.all(p["penalty"] == 0)
+    assert not dominance_matrix(objective_matrix(values, optimizer.objective_names)).any()
@@ -0,0 +1,77 @@
+"""
+目标函数测试：向量化目标注册表与标量目标函数一致、多目标矩阵
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.objectives import (
+    OBJECTIVES,
+    PARETO_OBJECTIVES,
+    ObjectiveFunction,
+    ObjectiveType,
+    get_array_objective,
+    objective_matrix,
+    register_objective,
+)
+from src.algorithms.evaluator import get_evaluator_plan
+from src.algorithms.genome import decode_parameters
+from src.algorithms.microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+
+
+@pytest.fixture(scope="module")
+def params():
+    """一批加工参数数组（由评估计划计算）"""
+    plan = get_evaluator_plan(OptimizationConstraints())
+    rng = np.random.default_rng(0)
+    return plan.evaluate_parameters(rng.uniform(100, 1500, 50), rng.uniform(10, 400, 50), rng.uniform(0.1, 3, 50))
+
+
+def test_every_objective_type_is_registered():
+    """每种目标类型都有对应的向量化目标函数"""
+    assert set(OBJECTIVES) == {objective.value for objective in ObjectiveType}
+
+
+@pytest.mark.parametrize("name", [objective.value for objective in ObjectiveType])
+def test_array_objective_matches_scalar_function(params, name):
+    """向量化目标对每个解的取值与按字典计算的标量目标函数相同"""
+    values = get_array_objective(name)(params)
+    scalar = ObjectiveFunction.get_objective_function(name)
+    expected = [scalar({key: float(column[i]) for key, column in params.items()}) for i in range(len(values))]
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+
+def test_unknown_objective_is_rejected():
+    """未注册的目标名称报错"""
+    with pytest.raises(ValueError, match="未知的优化目标"):
+        get_array_objective("minimize_noise")
+    with pytest.raises(ValueError, match="未知的优化目标"):
+        MicrobialGeneticAlgorithm(GAConfig(objective="minimize_noise"), OptimizationConstraints())
+
+
+def test_registered_objective_is_used_by_ga():
+    """注册的目标函数可按名称被遗传算法选用，适应度 = 目标值 - 1e29 × 惩罚"""
+    name = "test_minimize_power"
+    objective = register_objective(name)(lambda p: -p["power"])
+    try:
+        ga = MicrobialGeneticAlgorithm(
+            GAConfig(objective=name, population_size=256, seed=1, enable_parallel=False), OptimizationConstraints()
+        )
+        assert ga.objective_func is objective
+        fitness = ga._evaluate_population()
+        p = ga.plan.evaluate_parameters(*decode_parameters(ga.population, ga.bounds))
+        np.testing.assert_allclose(fitness, -p["power"] - 1e29 * p["penalty"], rtol=1e-12)
+    finally:
+        del OBJECTIVES[name]
+
+
+def test_objective_matrix_applies_directions(params):
+    """多目标矩阵按方向变换为越大越好，列顺序与目标名称一致"""
+    names = ("material_removal_rate", "power", "bottom_roughness", "tool_life")
+    matrix = objective_matrix(params, names)
+    assert matrix.shape == (50, 4)
+    for column, name in enumerate(names):
+        np.testing.assert_array_equal(matrix[:, column], PARETO_OBJECTIVES[name] * params[name])
+    assert PARETO_OBJECTIVES["power"] == -1.0 and PARETO_OBJECTIVES["tool_life"] == 1.0
+
+    with pytest.raises(ValueError, match="未知的优化目标"):
+        objective_matrix(params, ("material_removal_rate", "noise"))
@@ -0,0 +1,74 @@
+"""
+约束修复测试：修复后的个体满足线速度、每齿进给与功率/扭矩约束
+
+钻孔/镗孔的功率修复按 P ∝ f^(1-mc) 近似缩小进给，这里对修复结果实际计算加工参数来验证可行性，
+不假定修复一定成功。
+"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.algorithms.microbial_ga import OptimizationConstraints
+from src.algorithms.evaluator import get_evaluator_plan
+from src.algorithms.repair import ConstraintRepair
+from src.algorithms.genome import decode_genes, decode_parameters, random_packed_population, unpack_population
+from src.config.constants import MachiningMethod
+
+
+CONSTRAINTS = [
+    OptimizationConstraints(machining_method=MachiningMethod.MILLING),
+    replace(OptimizationConstraints(machining_method=MachiningMethod.MILLING), max_power=1.0, max_torque=2.0),
+    OptimizationConstraints(machining_method=MachiningMethod.DRILLING),
+    replace(OptimizationConstraints(machining_method=MachiningMethod.DRILLING), max_power=2.0, max_torque=5.0),
+    OptimizationConstraints(machining_method=MachiningMethod.BORING),
+    replace(OptimizationConstraints(machining_method=MachiningMethod.BORING), max_power=0.5, max_torque=1.0),
+]
+
+
+def constraint_id(c: OptimizationConstraints) -> str:
+    return f"{c.machining_method}-P{c.max_power:g}-T{c.max_torque:g}"
+
+
+@pytest.mark.parametrize("constraints", CONSTRAINTS, ids=constraint_id)
+def test_repaired_individuals_meet_limits(constraints):
+    """修复后全部个体的线速度、每齿进给、功率与扭矩不超过约束"""
+    plan = get_evaluator_plan(constraints)
+    repair = ConstraintRepair(plan)
+    population = random_packed_population(20000, plan.bounds.layout.total_bits, np.random.default_rng(0))
+    repaired_population, repaired = repair.repair(population)
+    assert np.any(repaired)
+
+    p = plan.evaluate_parameters(*decode_parameters(repaired_population, plan.bounds))
+    assert np.all(p["cutting_speed"] <= constraints.max_cutting_speed)
+    assert np.all(p["feed_per_tooth"] <= constraints.max_feed_per_tooth)
+    over = (p["power"] > constraints.max_power) | (p["torque"] > constraints.max_torque)
+    if constraints.machining_method == MachiningMethod.MILLING:
+        assert not np.any(over)
+    else:
+        # 仅在极低转速下、进给已降到下限仍超出扭矩上限的个体无法修复
+        _, feed_genes, _ = decode_genes(repaired_population, plan.bounds.layout)
+        assert np.all(feed_genes[over] == 0)
+        assert np.count_nonzero(over) < 0.01 * len(population)
+
+    counts = repair.get_counts()
+    assert counts["cutting_speed"] > 0 and counts["feed_per_tooth"] > 0
+    if constraints.max_power < OptimizationConstraints.max_power:
+        assert counts["power"] + counts["torque"] > 0
+
+
+@pytest.mark.parametrize("constraints", CONSTRAINTS[:2], ids=constraint_id)
+def test_repair_only_lowers_genes(constraints):
+    """修复只降低基因值，未修复的个体保持不变；位矩阵与位打包表示结果一致"""
+    plan = get_evaluator_plan(constraints)
+    layout = plan.bounds.layout
+    population = random_packed_population(5000, layout.total_bits, np.random.default_rng(1))
+    repaired_population, repaired = ConstraintRepair(plan).repair(population)
+
+    np.testing.assert_array_equal(repaired_population[~repaired], population[~repaired])
+    for before, after in zip(decode_genes(population, layout), decode_genes(repaired_population, layout)):
+        assert np.all(after <= before)
+
+    matrix, matrix_repaired = ConstraintRepair(plan).repair(unpack_population(population, layout.total_bits))
+    np.testing.assert_array_equal(matrix_repaired, repaired)
+    np.testing.assert_array_equal(matrix, unpack_population(repaired_population, layout.total_bits))
@@ -0,0 +1,136 @@
+"""
+热启动测试：历史最优解查询、种子个体生成与岛屿分配、热启动早停
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.algorithms.microbial_ga import MicrobialGeneticAlgorithm, GAConfig, OptimizationConstraints
+from src.algorithms.island_model import IslandModelGA
+from src.algorithms.genome import decode_parameters
+from src.api.routes import optimization as route
+from src.api.schemas.optimization import OptimizationRequest
+
+
+def record(material: int, speed, feed, cut_depth=1.0, machine: int = 3):
+    """历史优化结果记录（只含热启动用到的字段）"""
+    return SimpleNamespace(ci_liao_id=material, s=speed, f=feed, ap=cut_depth, machine_id=machine)
+
+
+@pytest.fixture
+def history(monkeypatch):
+    """用内存中的记录替换历史优化结果仓储，返回 (记录列表, 查询参数列表)"""
+    records, queries = [], []
+
+    class FakeRepository:
+        def __init__(self, db):
+            pass
+
+        def get_by_input_ids(self, *args):
+            queries.append(args)
+            return records
+
+    monkeypatch.setattr(route, "OptimizationResultRepository", FakeRepository)
+    return records, queries
+
+
+def request(material_id: str = "P15", tool_id: str = "7", machine_id: str = "3", strategy_id: str = "2"):
+    """优化请求（只填 ID）"""
+    return OptimizationRequest(
+        material_id=material_id, tool_id=tool_id, machine_id=machine_id, strategy_id=strategy_id
+    )
+
+
+def test_historical_optima_prefers_same_material_group(history):
+    """同一材料组编号优先（同一设备优先、由新到旧），其次相邻编号；更远的编号与不完整的记录不使用"""
+    records, queries = history
+    records.extend([  # 由新到旧
+        record(16, 1600.0, 160.0),
+        record(15, 1500.0, 150.0, machine=9),
+        record(17, 1700.0, 170.0),
+        record(15, 1510.0, 151.0),
+        record(14, 1400.0, 140.0, cut_depth=None),
+        record(15, None, 152.0),
+        record(15, 1510.0, 151.0),
+    ])
+    optima = route._historical_optima(None, request())
+    assert queries == [(None, 7, None, 2)]
+    assert optima == [
+        (1510.0, 151.0, 1.0),
+        (1500.0, 150.0, 1.0),
+        (1600.0, 160.0, 1.0),
+        (1400.0, 140.0, 0.0),
+    ]
+
+
+def test_historical_optima_neighbour_fallback(history):
+    """没有同一编号的记录时使用 ±1 的相邻编号，最多 WARM_START_LIMIT 个"""
+    records, _ = history
+    records.extend(record(11 + i % 2 * 2, 1000.0 + i, 100.0) for i in range(20))
+    optima = route._historical_optima(None, request(material_id="K12"))
+    assert len(optima) == route.WARM_START_LIMIT
+    assert [speed for speed, _, _ in optima] == [1000.0 + i for i in range(route.WARM_START_LIMIT)]
+    assert route._historical_optima(None, request(material_id="K20")) == []
+
+
+@pytest.mark.parametrize("overrides", [{"tool_id": "T-7"}, {"strategy_id": "abc"}, {"material_id": "steel"}])
+def test_historical_optima_requires_numeric_ids(history, overrides):
+    """ID 不能映射到历史记录时不查询"""
+    _, queries = history
+    assert route._historical_optima(None, request(**overrides)) == []
+    assert queries == []
+
+
+def warm_config(**overrides) -> GAConfig:
+    """两个历史解（第二个超出转速、进给与切深边界），热启动个体占初始种群的 1/4"""
+    values = dict(
+        population_size=256, seed=5, enable_parallel=False, speed_bound=(0, 5000), feed_bound=(0, 2000),
+        warm_start=((1200.0, 300.0, 1.5), (20000.0, 9000.0, 10.0)), warm_start_fraction=0.25,
+    )
+    values.update(overrides)
+    return GAConfig(**values)
+
+
+@pytest.mark.parametrize("packed_genome", [False, True])
+def test_warm_start_individuals_are_clipped_to_bounds(packed_genome):
+    """历史解原样编码（取最近的基因），超出当前边界的历史解截断到边界，邻居也不越界"""
+    ga = MicrobialGeneticAlgorithm(warm_config(packed_genome=packed_genome), OptimizationConstraints())
+    speed, feed, cut_depth = decode_parameters(ga.population[:64], ga.bounds)
+    assert speed[0] == pytest.approx(1200.0, abs=0.1)
+    assert feed[0] == pytest.approx(300.0, abs=0.2)
+    assert cut_depth[0] == pytest.approx(1.5, abs=0.03)
+    assert (speed[1], feed[1], cut_depth[1]) == (5000.0, 2000.0, ga.bounds.cut_depth[1])
+    assert np.all(speed <= 5000.0) and np.all(feed <= 2000.0) and np.all(cut_depth <= ga.bounds.cut_depth[1])
+
+    # 其余邻居交替围绕两个历史解：第一个历史解的邻居转速集中在 1200 附近
+    assert np.all(np.abs(speed[2:64:2] - 1200.0) < 0.1 * 5000)
+
+
+def test_warm_start_patience():
+    """热启动时最优适应度无改进的最大代数取 warm_start_patience"""
+    assert MicrobialGeneticAlgorithm(warm_config(), OptimizationConstraints()).monitor.patience == 10
+    cold = MicrobialGeneticAlgorithm(warm_config(warm_start=()), OptimizationConstraints())
+    assert cold.monitor.patience == cold.config.early_stop_generations
+
+    config = warm_config(warm_start_patience=5, generations=200, min_diversity=0.0, elite_spread_tol=0.0)
+    ga = MicrobialGeneticAlgorithm(config, OptimizationConstraints())
+    ga.evolve()
+    assert ga.stop_reason == "early_stop"
+    assert ga.generations_run < 200
+
+
+def test_island_model_spreads_seeds_across_islands():
+    """初始种群按行轮流分配到各岛屿，每个岛屿都分到热启动个体"""
+    config = warm_config(population_size=1024, n_islands=4)
+    model = IslandModelGA(config, OptimizationConstraints())
+    populations = model._initial_populations()
+    assert populations.shape[:2] == (4, 256)
+
+    n_seeded = int(1024 * config.warm_start_fraction)
+    for island in range(4):
+        np.testing.assert_array_equal(populations[island], model.ga.population[island::4])
+        # 第 k 个热启动个体围绕第 k % 2 个历史解：偶数岛屿分到 1200 r/min 附近的个体，奇数岛屿分到截断到 5000 的个体
+        speed, _, _ = decode_parameters(populations[island, :n_seeded // 4], model.ga.bounds)
+        center = 1200.0 if island % 2 == 0 else 5000.0
+        assert np.all(np.abs(speed - center) < 0.1 * 5000)